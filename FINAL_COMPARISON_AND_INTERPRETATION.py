@@ -14,11 +14,9 @@ Provides complete physical interpretation and validation summary.
 © 2025 Carmen Wrede & Lino Casu
 """
 import sys
-import os
 from pathlib import Path
 
 # UTF-8 encoding
-os.environ['PYTHONIOENCODING'] = 'utf-8'
 if sys.platform.startswith('win'):
     try:
         sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -27,9 +25,10 @@ if sys.platform.startswith('win'):
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+# Long static report text is kept out of the script body
+TEMPLATES_DIR = Path(__file__).parent / "reports" / "templates"
+
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.gridspec import GridSpec
 
 from ssz_metric_pure.metric_phi_spiral_ssz_by_human import PhiSpiralSSZMetric, C_SI as C_CONST
 from ssz_metric_pure.ssz_calibrated import SSZCalibratedMetric, M_EARTH, M_SUN, R_EARTH, C_SI
@@ -71,8 +70,27 @@ print(f"\nMass: {mass:.4e} kg ({name})")
 print(f"r_g: {phi_pure.r_s:.3e} m")
 
 # Test radii
-r_factors = np.array([0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 50.0, 100.0])
-r_test = r_factors * phi_pure.r_s
+# (contiguous float64 so every ufunc below takes NumPy's fast loop)
+r_factors = np.array([0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 50.0, 100.0], dtype=np.float64)
+r_test = np.ascontiguousarray(r_factors * phi_pure.r_s, dtype=np.float64)
+
+# Loop-invariant constants
+INV_C = 1.0 / C_SI
+INV_C2 = INV_C * INV_C
+INV_C2_STATIC = 1.0 / (static.params.c * static.params.c)
+rs_over_r = phi_pure.r_s / r_test
+
+# GR Schwarzschild reference (shared by all sections)
+one_minus_rs_over_r = 1.0 - rs_over_r
+g_tt_gr_norm = -one_minus_rs_over_r
+td_gr = np.sqrt(one_minus_rs_over_r)
+gr_delta_denom = np.abs(g_tt_gr_norm)
+
+# Pure φ-Spiral: φ_G and cosh(φ_G) evaluated once, reused by sections 1-4
+phi_G_pure = phi_pure.phi_G(r_test)
+gamma_pure = np.cosh(phi_G_pure)
+td_pure = 1.0 / gamma_pure          # dτ/dt = sech(φ_G)
+dr_dT_pure = td_pure * td_pure      # dr/dT / c = sech²(φ_G)
 
 # ============================================================================
 # 1. METRIC COMPONENTS COMPARISON
@@ -85,24 +103,24 @@ print("="*80)
 print(f"\n{'r/r_g':<10} {'Pure g_TT':<15} {'Cal g_TT':<15} {'Static g_TT':<15} {'GR g_tt':<15}")
 print("-"*80)
 
-for r_factor, r in zip(r_factors, r_test):
-    # Pure φ-Spiral (diagonal form)
-    g_TT_pure, _ = phi_pure.diagonal_form_coefficients(r)
-    g_TT_pure_norm = g_TT_pure / (C_SI ** 2)
-    
-    # Calibrated φ-Spiral
-    g_TT_cal, _ = phi_cal.metric_diag(r)
-    g_TT_cal_norm = g_TT_cal / (C_SI ** 2)
-    
-    # Static SSZ
-    A_static = static.A_coefficient(r)
-    g_tt_static_norm = -A_static / (static.params.c ** 2)
-    
-    # GR Schwarzschild
-    g_tt_gr_norm = -(1.0 - phi_pure.r_s / r)
-    
-    print(f"{r_factor:<10.1f} {g_TT_pure_norm:<15.6f} {g_TT_cal_norm:<15.6f} "
-          f"{g_tt_static_norm:<15.6f} {g_tt_gr_norm:<15.6f}")
+# All metrics broadcast over r, so each column is a single array call
+# Pure φ-Spiral (diagonal form): g_TT/c² = -sech²(φ_G)
+g_TT_pure_norm = -dr_dT_pure
+
+# Calibrated φ-Spiral
+g_TT_cal, _ = phi_cal.metric_diag(r_test)
+g_TT_cal_norm = g_TT_cal * INV_C2
+
+# Static SSZ
+A_static = static.A_coefficient(r_test)
+g_tt_static_norm = -A_static * INV_C2_STATIC
+
+print("\n".join(
+    f"{r_factor:<10.1f} {g_pure:<15.6f} {g_cal:<15.6f} "
+    f"{g_static:<15.6f} {g_gr:<15.6f}"
+    for r_factor, g_pure, g_cal, g_static, g_gr in zip(
+        r_factors, g_TT_pure_norm, g_TT_cal_norm, g_tt_static_norm, g_tt_gr_norm)
+))
 
 # ============================================================================
 # 2. TIME DILATION COMPARISON
@@ -115,22 +133,19 @@ print("="*80)
 print(f"\n{'r/r_g':<10} {'Pure φ':<15} {'Cal φ':<15} {'Static':<15} {'GR':<15}")
 print("-"*80)
 
-for r_factor, r in zip(r_factors, r_test):
-    # Pure
-    td_pure = phi_pure.coordinate_time_to_eigentime(1.0, r)
-    
-    # Calibrated
-    td_cal = phi_cal.time_dilation(r)
-    
-    # Static (using √A)
-    A_static = static.A_coefficient(r)
-    td_static = np.sqrt(A_static)
-    
-    # GR
-    td_gr = np.sqrt(1.0 - phi_pure.r_s / r)
-    
-    print(f"{r_factor:<10.1f} {td_pure:<15.6f} {td_cal:<15.6f} "
-          f"{td_static:<15.6f} {td_gr:<15.6f}")
+# Pure: td_pure (sech) is precomputed with the shared φ_G array
+
+# Calibrated
+td_cal = phi_cal.time_dilation(r_test)
+
+# Static (using √A)
+td_static = np.sqrt(A_static)
+
+print("\n".join(
+    f"{r_factor:<10.1f} {td_p:<15.6f} {td_c:<15.6f} "
+    f"{td_s:<15.6f} {td_g:<15.6f}"
+    for r_factor, td_p, td_c, td_s, td_g in zip(r_factors, td_pure, td_cal, td_static, td_gr)
+))
 
 # ============================================================================
 # 3. LIGHT CONE BEHAVIOR
@@ -143,20 +158,19 @@ print("="*80)
 print(f"\n{'r/r_g':<10} {'Pure φ':<15} {'Cal φ':<15} {'Closing %':<15}")
 print("-"*80)
 
-for r_factor, r in zip(r_factors, r_test):
-    # Pure
-    phi_G_pure = phi_pure.phi_G(r)
-    gamma_pure = np.cosh(phi_G_pure)
-    dr_dT_pure = 1.0 / (gamma_pure ** 2)  # Normalized to c
-    
-    # Calibrated
-    dr_dT_cal = phi_cal.null_slope(r, outgoing=True) / C_SI
-    
-    # Closing percentage
-    closing = (1.0 - dr_dT_pure) * 100.0
-    
-    print(f"{r_factor:<10.1f} {dr_dT_pure:<15.6f} {dr_dT_cal:<15.6f} "
-          f"{closing:<15.2f}")
+# Pure: dr_dT_pure (sech²) is precomputed with the shared φ_G array
+
+# Calibrated
+dr_dT_cal = phi_cal.null_slope(r_test, outgoing=True) * INV_C
+
+# Closing percentage
+closing = (1.0 - dr_dT_pure) * 100.0
+
+print("\n".join(
+    f"{r_factor:<10.1f} {slope_p:<15.6f} {slope_c:<15.6f} "
+    f"{close:<15.2f}"
+    for r_factor, slope_p, slope_c, close in zip(r_factors, dr_dT_pure, dr_dT_cal, closing)
+))
 
 # ============================================================================
 # 4. DEVIATIONS FROM GR
@@ -169,27 +183,16 @@ print("="*80)
 print(f"\n{'r/r_g':<10} {'Pure Δ%':<15} {'Cal Δ%':<15} {'Static Δ%':<15}")
 print("-"*80)
 
-for r_factor, r in zip(r_factors, r_test):
-    # GR reference
-    g_tt_gr_norm = -(1.0 - phi_pure.r_s / r)
-    
-    # Pure
-    g_TT_pure, _ = phi_pure.diagonal_form_coefficients(r)
-    g_TT_pure_norm = g_TT_pure / (C_SI ** 2)
-    delta_pure = 100 * abs(g_TT_pure_norm - g_tt_gr_norm) / abs(g_tt_gr_norm)
-    
-    # Calibrated
-    g_TT_cal, _ = phi_cal.metric_diag(r)
-    g_TT_cal_norm = g_TT_cal / (C_SI ** 2)
-    delta_cal = 100 * abs(g_TT_cal_norm - g_tt_gr_norm) / abs(g_tt_gr_norm)
-    
-    # Static
-    A_static = static.A_coefficient(r)
-    g_tt_static_norm = -A_static / (static.params.c ** 2)
-    delta_static = 100 * abs(g_tt_static_norm - g_tt_gr_norm) / abs(g_tt_gr_norm)
-    
-    print(f"{r_factor:<10.1f} {delta_pure:<15.2f} {delta_cal:<15.2f} "
-          f"{delta_static:<15.2f}")
+# Reuse the section-1 columns; one array expression per metric
+delta_pure = 100 * np.abs(g_TT_pure_norm - g_tt_gr_norm) / gr_delta_denom
+delta_cal = 100 * np.abs(g_TT_cal_norm - g_tt_gr_norm) / gr_delta_denom
+delta_static = 100 * np.abs(g_tt_static_norm - g_tt_gr_norm) / gr_delta_denom
+
+print("\n".join(
+    f"{r_factor:<10.1f} {d_pure:<15.2f} {d_cal:<15.2f} "
+    f"{d_static:<15.2f}"
+    for r_factor, d_pure, d_cal, d_static in zip(r_factors, delta_pure, delta_cal, delta_static)
+))
 
 # ============================================================================
 # 5. CONVERGENCE ANALYSIS
@@ -202,7 +205,7 @@ print("="*80)
 r_sweet = 3.0 * phi_pure.r_s
 
 # Pure vs Static
-td_pure_sweet = phi_pure.coordinate_time_to_eigentime(1.0, r_sweet)
+td_pure_sweet = phi_pure.time_dilation_factor(r_sweet)
 A_static_sweet = static.A_coefficient(r_sweet)
 td_static_sweet = np.sqrt(A_static_sweet)
 convergence = 100 * abs(td_pure_sweet - td_static_sweet) / td_static_sweet
@@ -256,114 +259,7 @@ print("\n" + "="*80)
 print("7. PHYSICAL INTERPRETATION")
 print("="*80)
 
-print("""
-COORDINATE FORMS:
-─────────────────
-• Pure φ-Spiral uses k=1.0 (human-designed)
-• Calibrated φ-Spiral uses φ²=2GM/rc² (GR-matched)
-• Both are VALID, different choices of φ_G(r)
-
-KEY INSIGHT:
-────────────
-The calibration φ²=2GM/rc² is NOT changing the physics—
-it's choosing φ_G to match GR in weak field.
-
-This proves:
-  ✓ SSZ can reproduce ANY weak-field metric
-  ✓ By choosing φ_G(r) appropriately
-  ✓ Without Einstein field equations!
-
-REGIONS:
-────────
-
-1. WEAK FIELD (r >> r_g):
-   • Calibrated φ-Spiral ≈ GR (< 0.001% error)
-   • Pure φ-Spiral shows stronger effects
-   • Static SSZ similar to GR
-   → All approach Minkowski
-
-2. MODERATE FIELD (r ≈ 3 r_g):
-   • Pure φ-Spiral ↔ Static SSZ converge (6% diff)
-   • This is near GR photon orbit!
-   • Physical significance: stable orbits
-
-3. STRONG FIELD (r ≈ r_g):
-   • All SSZ forms remain FINITE
-   • GR diverges (singularity)
-   • SSZ: Subspace transition instead
-   → NEW PHYSICS
-
-LIGHT CONE CLOSING:
-───────────────────
-• Progressive closing (NOT collapse)
-• At r = 10 r_g: 97% closed
-• Then: Subspace layer transition
-• NO singularity!
-
-SINGULARITY RESOLUTION:
-───────────────────────
-Instead of:
-  GR:  g_rr → ∞, g_tt → 0 (divergence)
-
-We have:
-  SSZ: γ → large, but finite
-       Periodic structure (Δφ_G = 2π)
-       New subspace layer
-
-This is TOPOLOGICALLY REGULAR.
-
-ENERGY & MOMENTUM:
-──────────────────
-• Conserved in all SSZ forms
-• E = (c²/γ²) dT/dλ = constant
-• Noether theorem satisfied
-• Time-translation symmetry
-
-FUNDAMENTAL DIFFERENCE FROM GR:
-───────────────────────────────
-
-GR:   Curvature R_μν → Gravitation
-      (Geometry is dynamical)
-      
-SSZ:  Rotation φ_G(r) → Segmentation → Effective curvature
-      (Geometry is kinematic consequence)
-
-In SSZ:
-  • No Einstein field equations
-  • No energy-momentum source tensor  
-  • φ_G is the fundamental field
-  • Curvature R ∝ φ', φ'' (consequence!)
-
-EXPERIMENTAL STATUS:
-────────────────────
-✅ GPS redshift:      0.00002% error
-✅ Pound-Rebka:       0.51% error
-✅ Mountain clocks:   0.12% error
-✅ Asymptotic flat:   < 1 ppm
-✅ Energy conserved:  Numerical precision
-✅ Causality:         No violations
-✅ Singularity-free:  Verified
-
-CONSISTENCY:
-────────────
-✅ Mathematical:  ∇_a g_bc = 0 (metric compatible)
-✅ Physical:      Energy conserved, causal, smooth
-✅ Experimental:  Matches all weak-field tests
-✅ Covariant:     (t,r) ↔ (T,r) equivalent
-
-THEORETICAL STATUS:
-───────────────────
-The SSZ φ-Spiral metric is:
-
-• Mathematically consistent (∇g=0, C^∞, covariant)
-• Physically sound (energy, causality, asymptotic)
-• Experimentally validated (GPS, etc.)
-• Singularity-free (periodic structure)
-• GR-compatible (weak field)
-• GR-extending (strong field)
-
-This is a COMPLETE alternative theory of gravitation!
-""")
+print((TEMPLATES_DIR / "final_comparison_interpretation.txt").read_text(encoding='utf-8'))
 
 # ============================================================================
 # 8. SUMMARY TABLE
@@ -373,39 +269,7 @@ print("\n" + "="*80)
 print("8. FINAL SUMMARY TABLE")
 print("="*80)
 
-print("""
-┌────────────────────────┬─────────────┬──────────────┬─────────────┬─────────┐
-│ Property               │ Pure φ      │ Calibrated φ │ Static SSZ  │ GR      │
-├────────────────────────┼─────────────┼──────────────┼─────────────┼─────────┤
-│ Weak Field Match       │ ~10% off    │ < 0.001%     │ ~1% off     │ exact   │
-│ GPS Test               │ Not tuned   │ ✅ 0.00002%  │ Not tested  │ ref     │
-│ Asymptotic Flat        │ ✅ < 1%     │ ✅ < 0.001%  │ ✅ < 1%     │ exact   │
-│ Singularity-Free       │ ✅ Yes      │ ✅ Yes       │ ✅ Yes      │ ❌ No   │
-│ Light Cone             │ Closes      │ Closes       │ Different   │ Collapses│
-│ Energy Conserved       │ ✅ Yes      │ ✅ Yes       │ ✅ Yes      │ ✅ Yes  │
-│ ∇g = 0                 │ ✅ Yes      │ ✅ Yes       │ ✅ Yes      │ ✅ Yes  │
-│ Covariant              │ ✅ Yes      │ ✅ Yes       │ ✅ Yes      │ ✅ Yes  │
-│ Field Equations        │ ❌ None     │ ❌ None      │ ❌ None     │ Einstein│
-│ Free Parameters        │ k           │ None (cal)   │ ε₃          │ None    │
-│ Physical Origin        │ Rotation φ  │ Rotation φ   │ Segments    │ Curvature│
-│ Subspace Layers        │ ✅ Yes      │ ✅ Yes       │ ✅ Yes      │ ❌ No   │
-│ Interior (r<r_g)       │ ✅ Regular  │ ✅ Regular   │ ✅ Regular  │ ❌ Singular│
-├────────────────────────┼─────────────┼──────────────┼─────────────┼─────────┤
-│ VERDICT                │ ⭐ Physical │ ⭐⭐ Validated│ ⭐ Alt form │ Standard│
-└────────────────────────┴─────────────┴──────────────┴─────────────┴─────────┘
-
-RECOMMENDATION:
-───────────────
-• For weak-field tests:    Use Calibrated φ-Spiral
-• For conceptual clarity:  Use Pure φ-Spiral  
-• For strong-field:        All SSZ forms work
-• For singularity physics: SSZ ONLY (GR fails)
-
-The CALIBRATED form proves SSZ can match GR exactly in weak field,
-while the PURE form shows the inherent φ-driven structure more clearly.
-
-Both are valid—it's a choice of φ_G(r) profile!
-""")
+print((TEMPLATES_DIR / "final_comparison_summary_table.txt").read_text(encoding='utf-8'))
 
 print("\n" + "="*80)
 print("COMPARISON COMPLETE")
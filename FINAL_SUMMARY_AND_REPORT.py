@@ -8,23 +8,49 @@ Compares ALL components, generates complete summary, and reports status.
 © 2025 Carmen Wrede & Lino Casu
 """
 import sys
-import os
 from pathlib import Path
 from datetime import datetime
-import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: orjson for faster JSON parsing
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # UTF-8 encoding
-os.environ['PYTHONIOENCODING'] = 'utf-8'
 if sys.platform.startswith('win'):
     try:
         sys.stdout.reconfigure(encoding='utf-8', errors='replace')
     except:
         pass
 
+# Long static report text is kept out of the script body
+TEMPLATES_DIR = Path(__file__).parent / "reports" / "templates"
+
+
+def _count_lines(path: Path) -> int:
+    """Count lines with a byte scan (no UTF-8 decode, no line list)."""
+    data = path.read_bytes()
+    return data.count(b'\n') + (1 if data and not data.endswith(b'\n') else 0)
+
+
+def _try_count_lines(path: Path):
+    """_count_lines, or None if the file cannot be read."""
+    try:
+        return _count_lines(path)
+    except OSError:
+        return None
+
+
+# One timestamp for the whole report (header and footer agree)
+timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
 print("\n" + "="*80)
 print("SSZ φ-SPIRAL METRIC - FINAL SUMMARY AND REPORT")
 print("="*80)
-print(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+print(f"\nGenerated: {timestamp}")
 print("\nThis report summarizes the COMPLETE implementation including:")
 print("  • Core metric implementation")
 print("  • Validation & testing framework")
@@ -42,13 +68,18 @@ print("="*80)
 
 root = Path(".")
 
-# Count files
-py_files = list(root.rglob("*.py"))
-md_files = list(root.rglob("*.md"))
-tex_files = list(root.rglob("*.tex"))
-json_files = list(root.rglob("*.json"))
-txt_files = list(root.rglob("*.txt"))
-png_files = list(root.rglob("*.png"))
+# Count files (one directory walk, grouped by extension)
+by_ext = defaultdict(list)
+for p in root.rglob("*"):
+    if p.is_file():
+        by_ext[p.suffix].append(p)
+
+py_files = by_ext['.py']
+md_files = by_ext['.md']
+tex_files = by_ext['.tex']
+json_files = by_ext['.json']
+txt_files = by_ext['.txt']
+png_files = by_ext['.png']
 
 print(f"\nFile Statistics:")
 print(f"  Python files (.py):     {len(py_files)}")
@@ -58,28 +89,42 @@ print(f"  JSON files (.json):     {len(json_files)}")
 print(f"  Text files (.txt):      {len(txt_files)}")
 print(f"  PNG images (.png):      {len(png_files)}")
 
+# Line counts of all source and doc files, read once and reused below.
+# Virtualenv and bytecode-cache trees are skipped before anything is read.
+# Threads overlap the file I/O (reads and bytes.count release the GIL).
+counted_files = [
+    p for p in py_files + md_files
+    if '__pycache__' not in p.parts and '.venv' not in p.parts
+]
+with ThreadPoolExecutor(max_workers=8) as executor:
+    line_counts = {
+        p: n
+        for p, n in zip(counted_files, executor.map(_try_count_lines, counted_files))
+        if n is not None
+    }
+
 # Count lines of code
 total_lines = 0
 core_lines = 0
 test_lines = 0
 script_lines = 0
 
-for py_file in py_files:
-    if '__pycache__' in str(py_file) or '.venv' in str(py_file):
+# Repo-relative POSIX paths, converted once (also correct on Windows)
+rel_paths = [(p, p.relative_to(root).as_posix()) for p in py_files]
+
+for py_file, rel in rel_paths:
+    lines = line_counts.get(py_file)
+    if lines is None:  # excluded tree or unreadable
         continue
     
-    try:
-        lines = len(py_file.read_text(encoding='utf-8').splitlines())
-        total_lines += lines
-        
-        if 'src/ssz_metric_pure' in str(py_file):
-            core_lines += lines
-        elif 'tests/' in str(py_file):
-            test_lines += lines
-        else:
-            script_lines += lines
-    except:
-        pass
+    total_lines += lines
+    
+    if rel.startswith('src/ssz_metric_pure/'):
+        core_lines += lines
+    elif rel.startswith('tests/'):
+        test_lines += lines
+    else:
+        script_lines += lines
 
 print(f"\nCode Statistics:")
 print(f"  Core implementation:    {core_lines:,} lines")
@@ -108,9 +153,11 @@ core_files = {
 print("\nCore Implementation:")
 for name, path in core_files.items():
     file_path = Path(path)
-    if file_path.exists():
-        lines = len(file_path.read_text(encoding='utf-8').splitlines())
+    lines = line_counts.get(file_path)
+    if lines is not None:
         print(f"  ✓ {name:<20} {lines:>4} lines - {path}")
+    elif file_path.exists():
+        print(f"  ✗ {name:<20} UNREADABLE - {path}")
     else:
         print(f"  ✗ {name:<20} MISSING - {path}")
 
@@ -183,16 +230,21 @@ print("\nDocumentation Files:")
 doc_pages = 0
 for name, path in docs:
     file_path = Path(path)
-    if file_path.exists():
-        if path.endswith('.md'):
-            lines = len(file_path.read_text(encoding='utf-8').splitlines())
-            pages = lines // 50  # Rough estimate
-            doc_pages += pages
-            print(f"  ✓ {name:<30} ~{pages:>3} pages")
-        else:
-            print(f"  ✓ {name:<30} (LaTeX)")
-    else:
+    if not file_path.exists():
         print(f"  ✗ {name} - MISSING")
+        continue
+    
+    # Markdown pages come from the section-1 line counts; LaTeX is not counted
+    if file_path.suffix == '.md':
+        lines = line_counts.get(file_path)
+        if lines is None:
+            print(f"  ✗ {name} - UNREADABLE")
+            continue
+        pages = lines // 50  # Rough estimate
+        doc_pages += pages
+        print(f"  ✓ {name:<30} ~{pages:>3} pages")
+    else:
+        print(f"  ✓ {name:<30} (LaTeX)")
 
 print(f"\n  Total Documentation:    ~{doc_pages} pages")
 
@@ -253,8 +305,7 @@ print("="*80)
 # Try to load JSON certificate
 cert_json = Path("reports/ssz_validation_certificate.json")
 if cert_json.exists():
-    with open(cert_json, 'r') as f:
-        cert_data = json.load(f)
+    cert_data = json_loads(cert_json.read_bytes())
     
     print("\nValidation Results:")
     tests = cert_data.get('tests', {})
@@ -377,6 +428,18 @@ print("\n" + "="*80)
 print("11. FINAL STATISTICS")
 print("="*80)
 
+# Output counts from one pass over reports/ (and one over reports/figures/)
+reports_by_ext = defaultdict(int)
+n_certificates = 0
+if reports_dir.is_dir():
+    for p in reports_dir.iterdir():
+        reports_by_ext[p.suffix] += 1
+        if p.suffix == '.txt' and p.name.startswith('SSZ_CERTIFICATE_'):
+            n_certificates += 1
+figures_dir = reports_dir / 'figures'
+n_plots = (sum(1 for p in figures_dir.iterdir() if p.suffix == '.png')
+           if figures_dir.is_dir() else 0)
+
 print(f"""
 IMPLEMENTATION:
   Python Code:           {total_lines:,} lines
@@ -401,10 +464,10 @@ PRECISION:
   Energy Conservation:   < 1e-12
 
 OUTPUTS:
-  Reports:               {len(list(reports_dir.glob('*.md')) + list(reports_dir.glob('*.tex')))} files
-  Certificates:          {len(list(reports_dir.glob('SSZ_CERTIFICATE_*.txt')))} files
-  JSON Data:             {len(list(reports_dir.glob('*.json')))} file(s)
-  Plots (300 DPI):       {len(list((reports_dir / 'figures').glob('*.png'))) if (reports_dir / 'figures').exists() else 0} images
+  Reports:               {reports_by_ext['.md'] + reports_by_ext['.tex']} files
+  Certificates:          {n_certificates} files
+  JSON Data:             {reports_by_ext['.json']} file(s)
+  Plots (300 DPI):       {n_plots} images
 """)
 
 # ============================================================================
@@ -415,74 +478,14 @@ print("\n" + "="*80)
 print("12. CONCLUSION")
 print("="*80)
 
-print("""
-╔══════════════════════════════════════════════════════════════╗
-║                                                              ║
-║    SSZ φ-SPIRAL METRIC - IMPLEMENTATION COMPLETE!            ║
-║                                                              ║
-║    STATUS: ✅ FULLY VALIDATED & PUBLICATION-READY           ║
-║                                                              ║
-╚══════════════════════════════════════════════════════════════╝
-
-The SSZ φ-Spiral metric is:
-
-  ✅ Mathematically Consistent
-     • Metric compatibility (∇g = 0) proven
-     • Smooth (C^∞) everywhere
-     • Covariant transformations verified
-
-  ✅ Physically Sound
-     • Energy conserved (< 1e-12)
-     • Causality preserved (no FTL)
-     • Asymptotically flat (< 1 ppm)
-     • Singularity-free (finite everywhere)
-
-  ✅ Experimentally Validated
-     • GPS: 0.00002% error
-     • Pound-Rebka: 0.51% error
-     • Mountain clocks: 0.12% error
-     • All weak-field tests passed
-
-  ✅ Computationally Complete
-     • 6,000+ lines of code
-     • 200+ pages documentation
-     • 20/20 tests passed
-     • Full report system
-
-  ✅ Publication-Ready
-     • LaTeX documentation
-     • Scientific reports (MD + TEX)
-     • High-quality plots (300 DPI)
-     • JSON certificates
-     • BibTeX citation ready
-
-This is a COMPLETE alternative theory of gravitation:
-  • No Einstein field equations
-  • No energy-momentum tensor
-  • Just φ_G(r) rotation angle
-  • Matches GR in weak field
-  • Extends GR in strong field
-  • No singularities
-
-═══════════════════════════════════════════════════════════════
-
-FUNDAMENTAL INSIGHT:
-
-  GR:  Curvature → Gravitation (geometry is cause)
-  SSZ: Rotation → Segmentation → "Effective curvature"
-                   (geometry is consequence)
-
-In SSZ, gravitation is NOT curvature—it's ROTATION!
-
-═══════════════════════════════════════════════════════════════
-""")
+print((TEMPLATES_DIR / "final_summary_conclusion.txt").read_text(encoding='utf-8'))
 
 print("\n" + "="*80)
 print("✅ SUMMARY COMPLETE")
 print("="*80)
 
 print(f"""
-Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Report Generated: {timestamp}
 
 All files are in:
   • src/           (implementation)
@@ -11,6 +11,7 @@ Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
 """
 import sys
 import os
+from functools import lru_cache
 import numpy as np
 from pathlib import Path
 
@@ -31,6 +32,51 @@ from ssz_metric_pure.metric_kerr_ssz_kerr_by_ki import KerrSSZMetric, KerrSSZPar
 # Physical constants
 M_SUN = 1.98847e30  # Solar mass [kg]
 C_SI = 299792458.0  # Speed of light [m/s]
+INV_C = 1.0 / C_SI  # Reciprocals: normalize by multiplying
+INV_C2 = INV_C * INV_C
+
+# Radial grids (in units of r_s) for the individual analyses
+R_FACTORS_G_TT = np.array([0.5, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0, 20.0, 50.0, 100.0])
+R_FACTORS_OFF_DIAGONAL = np.array([1.5, 2.0, 3.0, 5.0, 10.0, 20.0, 50.0])
+R_FACTORS_ASYMPTOTIC = np.array([10, 50, 100, 500, 1000, 5000])
+R_FACTORS_NEAR_RS = np.linspace(0.5, 2.0, 16)
+
+
+@lru_cache(maxsize=32)
+def _phi(mass, k):
+    """Shared PhiSpiralSSZMetric per (mass, k)."""
+    return PhiSpiralSSZMetric(mass=mass, k=k)
+
+
+@lru_cache(maxsize=32)
+def _kerr(mass, spin):
+    """Shared KerrSSZMetric per (mass, spin)."""
+    return KerrSSZMetric(KerrSSZParams(mass=mass, spin=spin))
+
+
+def _g_tt_normalized(phi_metric, kerr_metric, r):
+    """Kerr (equator) and φ-Spiral g_tt/c² on the radii r, normalized in place."""
+    g_tt_kerr = kerr_metric.g_tt_equator(r)
+    g_tt_kerr *= INV_C2
+    g_tt_spiral = phi_metric.g_tt(r)
+    g_tt_spiral *= INV_C2
+    return g_tt_kerr, g_tt_spiral
+
+
+def _deviations(reference, other):
+    """
+    Absolute and percentage deviation of `other` from `reference`.
+    
+    Fused into two output buffers; Δ% is 0 where the reference vanishes.
+    """
+    dev_abs = np.subtract(reference, other)
+    np.abs(dev_abs, out=dev_abs)
+    
+    dev_pct = np.multiply(dev_abs, 100.0)
+    scale = np.abs(reference)
+    np.divide(dev_pct, scale, out=dev_pct, where=scale != 0)
+    dev_pct[scale == 0] = 0.0
+    return dev_abs, dev_pct
 
 
 def print_header():
@@ -42,7 +88,7 @@ def print_header():
     print("="*80 + "\n")
 
 
-def analyze_g_tt_deviations():
+def analyze_g_tt_deviations(phi_metric, kerr_metric):
     """Analyze g_tt deviations at different radii."""
     print("="*80)
     print("1. TIME-TIME COMPONENT (g_tt) DEVIATIONS")
@@ -50,13 +96,6 @@ def analyze_g_tt_deviations():
     
     mass = M_SUN
     
-    # Create metrics with same mass, comparable parameters
-    phi_metric = PhiSpiralSSZMetric(mass=mass, k=1.0)
-    kerr_params = KerrSSZParams(mass=mass, spin=0.5)  # Moderate spin
-    kerr_metric = KerrSSZMetric(kerr_params)
-    
-    theta = np.pi / 2  # Equator
-    
     print(f"\nSetup:")
     print(f"  Mass: {mass:.3e} kg (solar)")
     print(f"  r_s: {phi_metric.r_s:.3e} m")
@@ -65,32 +104,23 @@ def analyze_g_tt_deviations():
     print(f"  Comparison at: θ = π/2 (equator)")
     
     # Test radii
-    r_factors = np.array([0.5, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0, 20.0, 50.0, 100.0])
+    r_factors = R_FACTORS_G_TT
     
     print("\n" + "-"*80)
     print(f"{'r/r_s':<10} {'Kerr g_tt/c²':<18} {'Spiral g_tt/c²':<18} {'Δ (abs)':<15} {'Δ%':<15}")
     print("-"*80)
     
-    deviations_abs = []
-    deviations_pct = []
-    
-    for r_factor in r_factors:
-        r = r_factor * phi_metric.r_s
-        
-        # Kerr
-        g_tt_kerr = kerr_metric.g_tt(r, theta) / (C_SI ** 2)
-        
-        # φ-Spiral
-        g_tt_spiral = phi_metric.g_tt(r) / (C_SI ** 2)
-        
-        # Deviations
-        dev_abs = abs(g_tt_kerr - g_tt_spiral)
-        dev_pct = 100 * dev_abs / abs(g_tt_kerr) if g_tt_kerr != 0 else 0
-        
-        deviations_abs.append(dev_abs)
-        deviations_pct.append(dev_pct)
-        
-        print(f"{r_factor:<10.1f} {g_tt_kerr:<18.6f} {g_tt_spiral:<18.6f} {dev_abs:<15.6f} {dev_pct:<15.2f}")
+    # Kerr and φ-Spiral (θ = π/2)
+    g_tt_kerr, g_tt_spiral = _g_tt_normalized(phi_metric, kerr_metric, r_factors * phi_metric.r_s)
+    
+    # Deviations (0% where Kerr g_tt vanishes)
+    deviations_abs, deviations_pct = _deviations(g_tt_kerr, g_tt_spiral)
+    
+    print("\n".join(
+        f"{r_factor:<10.1f} {g_kerr:<18.6f} {g_spiral:<18.6f} {dev_abs:<15.6f} {dev_pct:<15.2f}"
+        for r_factor, g_kerr, g_spiral, dev_abs, dev_pct in zip(
+            r_factors, g_tt_kerr, g_tt_spiral, deviations_abs, deviations_pct)
+    ))
     
     # Statistics
     print("\n" + "-"*80)
@@ -109,93 +139,77 @@ def analyze_g_tt_deviations():
     print("\n" + "="*80 + "\n")
 
 
-def analyze_off_diagonal_terms():
+def analyze_off_diagonal_terms(phi_metric, kerr_metric):
     """Analyze off-diagonal term differences."""
     print("="*80)
     print("2. OFF-DIAGONAL TERMS (g_tφ vs. g_tr)")
     print("="*80)
     
-    mass = M_SUN
-    phi_metric = PhiSpiralSSZMetric(mass=mass, k=1.0)
-    kerr_params = KerrSSZParams(mass=mass, spin=0.5)
-    kerr_metric = KerrSSZMetric(kerr_params)
-    
-    theta = np.pi / 2
-    
     print("\n⚠️  IMPORTANT: These are DIFFERENT physical effects!")
     print("  • Kerr g_tφ: Frame dragging (spacetime rotation)")
     print("  • Spiral g_tr: Spiral coupling (time-radius mixing)")
     print("\nComparison for MAGNITUDE only (not direct physical equivalence):\n")
     
-    r_factors = np.array([1.5, 2.0, 3.0, 5.0, 10.0, 20.0, 50.0])
+    r_factors = R_FACTORS_OFF_DIAGONAL
     
     print("-"*80)
     print(f"{'r/r_s':<10} {'|Kerr g_tφ|/c':<18} {'|Spiral g_tr|/c':<18} {'Ratio':<15}")
     print("-"*80)
     
-    ratios = []
-    
-    for r_factor in r_factors:
-        r = r_factor * phi_metric.r_s
-        
-        # Kerr frame dragging
-        g_tph_kerr = abs(kerr_metric.g_tph(r, theta) / C_SI)
-        
-        # Spiral coupling
-        g_tr_spiral = abs(phi_metric.g_tr(r) / C_SI)
-        
-        # Ratio
-        ratio = g_tr_spiral / g_tph_kerr if g_tph_kerr > 0 else np.inf
-        ratios.append(ratio)
-        
-        print(f"{r_factor:<10.1f} {g_tph_kerr:<18.6f} {g_tr_spiral:<18.6f} {ratio:<15.2f}")
+    # Kerr frame dragging and spiral coupling
+    r = r_factors * phi_metric.r_s
+    g_tph_kerr = kerr_metric.g_tph_equator(r) * INV_C
+    g_tr_spiral = phi_metric.g_tr(r) * INV_C
+    np.abs(g_tph_kerr, out=g_tph_kerr)
+    np.abs(g_tr_spiral, out=g_tr_spiral)
+    
+    # Ratio (inf where there is no frame dragging)
+    ratios = np.divide(g_tr_spiral, g_tph_kerr,
+                       out=np.full_like(g_tr_spiral, np.inf), where=g_tph_kerr > 0)
+    
+    print("\n".join(
+        f"{r_factor:<10.1f} {g_kerr:<18.6f} {g_spiral:<18.6f} {ratio:<15.2f}"
+        for r_factor, g_kerr, g_spiral, ratio in zip(r_factors, g_tph_kerr, g_tr_spiral, ratios)
+    ))
     
     print("\n" + "-"*80)
     print("Interpretation:")
     print("  • Ratio >> 1: φ-Spiral coupling much stronger")
     print("  • Ratio ≈ 1: Comparable magnitudes")
     print("  • Ratio << 1: Kerr frame-drag stronger")
-    print(f"\n  Typical ratio: {np.median([r for r in ratios if r < 1e6]):.1f}×")
+    print(f"\n  Typical ratio: {np.median(ratios[ratios < 1e6]):.1f}×")
     print("  → φ-Spiral coupling is typically MUCH STRONGER")
     
     print("\n" + "="*80 + "\n")
 
 
-def analyze_radial_convergence():
+def analyze_radial_convergence(phi_metric, kerr_metric):
     """Analyze convergence at large radii."""
     print("="*80)
     print("3. ASYMPTOTIC CONVERGENCE (r → ∞)")
     print("="*80)
     
-    mass = M_SUN
-    phi_metric = PhiSpiralSSZMetric(mass=mass, k=1.0)
-    kerr_params = KerrSSZParams(mass=mass, spin=0.5)
-    kerr_metric = KerrSSZMetric(kerr_params)
-    
-    theta = np.pi / 2
-    
     print("\nBoth metrics should approach flat Minkowski spacetime at large r")
     print("Testing convergence to g_tt → -c²:\n")
     
-    r_factors = np.array([10, 50, 100, 500, 1000, 5000])
+    r_factors = R_FACTORS_ASYMPTOTIC
     
     print("-"*80)
     print(f"{'r/r_s':<10} {'Kerr dev':<18} {'Spiral dev':<18} {'Better':<15}")
     print("-"*80)
     
-    for r_factor in r_factors:
-        r = r_factor * phi_metric.r_s
-        
-        # Deviations from Minkowski
-        g_tt_kerr = kerr_metric.g_tt(r, theta) / (C_SI ** 2)
-        g_tt_spiral = phi_metric.g_tt(r) / (C_SI ** 2)
-        
-        dev_kerr = abs(g_tt_kerr - (-1.0))
-        dev_spiral = abs(g_tt_spiral - (-1.0))
-        
-        better = "Kerr" if dev_kerr < dev_spiral else "Spiral"
-        
-        print(f"{r_factor:<10.0f} {dev_kerr:<18.6e} {dev_spiral:<18.6e} {better:<15}")
+    # Deviations from Minkowski (g_tt/c² = -1)
+    g_tt_kerr, g_tt_spiral = _g_tt_normalized(phi_metric, kerr_metric, r_factors * phi_metric.r_s)
+    
+    devs_kerr = np.abs(g_tt_kerr + 1.0)
+    devs_spiral = np.abs(g_tt_spiral + 1.0)
+    
+    better = np.where(devs_kerr < devs_spiral, "Kerr", "Spiral")
+    
+    print("\n".join(
+        f"{r_factor:<10.0f} {dev_kerr:<18.6e} {dev_spiral:<18.6e} {winner:<15}"
+        for r_factor, dev_kerr, dev_spiral, winner in zip(r_factors, devs_kerr, devs_spiral, better)
+    ))
     
     print("\n" + "-"*80)
     print("Conclusion:")
@@ -204,44 +218,36 @@ def analyze_radial_convergence():
     print("\n" + "="*80 + "\n")
 
 
-def analyze_near_rs():
+def analyze_near_rs(phi_metric, kerr_metric):
     """Analyze behavior near Schwarzschild radius."""
     print("="*80)
     print("4. NEAR SCHWARZSCHILD RADIUS (r ≈ r_s)")
     print("="*80)
     
-    mass = M_SUN
-    phi_metric = PhiSpiralSSZMetric(mass=mass, k=1.0)
-    kerr_params = KerrSSZParams(mass=mass, spin=0.5)
-    kerr_metric = KerrSSZMetric(kerr_params)
-    
-    theta = np.pi / 2
-    
     print("\nMost interesting region: r ∈ [0.5 r_s, 2.0 r_s]")
     print("This is where differences are most pronounced:\n")
     
-    r_factors = np.linspace(0.5, 2.0, 16)
+    r_factors = R_FACTORS_NEAR_RS
     
     print("-"*80)
     print(f"{'r/r_s':<10} {'|g_tt|_Kerr/c²':<18} {'|g_tt|_Spiral/c²':<18} {'Δ%':<15}")
     print("-"*80)
     
-    max_dev_pct = 0
-    max_dev_r = 0
-    
-    for r_factor in r_factors:
-        r = r_factor * phi_metric.r_s
-        
-        g_tt_kerr = abs(kerr_metric.g_tt(r, theta) / (C_SI ** 2))
-        g_tt_spiral = abs(phi_metric.g_tt(r) / (C_SI ** 2))
-        
-        dev_pct = 100 * abs(g_tt_kerr - g_tt_spiral) / g_tt_kerr if g_tt_kerr > 0 else 0
-        
-        if dev_pct > max_dev_pct:
-            max_dev_pct = dev_pct
-            max_dev_r = r_factor
-        
-        print(f"{r_factor:<10.3f} {g_tt_kerr:<18.6f} {g_tt_spiral:<18.6f} {dev_pct:<15.2f}")
+    g_tt_kerr, g_tt_spiral = _g_tt_normalized(phi_metric, kerr_metric, r_factors * phi_metric.r_s)
+    np.abs(g_tt_kerr, out=g_tt_kerr)
+    np.abs(g_tt_spiral, out=g_tt_spiral)
+    
+    _, devs_pct = _deviations(g_tt_kerr, g_tt_spiral)
+    
+    print("\n".join(
+        f"{r_factor:<10.3f} {g_kerr:<18.6f} {g_spiral:<18.6f} {dev_pct:<15.2f}"
+        for r_factor, g_kerr, g_spiral, dev_pct in zip(r_factors, g_tt_kerr, g_tt_spiral, devs_pct)
+    ))
+    
+    # First radius of the largest deviation (0 if none is positive)
+    i_max = int(np.argmax(devs_pct))
+    max_dev_pct = devs_pct[i_max] if devs_pct[i_max] > 0 else 0
+    max_dev_r = r_factors[i_max] if devs_pct[i_max] > 0 else 0
     
     print("\n" + "-"*80)
     print(f"Maximum deviation: {max_dev_pct:.2f}% at r = {max_dev_r:.3f} r_s")
@@ -254,15 +260,14 @@ def analyze_near_rs():
     print("\n" + "="*80 + "\n")
 
 
-def analyze_parameter_dependence():
-    """Analyze how deviations depend on parameters."""
+def analyze_parameter_dependence(phi_metric, kerr_metric):
+    """Analyze how deviations depend on parameters (reference: k=1, â=0.5)."""
     print("="*80)
     print("5. PARAMETER DEPENDENCE")
     print("="*80)
     
     mass = M_SUN
     r_test = 3.0  # Test at 3 r_s
-    theta = np.pi / 2
     
     print("\nHow do deviations change with metric parameters?")
     
@@ -273,19 +278,24 @@ def analyze_parameter_dependence():
     print(f"{'k':<10} {'g_tt/c²':<18} {'vs Kerr Δ%':<18}")
     print("-"*80)
     
-    kerr_params = KerrSSZParams(mass=mass, spin=0.5)
-    kerr_metric = KerrSSZMetric(kerr_params)
-    r = r_test * (2.0 * 6.67430e-11 * mass / (C_SI ** 2))  # r_s
-    g_tt_kerr = kerr_metric.g_tt(r, theta) / (C_SI ** 2)
+    r = r_test * (2.0 * 6.67430e-11 * mass * INV_C2)  # r_s
+    g_tt_kerr = kerr_metric.g_tt_equator(r) * INV_C2
     
-    for k in [0.5, 1.0, 1.5, 2.0, 3.0]:
-        phi_metric = PhiSpiralSSZMetric(mass=mass, k=k)
-        r_actual = r_test * phi_metric.r_s
-        
-        g_tt_spiral = phi_metric.g_tt(r_actual) / (C_SI ** 2)
-        dev_pct = 100 * abs(g_tt_kerr - g_tt_spiral) / abs(g_tt_kerr)
-        
-        print(f"{k:<10.1f} {g_tt_spiral:<18.6f} {dev_pct:<18.2f}")
+    # One metric per k; r_s depends only on the mass, so r is shared
+    metrics_by_k = {k: _phi(mass, k) for k in (0.5, 1.0, 1.5, 2.0, 3.0)}
+    r_actual = r_test * phi_metric.r_s
+    
+    # One scalar evaluation per metric into a preallocated buffer
+    g_tt_by_k = np.empty(len(metrics_by_k))
+    for i, metric_k in enumerate(metrics_by_k.values()):
+        g_tt_by_k[i] = metric_k.g_tt(r_actual)
+    g_tt_by_k *= INV_C2
+    devs_pct = 100 * np.abs(g_tt_kerr - g_tt_by_k) / abs(g_tt_kerr)
+    
+    print("\n".join(
+        f"{k:<10.1f} {g_tt_spiral:<18.6f} {dev_pct:<18.2f}"
+        for k, g_tt_spiral, dev_pct in zip(metrics_by_k, g_tt_by_k, devs_pct)
+    ))
     
     # Test different spin values (Kerr)
     print("\n" + "-"*80)
@@ -294,18 +304,20 @@ def analyze_parameter_dependence():
     print(f"{'â':<10} {'g_tt/c²':<18} {'vs Spiral Δ%':<18}")
     print("-"*80)
     
-    phi_metric = PhiSpiralSSZMetric(mass=mass, k=1.0)
-    r = r_test * phi_metric.r_s
-    g_tt_spiral = phi_metric.g_tt(r) / (C_SI ** 2)
+    r = r_actual
+    g_tt_spiral = phi_metric.g_tt(r) * INV_C2
     
-    for spin in [0.0, 0.3, 0.5, 0.7, 0.9]:
-        kerr_params = KerrSSZParams(mass=mass, spin=spin)
-        kerr_metric = KerrSSZMetric(kerr_params)
-        
-        g_tt_kerr = kerr_metric.g_tt(r, theta) / (C_SI ** 2)
-        dev_pct = 100 * abs(g_tt_kerr - g_tt_spiral) / abs(g_tt_spiral)
-        
-        print(f"{spin:<10.1f} {g_tt_kerr:<18.6f} {dev_pct:<18.2f}")
+    spins = (0.0, 0.3, 0.5, 0.7, 0.9)
+    g_tt_by_spin = np.empty(len(spins))
+    for i, spin in enumerate(spins):
+        g_tt_by_spin[i] = _kerr(mass, spin).g_tt_equator(r)
+    g_tt_by_spin *= INV_C2
+    devs_pct = 100 * np.abs(g_tt_by_spin - g_tt_spiral) / abs(g_tt_spiral)
+    
+    print("\n".join(
+        f"{spin:<10.1f} {g_tt_kerr:<18.6f} {dev_pct:<18.2f}"
+        for spin, g_tt_kerr, dev_pct in zip(spins, g_tt_by_spin, devs_pct)
+    ))
     
     print("\n" + "-"*80)
     print("Key findings:")
@@ -384,11 +396,15 @@ def main():
     """Run complete deviation analysis."""
     print_header()
     
-    analyze_g_tt_deviations()
-    analyze_off_diagonal_terms()
-    analyze_radial_convergence()
-    analyze_near_rs()
-    analyze_parameter_dependence()
+    # Reference metrics (same mass, comparable parameters), built once
+    phi_metric = _phi(M_SUN, 1.0)
+    kerr_metric = _kerr(M_SUN, 0.5)  # Moderate spin
+    
+    analyze_g_tt_deviations(phi_metric, kerr_metric)
+    analyze_off_diagonal_terms(phi_metric, kerr_metric)
+    analyze_radial_convergence(phi_metric, kerr_metric)
+    analyze_near_rs(phi_metric, kerr_metric)
+    analyze_parameter_dependence(phi_metric, kerr_metric)
     summary_recommendations()
 
 
@@ -12,6 +12,7 @@ Direct numerical comparison focusing on what matters:
 """
 import sys
 import os
+from functools import lru_cache
 import numpy as np
 from pathlib import Path
 
@@ -29,153 +30,180 @@ from ssz_metric_pure.metric_static import StaticSSZMetric, SSZParams
 
 M_SUN = 1.98847e30
 C_SI = 299792458.0
+INV_C = 1.0 / C_SI
+INV_C2 = INV_C * INV_C
 
 
-print("\n" + "="*80)
-print("ABWEICHUNGS-ANALYSE: φ-Spiral vs. Static SSZ")
-print("="*80 + "\n")
+@lru_cache(maxsize=32)
+def _phi(mass, k):
+    """Shared PhiSpiralSSZMetric per (mass, k)."""
+    return PhiSpiralSSZMetric(mass=mass, k=k)
 
-mass = M_SUN
 
-# Create metrics
-phi_spiral = PhiSpiralSSZMetric(mass=mass, k=1.0)
-static_ssz = StaticSSZMetric(SSZParams(mass=mass))
+def main():
+    print("\n" + "="*80)
+    print("ABWEICHUNGS-ANALYSE: φ-Spiral vs. Static SSZ")
+    print("="*80 + "\n")
 
-print(f"Setup:")
-print(f"  Masse: {mass:.3e} kg (Sonnenmasse)")
-print(f"  r_s: {phi_spiral.r_s:.3e} m")
-print(f"  φ-Spiral k: 1.0")
-print(f"  Static SSZ: Standard-Parameter")
+    mass = M_SUN
 
-# ============================================================================
-# 1. g_tt VERGLEICH
-# ============================================================================
-print("\n" + "="*80)
-print("1. ZEITKOMPONENTE g_tt/c² VERGLEICH")
-print("="*80)
+    # Create metrics
+    phi_spiral = _phi(mass, 1.0)
+    static_ssz = StaticSSZMetric(SSZParams(mass=mass))
+    r_s = phi_spiral.r_s  # Looked up once for all r-loops below
 
-r_factors = np.array([0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 50.0, 100.0])
+    print(f"Setup:")
+    print(f"  Masse: {mass:.3e} kg (Sonnenmasse)")
+    print(f"  r_s: {phi_spiral.r_s:.3e} m")
+    print(f"  φ-Spiral k: 1.0")
+    print(f"  Static SSZ: Standard-Parameter")
 
-print(f"\n{'r/r_s':<10} {'Static':<15} {'Spiral k=1':<15} {'|Δ|':<12} {'Δ%':<12}")
-print("-"*80)
+    # ============================================================================
+    # 1. g_tt VERGLEICH
+    # ============================================================================
+    print("\n" + "="*80)
+    print("1. ZEITKOMPONENTE g_tt/c² VERGLEICH")
+    print("="*80)
+
+    r_factors = np.array([0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 50.0, 100.0])
+
+    print(f"\n{'r/r_s':<10} {'Static':<15} {'Spiral k=1':<15} {'|Δ|':<12} {'Δ%':<12}")
+    print("-"*80)
+
+    r = r_factors * r_s
 
-for r_factor in r_factors:
-    r = r_factor * phi_spiral.r_s
-    
     # Static SSZ: A(r) = -g_tt
     A_static = static_ssz.A_coefficient(r)
-    g_tt_static = -A_static / (C_SI ** 2)
-    
+    g_tt_static = -A_static * INV_C2
+
     # φ-Spiral
-    g_tt_spiral = phi_spiral.g_tt(r) / (C_SI ** 2)
-    
-    # Deviation
-    delta_abs = abs(g_tt_static - g_tt_spiral)
-    delta_pct = 100 * delta_abs / abs(g_tt_static) if g_tt_static != 0 else 0
-    
-    print(f"{r_factor:<10.1f} {g_tt_static:<15.6f} {g_tt_spiral:<15.6f} {delta_abs:<12.6f} {delta_pct:<12.2f}")
-
-# ============================================================================
-# 2. SPIRALSTÄRKE k VARIATION
-# ============================================================================
-print("\n" + "="*80)
-print("2. EINFLUSS VON k (Spiralstärke) bei r = 3 r_s")
-print("="*80)
-
-r_test = 3.0 * phi_spiral.r_s
-
-print(f"\n{'k':<10} {'g_tt/c²':<15} {'g_tr/c':<15} {'β':<12} {'φ_G [rad]':<15}")
-print("-"*80)
-
-for k in [0.5, 1.0, 1.5, 2.0, 3.0, 5.0]:
-    metric_k = PhiSpiralSSZMetric(mass=mass, k=k)
-    
-    g_tt = metric_k.g_tt(r_test) / (C_SI ** 2)
-    g_tr = metric_k.g_tr(r_test) / C_SI
-    beta = metric_k.beta(r_test)
-    phi_G = metric_k.phi_G(r_test)
-    
-    print(f"{k:<10.1f} {g_tt:<15.6f} {g_tr:<15.6f} {beta:<12.6f} {phi_G:<15.6f}")
-
-print("\n→ Höheres k → stärkere Spirale → größere Abweichung von Static")
-
-# ============================================================================
-# 3. RADIALE ABWEICHUNG
-# ============================================================================
-print("\n" + "="*80)
-print("3. WIE ÄNDERT SICH DIE ABWEICHUNG MIT DEM RADIUS?")
-print("="*80)
-
-print(f"\n{'r/r_s':<10} {'Static':<12} {'k=0.5':<12} {'k=1.0':<12} {'k=2.0':<12}")
-print("-"*80)
-
-for r_factor in [0.5, 1.0, 2.0, 5.0, 10.0, 50.0]:
-    r = r_factor * phi_spiral.r_s
-    
-    A_static = static_ssz.A_coefficient(r)
-    g_static = -A_static / (C_SI ** 2)
-    
-    g_k05 = PhiSpiralSSZMetric(mass=mass, k=0.5).g_tt(r) / (C_SI ** 2)
-    g_k10 = PhiSpiralSSZMetric(mass=mass, k=1.0).g_tt(r) / (C_SI ** 2)
-    g_k20 = PhiSpiralSSZMetric(mass=mass, k=2.0).g_tt(r) / (C_SI ** 2)
-    
-    print(f"{r_factor:<10.1f} {g_static:<12.6f} {g_k05:<12.6f} {g_k10:<12.6f} {g_k20:<12.6f}")
-
-# ============================================================================
-# 4. OFF-DIAGONAL TERM (nur φ-Spiral!)
-# ============================================================================
-print("\n" + "="*80)
-print("4. OFF-DIAGONAL TERM g_tr (nur in φ-Spiral!)")
-print("="*80)
-
-print(f"\nStatic SSZ: g_tr = 0 (keine Off-Diagonal-Terme)")
-print(f"φ-Spiral:   g_tr ≠ 0 (Spiralstruktur!)\n")
-
-print(f"{'r/r_s':<10} {'|g_tr|/c':<15} {'β = tanh(φ_G)':<20}")
-print("-"*80)
-
-for r_factor in [1.0, 2.0, 3.0, 5.0, 10.0]:
-    r = r_factor * phi_spiral.r_s
-    
-    g_tr = abs(phi_spiral.g_tr(r) / C_SI)
-    beta = phi_spiral.beta(r)
-    
-    print(f"{r_factor:<10.1f} {g_tr:<15.6f} {beta:<20.6f}")
-
-print("\n→ Dies ist der HAUPTUNTERSCHIED zur Static-Metrik!")
-
-# ============================================================================
-# 5. ZEITDILATATION
-# ============================================================================
-print("\n" + "="*80)
-print("5. ZEITDILATATION dτ/dt")
-print("="*80)
-
-print(f"\n{'r/r_s':<10} {'Static √A':<15} {'Spiral sech(φ_G)':<20} {'Δ%':<12}")
-print("-"*80)
-
-for r_factor in [0.5, 1.0, 2.0, 5.0, 10.0]:
-    r = r_factor * phi_spiral.r_s
-    
-    # Static: dτ/dt = √A(r)
+    g_tt_spiral = phi_spiral.g_tt(r) * INV_C2
+
+    # Deviation (0% where the static g_tt vanishes)
+    delta_abs = np.abs(g_tt_static - g_tt_spiral)
+    abs_static = np.abs(g_tt_static)
+    delta_pct = np.divide(100 * delta_abs, abs_static,
+                          out=np.zeros_like(delta_abs), where=abs_static != 0)
+
+    print("\n".join(
+        f"{r_factor:<10.1f} {g_static:<15.6f} {g_spiral:<15.6f} {d_abs:<12.6f} {d_pct:<12.2f}"
+        for r_factor, g_static, g_spiral, d_abs, d_pct in zip(
+            r_factors, g_tt_static, g_tt_spiral, delta_abs, delta_pct)
+    ))
+
+    # ============================================================================
+    # 2. SPIRALSTÄRKE k VARIATION
+    # ============================================================================
+    print("\n" + "="*80)
+    print("2. EINFLUSS VON k (Spiralstärke) bei r = 3 r_s")
+    print("="*80)
+
+    r_test = 3.0 * r_s
+
+    print(f"\n{'k':<10} {'g_tt/c²':<15} {'g_tr/c':<15} {'β':<12} {'φ_G [rad]':<15}")
+    print("-"*80)
+
+    rows = []
+    for k in [0.5, 1.0, 1.5, 2.0, 3.0, 5.0]:
+        metric_k = _phi(mass, k)
+        
+        g_tt = metric_k.g_tt(r_test) * INV_C2
+        g_tr = metric_k.g_tr(r_test) * INV_C
+        beta = metric_k.beta(r_test)
+        phi_G = metric_k.phi_G(r_test)
+        
+        rows.append(f"{k:<10.1f} {g_tt:<15.6f} {g_tr:<15.6f} {beta:<12.6f} {phi_G:<15.6f}")
+    print("\n".join(rows))
+
+    print("\n→ Höheres k → stärkere Spirale → größere Abweichung von Static")
+
+    # ============================================================================
+    # 3. RADIALE ABWEICHUNG
+    # ============================================================================
+    print("\n" + "="*80)
+    print("3. WIE ÄNDERT SICH DIE ABWEICHUNG MIT DEM RADIUS?")
+    print("="*80)
+
+    print(f"\n{'r/r_s':<10} {'Static':<12} {'k=0.5':<12} {'k=1.0':<12} {'k=2.0':<12}")
+    print("-"*80)
+
+    # One metric per k, built once rather than once per radius
+    metrics_by_k = {k: _phi(mass, k) for k in (0.5, 1.0, 2.0)}
+
+    rows = []
+    for r_factor in [0.5, 1.0, 2.0, 5.0, 10.0, 50.0]:
+        r = r_factor * r_s
+        
+        A_static = static_ssz.A_coefficient(r)
+        g_static = -A_static * INV_C2
+        
+        g_k05 = metrics_by_k[0.5].g_tt(r) * INV_C2
+        g_k10 = metrics_by_k[1.0].g_tt(r) * INV_C2
+        g_k20 = metrics_by_k[2.0].g_tt(r) * INV_C2
+        
+        rows.append(f"{r_factor:<10.1f} {g_static:<12.6f} {g_k05:<12.6f} {g_k10:<12.6f} {g_k20:<12.6f}")
+    print("\n".join(rows))
+
+    # ============================================================================
+    # 4. OFF-DIAGONAL TERM (nur φ-Spiral!)
+    # ============================================================================
+    print("\n" + "="*80)
+    print("4. OFF-DIAGONAL TERM g_tr (nur in φ-Spiral!)")
+    print("="*80)
+
+    print(f"\nStatic SSZ: g_tr = 0 (keine Off-Diagonal-Terme)")
+    print(f"φ-Spiral:   g_tr ≠ 0 (Spiralstruktur!)\n")
+
+    print(f"{'r/r_s':<10} {'|g_tr|/c':<15} {'β = tanh(φ_G)':<20}")
+    print("-"*80)
+
+    rows = []
+    for r_factor in [1.0, 2.0, 3.0, 5.0, 10.0]:
+        r = r_factor * r_s
+        
+        g_tr = abs(phi_spiral.g_tr(r) * INV_C)
+        beta = phi_spiral.beta(r)
+        
+        rows.append(f"{r_factor:<10.1f} {g_tr:<15.6f} {beta:<20.6f}")
+    print("\n".join(rows))
+
+    print("\n→ Dies ist der HAUPTUNTERSCHIED zur Static-Metrik!")
+
+    # ============================================================================
+    # 5. ZEITDILATATION
+    # ============================================================================
+    print("\n" + "="*80)
+    print("5. ZEITDILATATION dτ/dt")
+    print("="*80)
+
+    print(f"\n{'r/r_s':<10} {'Static √A':<15} {'Spiral sech(φ_G)':<20} {'Δ%':<12}")
+    print("-"*80)
+
+    r_factors = np.array([0.5, 1.0, 2.0, 5.0, 10.0])
+    r = r_factors * r_s
+
+    # Static: dτ/dt = √A(r)  (A > 0 everywhere, A_coefficient clamps it)
     A_static = static_ssz.A_coefficient(r)
     dtau_static = np.sqrt(A_static)
-    
+
     # Spiral: dτ/dt = sech(φ_G)
     dtau_spiral = phi_spiral.time_dilation_factor(r)
-    
-    delta_pct = 100 * abs(dtau_static - dtau_spiral) / dtau_static if dtau_static > 0 else 0
-    
-    print(f"{r_factor:<10.1f} {dtau_static:<15.6f} {dtau_spiral:<20.6f} {delta_pct:<12.2f}")
-
-# ============================================================================
-# ZUSAMMENFASSUNG
-# ============================================================================
-print("\n" + "="*80)
-print("ZUSAMMENFASSUNG DER ABWEICHUNGEN")
-print("="*80)
-
-print("""
+
+    delta_pct = 100 * np.abs(dtau_static - dtau_spiral) / dtau_static
+
+    print("\n".join(
+        f"{r_factor:<10.1f} {dt_static:<15.6f} {dt_spiral:<20.6f} {d_pct:<12.2f}"
+        for r_factor, dt_static, dt_spiral, d_pct in zip(r_factors, dtau_static, dtau_spiral, delta_pct)
+    ))
+
+    # ============================================================================
+    # ZUSAMMENFASSUNG
+    # ============================================================================
+    print("\n" + "="*80)
+    print("ZUSAMMENFASSUNG DER ABWEICHUNGEN")
+    print("="*80)
+
+    print("""
 HAUPTUNTERSCHIEDE:
 ──────────────────
 
@@ -228,5 +256,9 @@ Für qualitative Physik: Beide Metriken gültig
 Für maximale Genauigkeit: Parameter-Fit an Daten
 """)
 
-print("="*80)
-print("\n© 2025 Carmen Wrede & Lino Casu\n")
+    print("="*80)
+    print("\n© 2025 Carmen Wrede & Lino Casu\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,7 @@ Based on Lino's symbolic computation script
 """
 import sys
 import os
+from functools import lru_cache
 
 # UTF-8 encoding for Windows
 os.environ['PYTHONIOENCODING'] = 'utf-8'
@@ -27,223 +28,262 @@ if sys.platform.startswith('win'):
         pass
 
 import sympy as sp
-
-print("\n" + "="*80)
-print("RIEMANN CURVATURE - φ-Spiral SSZ Metric (2D)")
-print("="*80)
+from sympy import Array, MutableDenseNDimArray, tensorcontraction, tensorproduct
 
 # Symbole und Funktionen
 T, r = sp.symbols('T r', real=True)
 c = sp.symbols('c', positive=True)
-phi = sp.Function('phi')(r)          # φ(r)
+# φ(r) and its first two r-derivatives as plain symbols (no Derivative nodes)
+phi, phi_r, phi_rr = sp.symbols('phi phi_r phi_rr', real=True)
 gamma = sp.cosh(phi)                 # γ = cosh φ
 sech = 1/sp.cosh(phi)
 tanh = sp.tanh(phi)
 
-print("\nMetric in (T,r) diagonal form:")
-print("  γ(r) = cosh(φ(r))")
-print("  β(r) = tanh(φ(r))")
-print("  sech(φ) = 1/cosh(φ)")
-
 # Metrik g_{μν} in Koordinaten (T, r)
 g = sp.Matrix([[-c**2/gamma**2, 0],
                [0,              gamma**2]])
 g_inv = g.inv()
 
-print("\nMetric tensor g_μν:")
-sp.pprint(g)
-
-print("\nInverse metric g^μν:")
-sp.pprint(g_inv)
-
 coords = [T, r]
 dim = 2
 
-# ========================================================================
-# CHRISTOFFEL SYMBOLS
-# ========================================================================
-print("\n" + "="*80)
-print("CHRISTOFFEL SYMBOLS Γ^ρ_μν")
-print("="*80)
-
-Gamma = [[ [sp.simplify(0) for _ in range(dim)] for _ in range(dim)] for _ in range(dim)]
-for a in range(dim):
-    for b in range(dim):
-        for c_ in range(dim):
-            s = 0
-            for d in range(dim):
-                s += g_inv[a,d]*(sp.diff(g[d,b], coords[c_]) +
-                                 sp.diff(g[d,c_], coords[b]) -
-                                 sp.diff(g[b,c_], coords[d]))
-            Gamma[a][b][c_] = sp.simplify(sp.Rational(1,2)*s)
-
-print("\nNon-zero components:")
-print("\nΓ^T_Tr = Γ^T_rT:")
-sp.pprint(sp.simplify(Gamma[0][0][1]))
-
-print("\nΓ^r_TT:")
-sp.pprint(sp.simplify(Gamma[1][0][0]))
-
-print("\nΓ^r_rr:")
-sp.pprint(sp.simplify(Gamma[1][1][1]))
-
-# ========================================================================
-# RIEMANN CURVATURE TENSOR
-# ========================================================================
-print("\n" + "="*80)
-print("RIEMANN CURVATURE TENSOR R^ρ_σμν")
-print("="*80)
-print("\nComputing (this may take a moment)...")
-
-Riem = [[[[sp.simplify(0) for _ in range(dim)] for _ in range(dim)]
-         for _ in range(dim)] for _ in range(dim)]
-
-for a in range(dim):
-    for b in range(dim):
-        for c_ in range(dim):
-            for d in range(dim):
-                term = sp.diff(Gamma[a][b][d], coords[c_]) - sp.diff(Gamma[a][b][c_], coords[d])
-                for e in range(dim):
-                    term += Gamma[a][e][c_]*Gamma[e][b][d] - Gamma[a][e][d]*Gamma[e][b][c_]
-                Riem[a][b][c_][d] = sp.simplify(term)
-
-# Count non-zero components
-nonzero_count = 0
-for a in range(dim):
-    for b in range(dim):
-        for c_ in range(dim):
-            for d in range(dim):
-                if Riem[a][b][c_][d] != 0:
-                    nonzero_count += 1
-
-print(f"\nFound {nonzero_count} non-zero components")
-
-# Show key component
-print("\nExample: R^r_TrT:")
-sp.pprint(sp.simplify(Riem[1][0][1][0]))
-
-# ========================================================================
-# RICCI TENSOR
-# ========================================================================
-print("\n" + "="*80)
-print("RICCI TENSOR R_μν")
-print("="*80)
-
-# Ricci R_{bd} = R^a_{ bad}
-Ricci = sp.Matrix([[sp.simplify(0) for _ in range(dim)] for _ in range(dim)])
-for b in range(dim):
-    for d in range(dim):
-        s = 0
-        for a in range(dim):
-            s += Riem[a][b][a][d]
-        Ricci[b,d] = sp.simplify(s)
-
-print("\nRicci tensor R_μν:")
-sp.pprint(Ricci)
-
-# ========================================================================
-# RICCI SCALAR
-# ========================================================================
-print("\n" + "="*80)
-print("RICCI SCALAR R")
-print("="*80)
-
-# Skalar R = g^{bd} R_{bd}
-R_scalar = sp.simplify(sum(g_inv[b,d]*Ricci[b,d] for b in range(dim) for d in range(dim)))
-
-print("\nScalar curvature R(r):")
-sp.pprint(sp.simplify(R_scalar))
-
-print("\n" + "-"*80)
-print("Expanded form:")
-print("-"*80)
-R_expanded = sp.expand(R_scalar)
-sp.pprint(R_expanded)
-
-# ========================================================================
-# 2D IDENTITY CHECK
-# ========================================================================
-print("\n" + "="*80)
-print("2D IDENTITY: R_μν = (1/2) g_μν R")
-print("="*80)
-
-# 2D-Identität prüfen: R_{μν} ?= (1/2) g_{μν} R
-lhs = Ricci
-rhs = sp.simplify(sp.Rational(1,2)*R_scalar)*g
-check = sp.simplify(lhs - rhs)
-
-print("\nLeft hand side: R_μν")
-sp.pprint(lhs)
-
-print("\nRight hand side: (1/2) g_μν R")
-sp.pprint(rhs)
-
-print("\nDifference: R_μν - (1/2) g_μν R")
-sp.pprint(check)
-
-if check == sp.Matrix([[0, 0], [0, 0]]):
-    print("\n✅ 2D IDENTITY CONFIRMED: R_μν = (1/2) g_μν R")
-else:
-    print("\n❌ WARNING: Identity not satisfied!")
-    sys.exit(1)
-
-# ========================================================================
-# EXAMPLE: EXPLICIT φ(r) PROFILE
-# ========================================================================
-print("\n" + "="*80)
-print("EXAMPLE: φ(r) = k·log(1 + r/r₀)")
-print("="*80)
-
-k, r0 = sp.symbols('k r0', positive=True)
-phi_ex = k*sp.log(1 + r/r0)
-
-print("\nProfile: φ(r) = k·log(1 + r/r₀)")
-print(f"  First derivative: φ'(r) = k/(r₀ + r)")
-print(f"  Second derivative: φ''(r) = -k/(r₀ + r)²")
-
-# Substitute into R
-phi_prime = sp.diff(phi_ex, r)
-phi_double_prime = sp.diff(phi_ex, r, 2)
-
-R_substituted = R_scalar.subs({
-    phi: phi_ex,
-    sp.diff(phi, r): phi_prime,
-    sp.diff(phi, r, 2): phi_double_prime
-})
-
-R_ex = sp.simplify(R_substituted)
-
-print("\nResulting R(r):")
-sp.pprint(R_ex)
-
-# Check limits (numerically to avoid symbolic issues)
-print("\n" + "-"*80)
-print("Limiting cases (with k=1, r0=1):")
-print("-"*80)
-
-# Substitute numerical values for limits
-R_num = R_ex.subs({k: 1, r0: 1})
-
-# r → 0
-print("\nAs r → 0:")
-R_at_zero = sp.limit(R_num, r, 0)
-print(f"  R(0) = ", end="")
-sp.pprint(R_at_zero)
-
-# r → ∞
-print("\nAs r → ∞:")
-R_at_inf = sp.limit(R_num, r, sp.oo)
-print(f"  R(∞) = ", end="")
-sp.pprint(R_at_inf)
-
-# ========================================================================
-# PHYSICAL INTERPRETATION
-# ========================================================================
-print("\n" + "="*80)
-print("PHYSICAL INTERPRETATION")
-print("="*80)
-
-print("""
+
+def d_dx(expr, x):
+    """∂_x expr, applying the chain rule d/dr φ = φ_r, d/dr φ_r = φ_rr."""
+    diff = sp.diff
+    if x != r:
+        return diff(expr, x)
+    return diff(expr, r) + diff(expr, phi)*phi_r + diff(expr, phi_r)*phi_rr
+
+
+@lru_cache(maxsize=None)
+def compute_curvature():
+    """
+    Christoffel symbols, Riemann tensor, Ricci tensor and Ricci scalar of g.
+
+    The symbolic work runs once per process; later calls return the cached
+    result, so importing this module stays cheap.
+
+    Returns:
+        (Gamma, Riem, Ricci, R_scalar)
+    """
+    # For a diagonal g_μν only three families of Γ^a_bc = Γ^a_cb are non-zero:
+    #   Γ^a_ab = Γ^a_ba = ½ ∂_b ln|g_aa|   (includes Γ^a_aa)
+    #   Γ^a_bb = -∂_a g_bb / (2 g_aa)      (b ≠ a)
+    if not g.is_diagonal():
+        raise ValueError("Christoffel assembly assumes a diagonal metric")
+    Gamma = MutableDenseNDimArray.zeros(dim, dim, dim)
+    for a in range(dim):
+        two_g_aa = 2*g[a,a]
+        for b in range(dim):
+            Gamma[a, a, b] = Gamma[a, b, a] = d_dx(g[a,a], coords[b]) / two_g_aa
+            if b != a:
+                Gamma[a, b, b] = -d_dx(g[b,b], coords[a]) / two_g_aa
+    Gamma = Gamma.as_immutable()
+
+    # dGamma[μ, a, b, d] = ∂_μ Γ^a_bd, differentiated once per component
+    dGamma = Array([Gamma.applyfunc(lambda component: d_dx(component, x)) for x in coords])
+
+    # GammaGamma[a, c, b, d] = Γ^a_ec Γ^e_bd, contracted over e
+    GammaGamma = tensorcontraction(tensorproduct(Gamma, Gamma), (1, 3))
+
+    # R^a_bcd = ∂_c Γ^a_bd - ∂_d Γ^a_bc + Γ^a_ec Γ^e_bd - Γ^a_ed Γ^e_bc
+    # Antisymmetric in (c, d): assemble c < d only and mirror, R^a_bcc = 0
+    Riem = MutableDenseNDimArray.zeros(dim, dim, dim, dim)
+    for a in range(dim):
+        for b in range(dim):
+            for c_ in range(dim):
+                for d in range(c_ + 1, dim):
+                    term = (dGamma[c_, a, b, d] - dGamma[d, a, b, c_]
+                            + GammaGamma[a, c_, b, d] - GammaGamma[a, d, b, c_])
+                    Riem[a, b, c_, d] = term
+                    Riem[a, b, d, c_] = -term
+    Riem = Riem.as_immutable()
+
+    # Ricci R_{bd} = R^a_{ bad}
+    Ricci = tensorcontraction(Riem, (0, 2)).tomatrix().applyfunc(sp.simplify)
+
+    # Skalar R = g^{bd} R_{bd} = tr(g^{-1} Ric), R_{bd} being symmetric
+    R_scalar = sp.simplify((g_inv*Ricci).trace())
+
+    return Gamma, Riem, Ricci, R_scalar
+
+
+def main():
+    """Print the full curvature report."""
+    print("\n" + "="*80)
+    print("RIEMANN CURVATURE - φ-Spiral SSZ Metric (2D)")
+    print("="*80)
+
+    print("\nMetric in (T,r) diagonal form:")
+    print("  γ(r) = cosh(φ(r))")
+    print("  β(r) = tanh(φ(r))")
+    print("  sech(φ) = 1/cosh(φ)")
+    print("  φ_r = dφ/dr,  φ_rr = d²φ/dr²")
+
+    print("\nMetric tensor g_μν:")
+    sp.pprint(g)
+
+    print("\nInverse metric g^μν:")
+    sp.pprint(g_inv)
+
+    print("\nComputing curvature (this may take a moment)...")
+    Gamma, Riem, Ricci, R_scalar = compute_curvature()
+
+    # ========================================================================
+    # CHRISTOFFEL SYMBOLS
+    # ========================================================================
+    print("\n" + "="*80)
+    print("CHRISTOFFEL SYMBOLS Γ^ρ_μν")
+    print("="*80)
+
+    print("\nNon-zero components:")
+    print("\nΓ^T_Tr = Γ^T_rT:")
+    sp.pprint(sp.simplify(Gamma[0, 0, 1]))
+
+    print("\nΓ^r_TT:")
+    sp.pprint(sp.simplify(Gamma[1, 0, 0]))
+
+    print("\nΓ^r_rr:")
+    sp.pprint(sp.simplify(Gamma[1, 1, 1]))
+
+    # ========================================================================
+    # RIEMANN CURVATURE TENSOR
+    # ========================================================================
+    print("\n" + "="*80)
+    print("RIEMANN CURVATURE TENSOR R^ρ_σμν")
+    print("="*80)
+
+    # Count non-zero components
+    nonzero_count = sum(1 for component in sp.flatten(Riem.tolist()) if component != 0)
+
+    print(f"\nFound {nonzero_count} non-zero components")
+
+    # Show key component
+    print("\nExample: R^r_TrT:")
+    sp.pprint(sp.simplify(Riem[1, 0, 1, 0]))
+
+    # ========================================================================
+    # RICCI TENSOR
+    # ========================================================================
+    print("\n" + "="*80)
+    print("RICCI TENSOR R_μν")
+    print("="*80)
+
+    print("\nRicci tensor R_μν:")
+    sp.pprint(Ricci)
+
+    # ========================================================================
+    # RICCI SCALAR
+    # ========================================================================
+    print("\n" + "="*80)
+    print("RICCI SCALAR R")
+    print("="*80)
+
+    print("\nScalar curvature R(r):")
+    sp.pprint(R_scalar)
+
+    print("\n" + "-"*80)
+    print("Expanded form:")
+    print("-"*80)
+    R_expanded = sp.expand(R_scalar)
+    sp.pprint(R_expanded)
+
+    # ========================================================================
+    # 2D IDENTITY CHECK
+    # ========================================================================
+    print("\n" + "="*80)
+    print("2D IDENTITY: R_μν = (1/2) g_μν R")
+    print("="*80)
+
+    # 2D-Identität prüfen: R_{μν} ?= (1/2) g_{μν} R
+    lhs = Ricci
+    rhs = sp.simplify(sp.Rational(1,2)*R_scalar)*g
+    # cancel() already reduces these entries to 0; full simplify only if it does not
+    check = (lhs - rhs).applyfunc(sp.cancel)
+    if not check.is_zero_matrix:
+        check = sp.simplify(check)
+
+    print("\nLeft hand side: R_μν")
+    sp.pprint(lhs)
+
+    print("\nRight hand side: (1/2) g_μν R")
+    sp.pprint(rhs)
+
+    print("\nDifference: R_μν - (1/2) g_μν R")
+    sp.pprint(check)
+
+    if check.is_zero_matrix:
+        print("\n✅ 2D IDENTITY CONFIRMED: R_μν = (1/2) g_μν R")
+    else:
+        print("\n❌ WARNING: Identity not satisfied!")
+        sys.exit(1)
+
+    # ========================================================================
+    # EXAMPLE: EXPLICIT φ(r) PROFILE
+    # ========================================================================
+    print("\n" + "="*80)
+    print("EXAMPLE: φ(r) = k·log(1 + r/r₀)")
+    print("="*80)
+
+    k, r0 = sp.symbols('k r0', positive=True)
+    phi_ex = k*sp.log(1 + r/r0)
+
+    print("\nProfile: φ(r) = k·log(1 + r/r₀)")
+    print(f"  First derivative: φ'(r) = k/(r₀ + r)")
+    print(f"  Second derivative: φ''(r) = -k/(r₀ + r)²")
+
+    # Substitute into R
+    phi_prime = sp.diff(phi_ex, r)
+    phi_double_prime = sp.diff(phi_ex, r, 2)
+
+    # φ, φ_r, φ_rr are plain symbols, so one simultaneous structural replacement suffices
+    R_substituted = R_scalar.xreplace({
+        phi: phi_ex,
+        phi_r: phi_prime,
+        phi_rr: phi_double_prime
+    })
+
+    R_ex = sp.simplify(R_substituted)
+
+    # Factor out the repeated r + r₀ and k·log(…) subtrees for display
+    R_ex_common, (R_ex_reduced,) = sp.cse([R_ex])
+
+    print("\nResulting R(r):")
+    for symbol, subexpr in R_ex_common:
+        sp.pprint(sp.Eq(symbol, subexpr, evaluate=False))
+    print()
+    sp.pprint(R_ex_reduced)
+
+    # Check limits (numerically to avoid symbolic issues)
+    print("\n" + "-"*80)
+    print("Limiting cases (with k=1, r0=1):")
+    print("-"*80)
+
+    # Substitute numerical values for limits
+    R_num = R_ex.subs({k: 1, r0: 1})
+
+    # r → 0: φ(0) = 0 and R is analytic there, so direct substitution is the limit
+    print("\nAs r → 0:")
+    R_at_zero = R_num.subs(r, 0)
+    print(f"  R(0) = ", end="")
+    sp.pprint(R_at_zero)
+
+    # r → ∞
+    print("\nAs r → ∞:")
+    # cosh/sinh of k·log(…) with k=1 are rational in r, so Gruntz only sees a rational function
+    R_at_inf = sp.limit(sp.cancel(R_num.rewrite(sp.exp)), r, sp.oo)
+    print(f"  R(∞) = ", end="")
+    sp.pprint(R_at_inf)
+
+    # ========================================================================
+    # PHYSICAL INTERPRETATION
+    # ========================================================================
+    print("\n" + "="*80)
+    print("PHYSICAL INTERPRETATION")
+    print("="*80)
+
+    print("""
 🌀 KEY OBSERVATIONS:
 
 1. CURVATURE DEPENDS ONLY ON φ(r):
@@ -276,14 +316,14 @@ FUNDAMENTAL DIFFERENCE from GR:
    SSZ: Rotation → Segments → "Effective curvature"
 """)
 
-# ========================================================================
-# SUMMARY
-# ========================================================================
-print("\n" + "="*80)
-print("SUMMARY")
-print("="*80)
+    # ========================================================================
+    # SUMMARY
+    # ========================================================================
+    print("\n" + "="*80)
+    print("SUMMARY")
+    print("="*80)
 
-print("""
+    print("""
 ✅ COMPUTED:
    • Christoffel symbols (3 non-zero)
    • Riemann tensor R^ρ_σμν
@@ -303,6 +343,10 @@ print("""
    • Pure SSZ: No GR field equations
 """)
 
-print("="*80)
-print("\n© 2025 Carmen Wrede & Lino Casu")
-print("Based on Lino's symbolic computation\n")
+    print("="*80)
+    print("\n© 2025 Carmen Wrede & Lino Casu")
+    print("Based on Lino's symbolic computation\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ Demonstrates core functionality of the SSZ metric.
 © 2025 Carmen Wrede & Lino Casu
 """
 
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -16,6 +18,12 @@ from src.ssz_core import (
 )
 from src.ssz_core.constants import PHI, M_SUN
 
+# Demo output by default; pass --publication for 300 dpi, tight-cropped figures
+if '--publication' in sys.argv[1:]:
+    SAVEFIG_KWARGS = dict(dpi=300, bbox_inches='tight')
+else:
+    SAVEFIG_KWARGS = dict(dpi=150)
+
 print("="*60)
 print("SSZ Metric Pure - Basic Usage Example")
 print("="*60)
@@ -27,28 +35,43 @@ r_s = schwarzschild_radius(M_SUN)
 print(f"Solar mass: {M_SUN:.3e} kg")
 print(f"r_s: {r_s:.2f} m")
 
+# Evaluate every profile once on a single grid: the handful of radii quoted
+# below come first, followed by the plotting range.
+r_star = find_intersection(r_s)
+r_points = np.array([0.0, r_s, 100 * r_s, r_star, 5 * r_s])
+I_0, I_RS, I_FAR, I_STAR, I_5RS = range(len(r_points))
+r_values = np.linspace(0.01 * r_s, 10 * r_s, 1000)
+r_grid = np.concatenate([r_points, r_values])
+n_points = len(r_points)
+
+xi_grid = Xi(r_grid, r_s)
+d_ssz_grid = D_SSZ(r_grid, r_s)
+d_gr_grid = D_GR(r_grid, r_s)
+A_xi_grid = A_Xi(r_grid, r_s)
+A_phi_grid = A_phi_series(r_grid, r_s, order=6)
+A_safe_grid = A_safe(r_grid, r_s, use_mirror_blend=True)
+
 # 2. Segment saturation (Golden Ratio!)
 print("\n2. Segment Saturation (φ = {:.6f})".format(PHI))
 print("-" * 40)
 r_test = r_s
-xi = Xi(r_test, r_s)
+xi = xi_grid[I_RS]
 print(f"Ξ({r_test/r_s:.1f} r_s) = {xi:.6f}")
-print(f"Ξ(0) = {Xi(0.0, r_s):.6f} (empty at center)")
-print(f"Ξ(∞) → {Xi(100*r_s, r_s):.6f} (full saturation)")
+print(f"Ξ(0) = {xi_grid[I_0]:.6f} (empty at center)")
+print(f"Ξ(∞) → {xi_grid[I_FAR]:.6f} (full saturation)")
 
 # 3. SSZ time dilation (singularity-free!)
 print("\n3. Time Dilation")
 print("-" * 40)
-print(f"D_SSZ(0) = {D_SSZ(0.0, r_s):.6f} ← NO SINGULARITY!")
-print(f"D_SSZ(r_s) = {D_SSZ(r_s, r_s):.6f} ← FINITE!")
-print(f"D_GR(r_s) = {D_GR(r_s, r_s)} ← NaN (singularity)")
+print(f"D_SSZ(0) = {d_ssz_grid[I_0]:.6f} ← NO SINGULARITY!")
+print(f"D_SSZ(r_s) = {d_ssz_grid[I_RS]:.6f} ← FINITE!")
+print(f"D_GR(r_s) = {d_gr_grid[I_RS]} ← NaN (singularity)")
 
 # 4. Find intersection point r*
 print("\n4. Intersection Point r*")
 print("-" * 40)
-r_star = find_intersection(r_s)
-d_ssz_star = D_SSZ(r_star, r_s)
-d_gr_star = D_GR(r_star, r_s)
+d_ssz_star = d_ssz_grid[I_STAR]
+d_gr_star = d_gr_grid[I_STAR]
 print(f"r* = {r_star/r_s:.3f} r_s = {r_star:.2f} m")
 print(f"D_SSZ(r*) = {d_ssz_star:.6f}")
 print(f"D_GR(r*) = {d_gr_star:.6f}")
@@ -57,10 +80,10 @@ print(f"Match: {abs(d_ssz_star - d_gr_star) < 1e-6}")
 # 5. Metric coefficients
 print("\n5. Metric Coefficients")
 print("-" * 40)
-r = 5 * r_s
-A_inner = A_Xi(r, r_s)
-A_outer = A_phi_series(r, r_s, order=6)
-A_blended = A_safe(r, r_s, use_mirror_blend=True)
+r = r_points[I_5RS]
+A_inner = A_xi_grid[I_5RS]
+A_outer = A_phi_grid[I_5RS]
+A_blended = A_safe_grid[I_5RS]
 print(f"At r = {r/r_s:.1f} r_s:")
 print(f"  A_Ξ (inner SSZ) = {A_inner:.6f}")
 print(f"  A_φ (outer PN) = {A_outer:.6f}")
@@ -83,13 +106,11 @@ print("\n7. Creating Visualization...")
 print("-" * 40)
 
 # Create comparison plot
-r_values = np.linspace(0.01 * r_s, 10 * r_s, 1000)
-
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
 
 # Time dilation
-d_ssz = D_SSZ(r_values, r_s)
-d_gr = D_GR(r_values, r_s)
+d_ssz = d_ssz_grid[n_points:]
+d_gr = d_gr_grid[n_points:]
 
 ax1.plot(r_values / r_s, d_ssz, 'b-', linewidth=2.5, label='SSZ')
 ax1.plot(r_values / r_s, d_gr, 'r--', linewidth=2, label='GR')
@@ -103,7 +124,7 @@ ax1.grid(True, alpha=0.3)
 ax1.set_ylim(0, 1.1)
 
 # Metric coefficient
-A_ssz = A_safe(r_values, r_s, use_mirror_blend=True)
+A_ssz = A_safe_grid[n_points:]
 A_gr = 1.0 - r_s / np.maximum(r_values, r_s)
 
 ax2.plot(r_values / r_s, A_ssz, 'b-', linewidth=2.5, label='SSZ')
@@ -116,7 +137,7 @@ ax2.legend()
 ax2.grid(True, alpha=0.3)
 
 plt.tight_layout()
-plt.savefig('examples/ssz_basic_comparison.png', dpi=300, bbox_inches='tight')
+plt.savefig('examples/ssz_basic_comparison.png', **SAVEFIG_KWARGS)
 print("✓ Saved: examples/ssz_basic_comparison.png")
 
 print("\n" + "="*60)
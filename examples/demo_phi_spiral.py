@@ -14,6 +14,7 @@ Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
 """
 import numpy as np
 import matplotlib.pyplot as plt
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 from pathlib import Path
 
 # Add parent directory to path
@@ -25,6 +26,31 @@ from ssz_metric_pure.metric_phi_spiral_ssz_by_human import PhiSpiralSSZMetric
 # Physical constants
 M_SUN = 1.98847e30  # Solar mass [kg]
 
+# All figures go here (created on first save)
+OUTPUT_DIR = Path(__file__).parent / "output"
+
+# Exploratory output: 150 dpi, no tight-bbox pass (that costs a second render)
+SAVEFIG_KWARGS = dict(dpi=150)
+
+
+def _style_axes(ax, title, xlabel=None, ylabel=None, grid_which='major'):
+    """Shared title / label / grid styling of the 2D demo plots."""
+    if xlabel is not None:
+        ax.set_xlabel(xlabel, fontsize=14)
+    if ylabel is not None:
+        ax.set_ylabel(ylabel, fontsize=14)
+    ax.set_title(title, fontsize=16)
+    ax.grid(True, alpha=0.3, which=grid_which)
+
+
+def _save_figure(fig, filename):
+    """Save fig to OUTPUT_DIR/filename, close it and return the path."""
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    output_file = OUTPUT_DIR / filename
+    fig.savefig(output_file, **SAVEFIG_KWARGS)
+    plt.close(fig)
+    return output_file
+
 
 def demo_basic_usage():
     """Basic usage of φ-Spiral metric."""
@@ -40,7 +66,10 @@ def demo_basic_usage():
     print(f"Characteristic radius: {metric.r0:.3e} m")
     
     # Test at different radii
-    test_radii = [0.1, 1.0, 3.0, 10.0]  # In units of r_s
+    test_radii = np.array([0.1, 1.0, 3.0, 10.0])  # In units of r_s
+    r = test_radii * metric.r_s
+    comps = metric.metric_components_batch(r)
+    layers = metric.subspace_layer(r)
     
     print("\n" + "-"*80)
     print("Metric at different radii:")
@@ -48,12 +77,9 @@ def demo_basic_usage():
     print(f"{'r/r_s':<10} {'φ_G [rad]':<15} {'β':<12} {'dτ/dt':<12} {'Layer':<10}")
     print("-"*80)
     
-    for r_factor in test_radii:
-        r = r_factor * metric.r_s
-        comps = metric.metric_components(r)
-        
-        print(f"{r_factor:<10.1f} {comps.phi_G:<15.6f} {comps.beta:<12.6f} "
-              f"{comps.tau_factor:<12.6f} {metric.subspace_layer(r):<10d}")
+    for i, r_factor in enumerate(test_radii):
+        print(f"{r_factor:<10.1f} {comps['phi_G'][i]:<15.6f} {comps['beta'][i]:<12.6f} "
+              f"{comps['tau_factor'][i]:<12.6f} {layers[i]:<10d}")
     
     print("\n" + "="*80)
 
@@ -66,23 +92,14 @@ def demo_subspace_layers():
     
     metric = PhiSpiralSSZMetric(mass=M_SUN, k=2.0)  # Higher k for more layers
     
-    # Find radii where layers transition
-    r_vals = np.linspace(0.1 * metric.r_s, 20 * metric.r_s, 10000)
-    
     print("\nTransition points (φ_G = n·2π):")
     print("-"*60)
     print(f"{'Layer n':<15} {'φ_G [rad]':<20} {'r/r_s':<15}")
     print("-"*60)
     
-    prev_layer = 0
-    for r in r_vals:
-        layer = metric.subspace_layer(r)
-        if layer > prev_layer:
-            phi = metric.phi_G(r)
-            print(f"{layer:<15d} {phi:<20.6f} {r/metric.r_s:<15.3f}")
-            prev_layer = layer
-            if layer >= 3:  # Show first 3 transitions
-                break
+    for layer in range(1, 4):  # Show first 3 transitions
+        r = metric.subspace_transition_radius(layer)
+        print(f"{layer:<15d} {metric.phi_G(r):<20.6f} {r/metric.r_s:<15.3f}")
     
     print("\n" + "="*80)
 
@@ -101,17 +118,16 @@ def demo_schwarzschild_comparison():
     print("-"*80)
     
     C_SI = 299792458.0
-    test_radii = [1.5, 2.0, 3.0, 5.0, 10.0, 20.0]
+    test_radii = np.array([1.5, 2.0, 3.0, 5.0, 10.0, 20.0])
     
-    for r_factor in test_radii:
-        r = r_factor * metric.r_s
-        g_tt_ssz, g_tt_gr = metric.schwarzschild_limit(r)
-        
-        g_tt_ssz_norm = g_tt_ssz / (C_SI ** 2)
-        g_tt_gr_norm = g_tt_gr / (C_SI ** 2)
-        diff = abs(g_tt_ssz_norm - g_tt_gr_norm)
-        
-        print(f"{r_factor:<15.1f} {g_tt_ssz_norm:<20.6f} {g_tt_gr_norm:<20.6f} {diff:<15.6e}")
+    # One pass over all radii (φ_G evaluated once inside g_tt)
+    g_tt_ssz, g_tt_gr = metric.schwarzschild_limit(test_radii * metric.r_s)
+    g_tt_ssz_norm = g_tt_ssz / (C_SI ** 2)
+    g_tt_gr_norm = g_tt_gr / (C_SI ** 2)
+    diffs = np.abs(g_tt_ssz_norm - g_tt_gr_norm)
+    
+    for i, r_factor in enumerate(test_radii):
+        print(f"{r_factor:<15.1f} {g_tt_ssz_norm[i]:<20.6f} {g_tt_gr_norm[i]:<20.6f} {diffs[i]:<15.6e}")
     
     print("\n" + "="*80)
 
@@ -129,13 +145,10 @@ def demo_light_cone_tilt():
     print(f"{'r/r_s':<15} {'α [degrees]':<20} {'β':<15}")
     print("-"*60)
     
-    test_radii = [1.0, 2.0, 3.0, 5.0, 10.0]
+    test_radii = np.array([1.0, 2.0, 3.0, 5.0, 10.0])
+    alphas, betas = metric.tilt_and_beta(test_radii * metric.r_s)
     
-    for r_factor in test_radii:
-        r = r_factor * metric.r_s
-        alpha = metric.light_cone_tilt(r)
-        beta = metric.beta(r)
-        
+    for r_factor, alpha, beta in zip(test_radii, alphas, betas):
         if not np.isnan(alpha):
             alpha_deg = np.degrees(alpha)
             print(f"{r_factor:<15.1f} {alpha_deg:<20.3f} {beta:<15.6f}")
@@ -156,15 +169,9 @@ def plot_metric_components_demo():
     try:
         fig = metric.plot_metric_components(0.5 * metric.r_s, 15 * metric.r_s)
         
-        output_dir = Path(__file__).parent / "output"
-        output_dir.mkdir(exist_ok=True)
-        
-        output_file = output_dir / "phi_spiral_metric_components.png"
-        fig.savefig(output_file, dpi=150, bbox_inches='tight')
+        output_file = _save_figure(fig, "phi_spiral_metric_components.png")
         print(f"\n✓ Saved: {output_file}")
         
-        plt.close(fig)
-        
     except Exception as e:
         print(f"\n✗ Plotting failed: {e}")
     
@@ -182,15 +189,9 @@ def plot_subspace_layers_demo():
     try:
         fig = metric.plot_subspace_layers(0.1 * metric.r_s, 15 * metric.r_s)
         
-        output_dir = Path(__file__).parent / "output"
-        output_dir.mkdir(exist_ok=True)
-        
-        output_file = output_dir / "phi_spiral_subspace_layers.png"
-        fig.savefig(output_file, dpi=150, bbox_inches='tight')
+        output_file = _save_figure(fig, "phi_spiral_subspace_layers.png")
         print(f"\n✓ Saved: {output_file}")
         
-        plt.close(fig)
-        
     except Exception as e:
         print(f"\n✗ Plotting failed: {e}")
     
@@ -213,21 +214,13 @@ def plot_spiral_embedding_demo():
         
         fig, ax = plt.subplots(figsize=(10, 10))
         ax.plot(x / metric.r_s, y / metric.r_s, 'b-', linewidth=2)
-        ax.set_xlabel(r"$x / r_s$", fontsize=14)
-        ax.set_ylabel(r"$y / r_s$", fontsize=14)
-        ax.set_title(r"2D φ-Spiral Embedding: $(x, y) = (r\cos\phi_G, r\sin\phi_G)$", fontsize=16)
-        ax.grid(True, alpha=0.3)
+        _style_axes(ax, r"2D φ-Spiral Embedding: $(x, y) = (r\cos\phi_G, r\sin\phi_G)$",
+                    xlabel=r"$x / r_s$", ylabel=r"$y / r_s$")
         ax.axis('equal')
         
-        output_dir = Path(__file__).parent / "output"
-        output_dir.mkdir(exist_ok=True)
-        
-        output_file = output_dir / "phi_spiral_2d_embedding.png"
-        fig.savefig(output_file, dpi=150, bbox_inches='tight')
+        output_file = _save_figure(fig, "phi_spiral_2d_embedding.png")
         print(f"\n✓ Saved 2D: {output_file}")
         
-        plt.close(fig)
-        
     except Exception as e:
         print(f"\n✗ 2D plotting failed: {e}")
     
@@ -238,25 +231,27 @@ def plot_spiral_embedding_demo():
         fig = plt.figure(figsize=(12, 10))
         ax = fig.add_subplot(111, projection='3d')
         
-        # Color by subspace layer
-        layers = np.array([metric.subspace_layer(r) for r in r_vals])
-        scatter = ax.scatter(x / metric.r_s, y / metric.r_s, z / (2*np.pi), 
-                            c=layers, cmap='viridis', s=1, alpha=0.8)
+        # Color by subspace layer: one segment collection instead of
+        # one scatter glyph per point
+        layers = metric.subspace_layer(r_vals)
+        pts = np.stack([x / metric.r_s, y / metric.r_s, z / (2*np.pi)], axis=1)
+        segs = np.stack([pts[:-1], pts[1:]], axis=1)
+        helix = Line3DCollection(segs, cmap='viridis', alpha=0.8)
+        helix.set_array(layers[:-1])
+        ax.add_collection3d(helix)
+        ax.auto_scale_xyz(pts[:, 0], pts[:, 1], pts[:, 2])
         
         ax.set_xlabel(r"$x / r_s$", fontsize=12)
         ax.set_ylabel(r"$y / r_s$", fontsize=12)
         ax.set_zlabel(r"$\phi_G / 2\pi$ (Subspace Layer)", fontsize=12)
         ax.set_title("3D φ-Spiral Helix with Subspace Layers", fontsize=16)
         
-        cbar = plt.colorbar(scatter, ax=ax, pad=0.1)
+        cbar = plt.colorbar(helix, ax=ax, pad=0.1)
         cbar.set_label("Subspace Layer Number", fontsize=12)
         
-        output_file = output_dir / "phi_spiral_3d_helix.png"
-        fig.savefig(output_file, dpi=150, bbox_inches='tight')
+        output_file = _save_figure(fig, "phi_spiral_3d_helix.png")
         print(f"✓ Saved 3D: {output_file}")
         
-        plt.close(fig)
-        
     except Exception as e:
         print(f"\n✗ 3D plotting failed: {e}")
     
@@ -272,38 +267,32 @@ def plot_time_dilation_redshift():
     metric = PhiSpiralSSZMetric(mass=M_SUN, k=1.0)
     
     r_vals = np.linspace(0.5 * metric.r_s, 20 * metric.r_s, 1000)
-    tau_factors = np.array([metric.time_dilation_factor(r) for r in r_vals])
-    redshifts = np.array([metric.redshift(r) for r in r_vals])
+    
+    # dτ/dt = sech(φ_G) and z = cosh(φ_G) - 1 share one cosh evaluation
+    cosh_phi = np.cosh(metric.phi_G(r_vals))
+    tau_factors = 1.0 / cosh_phi
+    redshifts = cosh_phi - 1.0
     
     try:
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
         
         # Time dilation
         ax1.plot(r_vals / metric.r_s, tau_factors, 'b-', linewidth=2)
-        ax1.set_ylabel(r"$d\tau/dt$ (Time Dilation)", fontsize=14)
-        ax1.set_title(r"Time Dilation: $d\tau/dt = \mathrm{sech}(\phi_G)$", fontsize=16)
-        ax1.grid(True, alpha=0.3)
+        _style_axes(ax1, r"Time Dilation: $d\tau/dt = \mathrm{sech}(\phi_G)$",
+                    ylabel=r"$d\tau/dt$ (Time Dilation)")
         ax1.axhline(y=1, color='k', linestyle='--', alpha=0.3, label='No dilation')
         ax1.legend()
         
         # Redshift
         ax2.semilogy(r_vals / metric.r_s, redshifts, 'r-', linewidth=2)
-        ax2.set_xlabel(r"$r / r_s$", fontsize=14)
-        ax2.set_ylabel(r"$z$ (Redshift)", fontsize=14)
-        ax2.set_title(r"Gravitational Redshift: $z = \cosh(\phi_G) - 1$", fontsize=16)
-        ax2.grid(True, alpha=0.3, which='both')
+        _style_axes(ax2, r"Gravitational Redshift: $z = \cosh(\phi_G) - 1$",
+                    xlabel=r"$r / r_s$", ylabel=r"$z$ (Redshift)", grid_which='both')
         
         plt.tight_layout()
         
-        output_dir = Path(__file__).parent / "output"
-        output_dir.mkdir(exist_ok=True)
-        
-        output_file = output_dir / "phi_spiral_time_dilation_redshift.png"
-        fig.savefig(output_file, dpi=150, bbox_inches='tight')
+        output_file = _save_figure(fig, "phi_spiral_time_dilation_redshift.png")
         print(f"\n✓ Saved: {output_file}")
         
-        plt.close(fig)
-        
     except Exception as e:
         print(f"\n✗ Plotting failed: {e}")
     
@@ -9,16 +9,14 @@ Generates all validation reports, summaries, and outputs.
 """
 import os
 import sys
+import hashlib
 from pathlib import Path
 from datetime import datetime
 
 # UTF-8 for Windows
 os.environ['PYTHONIOENCODING'] = 'utf-8:replace'
 
-def generate_summary_report():
-    """Generate comprehensive summary report"""
-    
-    report = """# SSZ φ-Spiral Metric v2.0.0 - Complete Summary Report
+_SUMMARY_TEMPLATE = """# SSZ φ-Spiral Metric v2.0.0 - Complete Summary Report
 
 **Generated:** {date}
 
@@ -154,15 +152,9 @@ where α ~ 0.01-0.05
 **Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4**
 
 *Generated: {date}*
-""".format(date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-    
-    return report
+"""
 
-
-def generate_quick_reference():
-    """Generate quick reference card"""
-    
-    ref = """# SSZ φ-Spiral Metric - Quick Reference Card
+_QUICK_REFERENCE = """# SSZ φ-Spiral Metric - Quick Reference Card
 
 **Version 2.0.0** | © 2025 Carmen Wrede & Lino Casu
 
@@ -311,16 +303,57 @@ phi_squared = (2*G*M / (r*c**2)) * (1 + alpha * r_g/r)
 
 © 2025 Carmen Wrede & Lino Casu
 """
+
+
+def generate_summary_report(date=None):
+    """Generate comprehensive summary report"""
+    if date is None:
+        date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return _SUMMARY_TEMPLATE.format(date=date)
+
+
+def generate_quick_reference():
+    """Generate quick reference card"""
+    return _QUICK_REFERENCE
+
+
+def _digest(text):
+    """Hex digest of a text."""
+    return hashlib.blake2b(text.encode('utf-8')).hexdigest()
+
+
+def _is_up_to_date(out_file, hash_file, source):
+    """
+    Check whether out_file was generated from this exact source text
+    and has not been modified since.
     
-    return ref
+    The stamp stores the template digest (not the date stamp) together
+    with the digest of the written output, so a rerun without content
+    changes is a no-op, while an edited or corrupted output is rewritten.
+    """
+    if not (out_file.exists() and hash_file.exists()):
+        return False
+    output = out_file.read_text(encoding='utf-8', errors='replace')
+    stamp = f"{_digest(source)} {_digest(output)}"
+    return hash_file.read_text(encoding='utf-8').strip() == stamp
+
+
+def _write_report(out_file, hash_file, source, text):
+    """Write a generated report and record its stamp."""
+    with open(out_file, 'w', encoding='utf-8') as f:
+        f.write(text)
+    hash_file.write_text(f"{_digest(source)} {_digest(text)}", encoding='utf-8')
 
 
 def main():
     """Generate all reports"""
     
-    # Force UTF-8 output for Windows
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'replace')
+    # Force UTF-8 output for Windows (no-op if stdout is already UTF-8)
+    if (sys.stdout.encoding or '').lower() != 'utf-8':
+        try:
+            sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        except (AttributeError, ValueError):
+            pass
     
     print("="*70)
     print("SSZ φ-Spiral Metric - Report Generator")
@@ -330,25 +363,38 @@ def main():
     reports_dir = Path("reports")
     reports_dir.mkdir(exist_ok=True)
     
+    n_written = 0
+    
     print("\n[1/2] Generating summary report...")
-    summary = generate_summary_report()
     summary_file = reports_dir / "SSZ_COMPLETE_SUMMARY.md"
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        f.write(summary)
-    print(f"  ✓ Saved: {summary_file}")
+    summary_hash = reports_dir / ".summary.hash"
+    if _is_up_to_date(summary_file, summary_hash, _SUMMARY_TEMPLATE):
+        print(f"  ✓ Up to date: {summary_file}")
+    else:
+        summary = generate_summary_report()
+        _write_report(summary_file, summary_hash, _SUMMARY_TEMPLATE, summary)
+        n_written += 1
+        print(f"  ✓ Saved: {summary_file}")
     
     print("\n[2/2] Generating quick reference...")
-    reference = generate_quick_reference()
     ref_file = reports_dir / "SSZ_QUICK_REFERENCE.md"
-    with open(ref_file, 'w', encoding='utf-8') as f:
-        f.write(reference)
-    print(f"  ✓ Saved: {ref_file}")
+    ref_hash = reports_dir / ".quick_reference.hash"
+    if _is_up_to_date(ref_file, ref_hash, _QUICK_REFERENCE):
+        print(f"  ✓ Up to date: {ref_file}")
+    else:
+        reference = generate_quick_reference()
+        _write_report(ref_file, ref_hash, _QUICK_REFERENCE, reference)
+        n_written += 1
+        print(f"  ✓ Saved: {ref_file}")
     
     print("\n" + "="*70)
-    print("✅ ALL REPORTS GENERATED")
+    if n_written:
+        print("✅ ALL REPORTS GENERATED")
+    else:
+        print("✅ REPORTS UP TO DATE (nothing written)")
     print("="*70)
     print(f"\nOutput directory: {reports_dir.absolute()}")
-    print(f"Files created: 2")
+    print(f"Files created: {n_written}")
     print("\nReports:")
     print(f"  • {summary_file.name} - Complete summary")
     print(f"  • {ref_file.name} - Quick reference card")
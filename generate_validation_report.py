@@ -17,13 +17,14 @@ Based on Lino's validation & report specification
 """
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 import json
 
 # UTF-8 encoding
 os.environ['PYTHONIOENCODING'] = 'utf-8'
-if sys.platform.startswith('win'):
+if sys.platform.startswith('win') and (sys.stdout.encoding or '').lower() != 'utf-8':
     try:
         sys.stdout.reconfigure(encoding='utf-8', errors='replace')
     except:
@@ -37,250 +38,265 @@ from matplotlib.gridspec import GridSpec
 
 from ssz_metric_pure.ssz_calibrated import (
     SSZCalibratedMetric,
-    C_SI, G_SI,
+    G_SI,
     M_SUN, M_EARTH,
     R_SUN, R_EARTH
 )
 from ssz_metric_pure.ssz_validator import SSZConsistencyValidator
 
-print("\n" + "="*80)
-print("SSZ FULL METRIC VALIDATION & CONSISTENCY REPORT GENERATOR")
-print("="*80)
-print(f"\nTimestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+@lru_cache(maxsize=8)
+def get_metric(mass: float, name: str) -> SSZCalibratedMetric:
+    """Shared SSZCalibratedMetric per (mass, name); built once per process."""
+    return SSZCalibratedMetric(mass, name=name)
 
-# Create directories
-Path("reports/figures").mkdir(parents=True, exist_ok=True)
 
-# ============================================================================
-# VALIDATION FOR EARTH & SUN
-# ============================================================================
-
-metrics = {
-    'Earth': SSZCalibratedMetric(M_EARTH, name="Earth"),
-    'Sun': SSZCalibratedMetric(M_SUN, name="Sun")
-}
-
-results = {}
-
-for body_name, metric in metrics.items():
-    print(f"\n{'='*80}")
-    print(f"VALIDATING: {body_name}")
-    print(f"{'='*80}")
+def _plot_arrays(metric: SSZCalibratedMetric, r: np.ndarray) -> dict:
+    """
+    All radial profiles shown in the report plots, from one γ(r) pass.
     
-    # Run validator
-    validator = SSZConsistencyValidator(metric)
-    validation_results = validator.run_all_tests()
+    SSZ: g_TT/c² = -sech², g_rr = γ², dτ/dT = sech, V_eff/c² = sech².
+    GR:  g_tt/c² = -(1 - r_g/r), dτ/dt = √(1 - r_g/r).
+    """
+    gamma = metric.gamma(r)
+    sech = 1.0 / gamma
+    sech2 = sech * sech
     
-    # Generate certificate
-    cert = validator.generate_certificate(f"reports/SSZ_CERTIFICATE_{body_name.upper()}.txt")
+    g_tt_gr = -(1.0 - metric.r_g / r)
+    g_TT_over_c2 = -sech2
     
-    results[body_name] = {
-        'metric': metric,
-        'validator': validator,
-        'results': validation_results,
-        'certificate': cert
+    deviations = np.abs(g_TT_over_c2 - g_tt_gr)
+    deviations *= 100.0 / np.abs(g_tt_gr)
+    
+    return {
+        'closing_pct': (1.0 - sech2) * 100.0,
+        'g_TT_over_c2': g_TT_over_c2,
+        'g_rr': gamma * gamma,
+        'g_tt_gr': g_tt_gr,
+        'td_ssz': sech,
+        'td_gr': np.sqrt(-g_tt_gr),
+        'deviations': deviations,
+        'V_eff_norm': sech2,
     }
 
-# ============================================================================
-# GENERATE PLOTS
-# ============================================================================
-
-print("\n" + "="*80)
-print("GENERATING PLOTS")
-print("="*80)
-
-# Use Sun for plots (clearer effects)
-sun_metric = metrics['Sun']
-
-# Test radii
-r_factors = np.logspace(-0.5, 2, 200)  # 0.3 to 100 r_g
-r_test = r_factors * sun_metric.r_g
-
-# ============================================================================
-# PLOT 1 & 2: NULL GEODESICS
-# ============================================================================
-
-print("\n1. Null Geodesics...")
-
-fig1, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-
-# Outgoing
-r_null_out = np.linspace(sun_metric.r_g, 50 * sun_metric.r_g, 1000)
-T_null_out = sun_metric.T_of_r_null(r_null_out, method='trapz')
-
-ax1.plot(r_null_out / sun_metric.r_g, T_null_out, 'b-', lw=2, label='Outgoing')
-ax1.set_xlabel('r / r_g', fontsize=12)
-ax1.set_ylabel('T [s]', fontsize=12)
-ax1.set_title('Null Geodesics: T(r) - Outgoing', fontsize=14, fontweight='bold')
-ax1.grid(True, alpha=0.3)
-ax1.legend(fontsize=10)
-
-# Light cone closing
-phi_G_vals = np.array([sun_metric.phi_calibrated(r) for r in r_test])
-sech2_vals = 1.0 / (np.cosh(phi_G_vals) ** 2)
-dr_dT_norm = sech2_vals  # Normalized to c
-closing_pct = (1.0 - sech2_vals) * 100.0
-
-ax2.plot(r_factors, closing_pct, 'r-', lw=2)
-ax2.set_xlabel('r / r_g', fontsize=12)
-ax2.set_ylabel('Light Cone Closing [%]', fontsize=12)
-ax2.set_title('Light Cone Closing', fontsize=14, fontweight='bold')
-ax2.set_xscale('log')
-ax2.grid(True, alpha=0.3)
-ax2.axhline(50, color='gray', ls='--', alpha=0.5, label='50% closed')
-ax2.axhline(90, color='gray', ls=':', alpha=0.5, label='90% closed')
-ax2.legend(fontsize=10)
-
-plt.tight_layout()
-plt.savefig('reports/figures/null_geodesics.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# ============================================================================
-# PLOT 3 & 4: METRIC COMPONENTS & TIME DILATION
-# ============================================================================
-
-print("2. Metric Components & Time Dilation...")
-
-fig2, (ax3, ax4) = plt.subplots(1, 2, figsize=(14, 5))
-
-# Metric components
-g_TT_vals = np.array([sun_metric.metric_diag(r)[0] / (C_SI ** 2) for r in r_test])
-g_rr_vals = np.array([sun_metric.metric_diag(r)[1] for r in r_test])
-
-# GR comparison
-g_tt_gr = -(1.0 - sun_metric.r_g / r_test)
-
-ax3.plot(r_factors, g_TT_vals, 'b-', lw=2, label='SSZ g_TT/c²')
-ax3.plot(r_factors, g_tt_gr, 'r--', lw=2, label='GR g_tt/c²', alpha=0.7)
-ax3.set_xlabel('r / r_g', fontsize=12)
-ax3.set_ylabel('g_TT / c²', fontsize=12)
-ax3.set_title('Time Component: SSZ vs GR', fontsize=14, fontweight='bold')
-ax3.set_xscale('log')
-ax3.grid(True, alpha=0.3)
-ax3.legend(fontsize=10)
-ax3.axhline(-1, color='k', ls=':', alpha=0.3, label='Minkowski')
-
-# Time dilation
-td_ssz = np.array([sun_metric.time_dilation(r) for r in r_test])
-td_gr = np.sqrt(1.0 - sun_metric.r_g / r_test)
-
-ax4.plot(r_factors, td_ssz, 'b-', lw=2, label='SSZ dτ/dT')
-ax4.plot(r_factors, td_gr, 'r--', lw=2, label='GR dτ/dt', alpha=0.7)
-ax4.set_xlabel('r / r_g', fontsize=12)
-ax4.set_ylabel('Time Dilation Factor', fontsize=12)
-ax4.set_title('Time Dilation: SSZ vs GR', fontsize=14, fontweight='bold')
-ax4.set_xscale('log')
-ax4.grid(True, alpha=0.3)
-ax4.legend(fontsize=10)
-
-plt.tight_layout()
-plt.savefig('reports/figures/metric_and_dilation.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# ============================================================================
-# PLOT 5 & 6: DEVIATIONS & EFFECTIVE POTENTIAL
-# ============================================================================
-
-print("3. Deviations & Effective Potential...")
-
-fig3, (ax5, ax6) = plt.subplots(1, 2, figsize=(14, 5))
-
-# Deviations from GR
-deviations = 100 * np.abs(g_TT_vals - g_tt_gr) / np.abs(g_tt_gr)
-
-ax5.semilogy(r_factors, deviations, 'purple', lw=2)
-ax5.set_xlabel('r / r_g', fontsize=12)
-ax5.set_ylabel('|SSZ - GR| / |GR| [%]', fontsize=12)
-ax5.set_title('Deviation from GR', fontsize=14, fontweight='bold')
-ax5.axhline(0.1, color='green', ls='--', alpha=0.5, label='0.1% threshold')
-ax5.axhline(1.0, color='orange', ls='--', alpha=0.5, label='1% threshold')
-ax5.grid(True, alpha=0.3)
-ax5.legend(fontsize=10)
-
-# Effective potential
-V_eff_norm = sech2_vals
-
-ax6.plot(r_factors, V_eff_norm, 'brown', lw=2)
-ax6.set_xlabel('r / r_g', fontsize=12)
-ax6.set_ylabel('V_eff / c²', fontsize=12)
-ax6.set_title('Effective Potential', fontsize=14, fontweight='bold')
-ax6.set_xscale('log')
-ax6.grid(True, alpha=0.3)
-ax6.axhline(1.0, color='k', ls=':', alpha=0.3, label='c²')
-
-plt.tight_layout()
-plt.savefig('reports/figures/deviations_and_potential.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-print("\n✅ All plots generated in reports/figures/")
-
-# ============================================================================
-# GENERATE JSON CERTIFICATE
-# ============================================================================
-
-print("\n" + "="*80)
-print("GENERATING JSON CERTIFICATE")
-print("="*80)
-
-certificate_data = {
-    "metric": "φ-Spiral SSZ (Calibrated)",
-    "calibration": "φ²_G = 2GM/(rc²)",
-    "timestamp": datetime.now().isoformat(),
-    "bodies_tested": ["Earth", "Sun"],
-    "tests": {
-        "metric_compatible": all(
-            '✅' in results[body]['results']['covariance']['status']
-            for body in ['Earth', 'Sun']
-        ),
-        "asymptotic_flatness": all(
-            '✅' in results[body]['results']['asymptotic_flatness']['status']
-            for body in ['Earth', 'Sun']
-        ),
-        "singularity_free": all(
-            '✅' in results[body]['results']['singularity_free']['status']
-            for body in ['Earth', 'Sun']
-        ),
-        "energy_conserved": all(
-            '✅' in results[body]['results']['energy_conservation']['status']
-            for body in ['Earth', 'Sun']
-        ),
-        "causality": all(
-            '✅' in results[body]['results']['causality']['status']
-            for body in ['Earth', 'Sun']
-        ),
-        "gps_validated": '✅' in results['Earth']['results']['gps_agreement']['status']
-    },
-    "numerical_values": {
-        "Earth": {
-            "metric_compatibility_error": results['Earth']['results']['covariance']['relative_difference'],
-            "gps_error": results['Earth']['results']['gps_agreement']['relative_error'],
-            "asymptotic_error_g_TT": results['Earth']['results']['asymptotic_flatness']['error_g_TT'],
-            "asymptotic_error_g_rr": results['Earth']['results']['asymptotic_flatness']['error_g_rr']
-        },
-        "Sun": {
-            "metric_compatibility_error": results['Sun']['results']['covariance']['relative_difference'],
-            "gps_error": results['Sun']['results']['gps_agreement']['relative_error'],
-            "asymptotic_error_g_TT": results['Sun']['results']['asymptotic_flatness']['error_g_TT'],
-            "asymptotic_error_g_rr": results['Sun']['results']['asymptotic_flatness']['error_g_rr']
+
+def main():
+    print("\n" + "="*80)
+    print("SSZ FULL METRIC VALIDATION & CONSISTENCY REPORT GENERATOR")
+    print("="*80)
+    print(f"\nTimestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    # Create directories
+    Path("reports/figures").mkdir(parents=True, exist_ok=True)
+
+    # ============================================================================
+    # VALIDATION FOR EARTH & SUN
+    # ============================================================================
+
+    metrics = {
+        'Earth': get_metric(M_EARTH, "Earth"),
+        'Sun': get_metric(M_SUN, "Sun")
+    }
+
+    results = {}
+
+    for body_name, metric in metrics.items():
+        print(f"\n{'='*80}")
+        print(f"VALIDATING: {body_name}")
+        print(f"{'='*80}")
+        
+        # Run validator
+        validator = SSZConsistencyValidator(metric)
+        validation_results = validator.run_all_tests()
+        
+        # Generate certificate
+        cert = validator.generate_certificate(f"reports/SSZ_CERTIFICATE_{body_name.upper()}.txt")
+        
+        results[body_name] = {
+            'metric': metric,
+            'validator': validator,
+            'results': validation_results,
+            'certificate': cert
         }
-    },
-    "conclusion": "SSZ metric confirmed as fully metric-compatible, asymptotically flat, singularity-free, and experimentally consistent."
-}
 
-with open('reports/ssz_validation_certificate.json', 'w', encoding='utf-8') as f:
-    json.dump(certificate_data, f, indent=2, ensure_ascii=False)
+    # ============================================================================
+    # GENERATE PLOTS
+    # ============================================================================
+
+    print("\n" + "="*80)
+    print("GENERATING PLOTS")
+    print("="*80)
+
+    # Use Sun for plots (clearer effects)
+    sun_metric = metrics['Sun']
+
+    rg = sun_metric.r_g  # Looked up once for all plots below
+
+    # Test radii
+    r_factors = np.logspace(-0.5, 2, 200)  # 0.3 to 100 r_g
+    r_test = r_factors * rg
+    profiles = _plot_arrays(sun_metric, r_test)
+
+    # ============================================================================
+    # PLOT 1 & 2: NULL GEODESICS
+    # ============================================================================
+
+    print("\n1. Null Geodesics...")
+
+    fig1, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Outgoing (log-spaced: dense near r_g where γ² varies, sparse far out)
+    r_null_out = rg * np.logspace(0, np.log10(50), 200)
+    T_null_out = sun_metric.T_of_r_null(r_null_out, method='trapz')
+
+    ax1.plot(r_null_out / rg, T_null_out, 'b-', lw=2, label='Outgoing')
+    ax1.set_xlabel('r / r_g', fontsize=12)
+    ax1.set_ylabel('T [s]', fontsize=12)
+    ax1.set_title('Null Geodesics: T(r) - Outgoing', fontsize=14, fontweight='bold')
+    ax1.grid(True, alpha=0.3)
+    ax1.legend(fontsize=10)
+
+    # Light cone closing
+    ax2.plot(r_factors, profiles['closing_pct'], 'r-', lw=2)
+    ax2.set_xlabel('r / r_g', fontsize=12)
+    ax2.set_ylabel('Light Cone Closing [%]', fontsize=12)
+    ax2.set_title('Light Cone Closing', fontsize=14, fontweight='bold')
+    ax2.set_xscale('log')
+    ax2.grid(True, alpha=0.3)
+    ax2.axhline(50, color='gray', ls='--', alpha=0.5, label='50% closed')
+    ax2.axhline(90, color='gray', ls=':', alpha=0.5, label='90% closed')
+    ax2.legend(fontsize=10)
+
+    plt.tight_layout()
+    plt.savefig('reports/figures/null_geodesics.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+    # ============================================================================
+    # PLOT 3 & 4: METRIC COMPONENTS & TIME DILATION
+    # ============================================================================
+
+    print("2. Metric Components & Time Dilation...")
+
+    fig2, (ax3, ax4) = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Metric components vs GR
+    ax3.plot(r_factors, profiles['g_TT_over_c2'], 'b-', lw=2, label='SSZ g_TT/c²')
+    ax3.plot(r_factors, profiles['g_tt_gr'], 'r--', lw=2, label='GR g_tt/c²', alpha=0.7)
+    ax3.set_xlabel('r / r_g', fontsize=12)
+    ax3.set_ylabel('g_TT / c²', fontsize=12)
+    ax3.set_title('Time Component: SSZ vs GR', fontsize=14, fontweight='bold')
+    ax3.set_xscale('log')
+    ax3.grid(True, alpha=0.3)
+    ax3.legend(fontsize=10)
+    ax3.axhline(-1, color='k', ls=':', alpha=0.3, label='Minkowski')
+
+    # Time dilation
+    ax4.plot(r_factors, profiles['td_ssz'], 'b-', lw=2, label='SSZ dτ/dT')
+    ax4.plot(r_factors, profiles['td_gr'], 'r--', lw=2, label='GR dτ/dt', alpha=0.7)
+    ax4.set_xlabel('r / r_g', fontsize=12)
+    ax4.set_ylabel('Time Dilation Factor', fontsize=12)
+    ax4.set_title('Time Dilation: SSZ vs GR', fontsize=14, fontweight='bold')
+    ax4.set_xscale('log')
+    ax4.grid(True, alpha=0.3)
+    ax4.legend(fontsize=10)
+
+    plt.tight_layout()
+    plt.savefig('reports/figures/metric_and_dilation.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+    # ============================================================================
+    # PLOT 5 & 6: DEVIATIONS & EFFECTIVE POTENTIAL
+    # ============================================================================
+
+    print("3. Deviations & Effective Potential...")
+
+    fig3, (ax5, ax6) = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Deviations from GR
+    ax5.semilogy(r_factors, profiles['deviations'], 'purple', lw=2)
+    ax5.set_xlabel('r / r_g', fontsize=12)
+    ax5.set_ylabel('|SSZ - GR| / |GR| [%]', fontsize=12)
+    ax5.set_title('Deviation from GR', fontsize=14, fontweight='bold')
+    ax5.axhline(0.1, color='green', ls='--', alpha=0.5, label='0.1% threshold')
+    ax5.axhline(1.0, color='orange', ls='--', alpha=0.5, label='1% threshold')
+    ax5.grid(True, alpha=0.3)
+    ax5.legend(fontsize=10)
+
+    # Effective potential
+    ax6.plot(r_factors, profiles['V_eff_norm'], 'brown', lw=2)
+    ax6.set_xlabel('r / r_g', fontsize=12)
+    ax6.set_ylabel('V_eff / c²', fontsize=12)
+    ax6.set_title('Effective Potential', fontsize=14, fontweight='bold')
+    ax6.set_xscale('log')
+    ax6.grid(True, alpha=0.3)
+    ax6.axhline(1.0, color='k', ls=':', alpha=0.3, label='c²')
+
+    plt.tight_layout()
+    plt.savefig('reports/figures/deviations_and_potential.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+    print("\n✅ All plots generated in reports/figures/")
+
+    # ============================================================================
+    # GENERATE JSON CERTIFICATE
+    # ============================================================================
+
+    print("\n" + "="*80)
+    print("GENERATING JSON CERTIFICATE")
+    print("="*80)
+
+    # Certificate key -> validator test that must pass for every body
+    bodies = ['Earth', 'Sun']
+    passed_by_all = {
+        "metric_compatible": 'covariance',
+        "asymptotic_flatness": 'asymptotic_flatness',
+        "singularity_free": 'singularity_free',
+        "energy_conserved": 'energy_conservation',
+        "causality": 'causality',
+    }
 
-print("\n✅ JSON certificate saved to: reports/ssz_validation_certificate.json")
+    certificate_data = {
+        "metric": "φ-Spiral SSZ (Calibrated)",
+        "calibration": "φ²_G = 2GM/(rc²)",
+        "timestamp": datetime.now().isoformat(),
+        "bodies_tested": bodies,
+        "tests": {
+            **{
+                key: all('✅' in results[body]['results'][test]['status'] for body in bodies)
+                for key, test in passed_by_all.items()
+            },
+            "gps_validated": '✅' in results['Earth']['results']['gps_agreement']['status']
+        },
+        "numerical_values": {
+            "Earth": {
+                "metric_compatibility_error": results['Earth']['results']['covariance']['relative_difference'],
+                "gps_error": results['Earth']['results']['gps_agreement']['relative_error'],
+                "asymptotic_error_g_TT": results['Earth']['results']['asymptotic_flatness']['error_g_TT'],
+                "asymptotic_error_g_rr": results['Earth']['results']['asymptotic_flatness']['error_g_rr']
+            },
+            "Sun": {
+                "metric_compatibility_error": results['Sun']['results']['covariance']['relative_difference'],
+                "gps_error": results['Sun']['results']['gps_agreement']['relative_error'],
+                "asymptotic_error_g_TT": results['Sun']['results']['asymptotic_flatness']['error_g_TT'],
+                "asymptotic_error_g_rr": results['Sun']['results']['asymptotic_flatness']['error_g_rr']
+            }
+        },
+        "conclusion": "SSZ metric confirmed as fully metric-compatible, asymptotically flat, singularity-free, and experimentally consistent."
+    }
 
-# ============================================================================
-# PRINT FINAL SUMMARY
-# ============================================================================
+    with open('reports/ssz_validation_certificate.json', 'w', encoding='utf-8') as f:
+        json.dump(certificate_data, f, indent=2, ensure_ascii=False)
 
-print("\n" + "="*80)
-print("FINAL VALIDATION SUMMARY")
-print("="*80)
+    print("\n✅ JSON certificate saved to: reports/ssz_validation_certificate.json")
 
-print(f"""
+    # ============================================================================
+    # PRINT FINAL SUMMARY
+    # ============================================================================
+
+    print("\n" + "="*80)
+    print("FINAL VALIDATION SUMMARY")
+    print("="*80)
+
+    print(f"""
 BODIES TESTED: Earth, Sun
 
 TEST RESULTS:
@@ -312,10 +328,14 @@ CONCLUSION:
 {certificate_data['conclusion']}
 """)
 
-print("\n" + "="*80)
-print("✅ SSZ VALIDATION COMPLETE — Metric fully consistent.")
-print("   GR-limit preserved, curvature regular, light cone closure confirmed.")
-print("="*80 + "\n")
+    print("\n" + "="*80)
+    print("✅ SSZ VALIDATION COMPLETE — Metric fully consistent.")
+    print("   GR-limit preserved, curvature regular, light cone closure confirmed.")
+    print("="*80 + "\n")
+
+    print("© 2025 Carmen Wrede & Lino Casu")
+    print("Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4\n")
+
 
-print("© 2025 Carmen Wrede & Lino Casu")
-print("Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4\n")
+if __name__ == "__main__":
+    main()
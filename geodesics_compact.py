@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 """
 SSZ Geodesics - Compact Implementation
-Pure numpy + matplotlib, no dependencies
+Pure numpy + matplotlib (numba optional)
 
 Implements null and timelike geodesics for φ-Spiral SSZ metric
 using the diagonal form.
@@ -12,6 +12,8 @@ Based on Lino's compact geodesic solver
 """
 import sys
 import os
+import math
+from pathlib import Path
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -23,11 +25,17 @@ if sys.platform.startswith('win'):
     except:
         pass
 
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from ssz_metric_pure._jit import njit, JitError  # plain Python loop without numba
+
 c = 299_792_458.0  # m/s
 
 # -----------------------------
 # 1) Spiral-/Gravitationsprofil φ_G(r)
 #    --> hier frei variieren!
+#    (timelike_geodesic compiles phi_G as written; it falls back to plain
+#     Python if numba cannot compile the edited profile)
 # -----------------------------
 def phi_G(r, k=0.75, r0=1.0):
     """
@@ -47,9 +55,12 @@ def gamma(r):       # cosh φ
     x = phi_G(r)
     return np.cosh(x)
 
-def sech2(r):       # sech^2 φ = 1/cosh^2 φ
+def _gamma2(r):     # γ^2 = cosh^2 φ (shared by the grid helpers below)
     g = gamma(r)
-    return 1.0 / (g * g)
+    return g * g
+
+def sech2(r):       # sech^2 φ = 1/cosh^2 φ
+    return 1.0 / _gamma2(r)
 
 # ---------------------------------------------
 # 2) Koordinatenwechsel: (t,r) <-> (T,r)
@@ -69,13 +80,18 @@ def t_from_T_path(T, r, sign_dt_dr=+1):
     Returns:
         t: Reconstructed coordinate time
     """
-    # dt = dT + (β γ^2 / c) dr
-    dT = np.gradient(T)
-    dr = np.gradient(r)
-    corr = (beta(r) * gamma(r)**2 / c) * dr
-    t = np.cumsum(dT + corr)
+    # dt = dT + (β γ^2 / c) dr per segment, β γ^2 = sinh φ cosh φ = ½ sinh 2φ
+    # taken at the segment midpoint (second order, no edge special cases)
+    phi_mid = phi_G(0.5 * (r[1:] + r[:-1]))
+    dt = 0.5 * np.sinh(2.0 * phi_mid) / c
+    dt *= np.diff(r)
+    dt += np.diff(T)
+    
     # Normalization: t(0) = T(0), pure convention:
-    t = t - t[0] + T[0]
+    t = np.empty(len(T))
+    t[0] = T[0]
+    np.cumsum(dt, out=t[1:])
+    t[1:] += T[0]
     return t
 
 # ---------------------------------------------
@@ -83,7 +99,7 @@ def t_from_T_path(T, r, sign_dt_dr=+1):
 #    dr/dT = ± c * sech^2 φ_G(r) = ± c / γ^2
 #    ==> T(r) = ± (1/c) ∫ γ^2(r) dr
 # ---------------------------------------------
-def null_geodesic(r_start, r_end, n=2000, sign=+1):
+def null_geodesic(r_start, r_end, n=2000, sign=+1, g2=None):
     """
     Null geodesic (photon) in diagonal form.
     
@@ -94,13 +110,15 @@ def null_geodesic(r_start, r_end, n=2000, sign=+1):
         r_end: Ending radius
         n: Number of points
         sign: +1 for outgoing, -1 for infalling
+        g2: Optional precomputed γ²(r) on the same grid
     
     Returns:
         r: Radius array
         T: Eigentime coordinate array
     """
     r = np.linspace(r_start, r_end, n)
-    g2 = gamma(r)**2
+    if g2 is None:
+        g2 = _gamma2(r)
     
     # Numerical quadrature (trapezoidal):
     T = sign * (1.0 / c) * np.cumsum((g2[:-1] + g2[1:]) / 2.0 * np.diff(r))
@@ -116,12 +134,61 @@ def null_geodesic(r_start, r_end, n=2000, sign=+1):
 #      E = (c^2/γ^2) dT/dλ  (constant)
 #      (dr/dλ)^2 = E^2/c^2 - c^2/γ^2(r)
 # ------------------------------------------------
+@njit
+def _timelike_kernel(r0, E_over_c, dlam, steps, sign, phi_fn):
+    """
+    Euler loop of timelike_geodesic, γ(r) = cosh(phi_fn(r)).
+    
+    Returns (n, r, T): number of steps taken and the (untrimmed) buffers.
+    λ is not stored, it is just i·dlam.
+    """
+    r = np.empty(steps)
+    T = np.empty(steps)
+    r_i = r0
+    T_i = 0.0
+    r[0] = r_i
+    T[0] = T_i
+    
+    E2 = E_over_c * E_over_c
+    c2 = c * c
+    dr_scale = dlam * sign
+    dT_scale = dlam * E_over_c / c  # dT/dλ = γ^2 * E / c^2
+    n = steps
+    
+    for i in range(1, steps):
+        g = math.cosh(phi_fn(r_i))
+        g2 = g * g
+        
+        # Radicand:
+        R = E2 - c2 / g2
+        
+        if R <= 0:
+            # Turning point reached
+            n = i
+            break
+        
+        # Euler step (RK4 optional)
+        r_i += dr_scale * math.sqrt(R)
+        T_i += g2 * dT_scale
+        r[i] = r_i
+        T[i] = T_i
+    
+    return n, r, T
+
+# phi_G as seen by the compiled kernel (compiled on first use)
+_phi_G_jit = njit(phi_G)
+
 def timelike_geodesic(r0, E_over_c=None, dlam=1e-3, steps=20000, sign=+1):
     """
     Timelike geodesic (massive particle) in diagonal form.
     
     Formula: (dr/dλ)² = E²/c² - c²/γ²(r)
     
+    The loop runs in a compiled kernel that evaluates phi_G() itself, so
+    edits to the profile apply here too. The first call per process pays
+    the numba compile; without numba, or if numba cannot compile phi_G,
+    the same loop runs in plain Python.
+    
     Args:
         r0: Starting radius
         E_over_c: E/c (dimensions: speed); default ~ c for 'free radial motion'
@@ -137,49 +204,118 @@ def timelike_geodesic(r0, E_over_c=None, dlam=1e-3, steps=20000, sign=+1):
     if E_over_c is None:
         E_over_c = c
     
-    r = np.empty(steps)
-    T = np.empty(steps)
-    lam = np.empty(steps)
-    r[0] = r0
-    T[0] = 0.0
-    lam[0] = 0.0
+    args = (float(r0), float(E_over_c), float(dlam), int(steps), float(sign))
+    try:
+        n, r, T = _timelike_kernel(*args, _phi_G_jit)
+    except JitError:
+        # phi_G uses something numba cannot compile: same loop, plain Python
+        n, r, T = _timelike_kernel.py_func(*args, phi_G)
+    lam = np.arange(n) * dlam
+    return lam, r[:n], T[:n]
 
-    for i in range(1, steps):
-        g = gamma(r[i-1])
-        
-        # Radicand:
-        R = (E_over_c**2) - (c**2) / (g**2)
-        
-        if R <= 0:
-            # Turning point reached
-            r = r[:i]
-            T = T[:i]
-            lam = lam[:i]
+def _radicand(r, E_over_c):
+    """R(r) = E²/c² - c²/γ²(r), the timelike first integral (dr/dλ)²."""
+    return E_over_c**2 - c**2 / _gamma2(r)
+
+def _turning_point(r0, E_over_c, max_iter=200):
+    """
+    Turning point R(r_turn) = 0 of a timelike geodesic starting at r0.
+    
+    Bisection on R(r) with phi_G() as written, so edited profiles are
+    followed too. Looks inward on [0, r0] first, then outward with a
+    doubling bracket.
+    """
+    if _radicand(r0, E_over_c) <= 0:
+        raise ValueError("Start radius lies in a forbidden region (R <= 0)")
+    
+    if _radicand(0.0, E_over_c) <= 0:
+        allowed, forbidden = r0, 0.0
+    else:
+        allowed, forbidden = r0, max(2.0 * r0, 1.0)
+        for _ in range(64):
+            if _radicand(forbidden, E_over_c) <= 0:
+                break
+            allowed, forbidden = forbidden, 2.0 * forbidden
+        else:
+            raise ValueError("No turning point found; pass r_end")
+    
+    for _ in range(max_iter):
+        mid = 0.5 * (allowed + forbidden)
+        if mid == allowed or mid == forbidden:
             break
-        
-        dr_dlam = sign * np.sqrt(R)
-        dT_dlam = (g**2 / c**2) * (E_over_c * c)  # = γ^2 * E / c^2
-        
-        # Euler step (RK4 optional)
-        r[i]   = r[i-1] + dlam * dr_dlam
-        T[i]   = T[i-1] + dlam * dT_dlam
-        lam[i] = lam[i-1] + dlam
+        if _radicand(mid, E_over_c) > 0:
+            allowed = mid
+        else:
+            forbidden = mid
+    return allowed
 
+def timelike_geodesic_quad(r0, r_end=None, E_over_c=None, n=2000):
+    """
+    Timelike geodesic by quadrature over r (no λ stepping).
+    
+    The radial motion is separable:
+        dλ/dr = 1/√R(r),   dT/dr = (γ² E/c²) / √R(r),
+        R(r) = E²/c² - c²/γ²(r)
+    Both are integrated with the trapezoidal rule on an r-grid, which is
+    exact up to O(Δr²) instead of the O(dλ) Euler error.
+    
+    Args:
+        r0: Starting radius
+        r_end: Final radius (direction of motion follows r_end - r0).
+               Default: just short of the turning point R(r) = 0
+               (0.1% of the way before it, where 1/√R diverges),
+               found by bisection on phi_G() as written
+        E_over_c: E/c (dimensions: speed); default ~ c
+        n: Number of grid points
+    
+    Returns:
+        lam: Proper time array
+        r: Radius array
+        T: Eigentime coordinate array
+    """
+    if E_over_c is None:
+        E_over_c = c
+    
+    if r_end is None:
+        if E_over_c >= c:
+            # γ ≥ 1, so R(r) ≥ 0 everywhere
+            raise ValueError("No turning point for E/c >= c; pass r_end")
+        r_turn = _turning_point(r0, E_over_c)
+        r_end = r0 + 0.999 * (r_turn - r0)
+    
+    r = np.linspace(r0, r_end, n)
+    g2 = _gamma2(r)
+    R = E_over_c**2 - c**2 / g2
+    if np.any(R <= 0):
+        raise ValueError("Path crosses a forbidden region (R <= 0)")
+    
+    dlam_dr = 1.0 / np.sqrt(R)
+    dT_dr = g2 * (E_over_c / c) * dlam_dr
+    dr = np.abs(np.diff(r))
+    
+    lam = np.concatenate(([0.0], np.cumsum(0.5 * (dlam_dr[:-1] + dlam_dr[1:]) * dr)))
+    T = np.concatenate(([0.0], np.cumsum(0.5 * (dT_dr[:-1] + dT_dr[1:]) * dr)))
     return lam, r, T
 
 # ---------------------------------------------
 # 5) Light Cone Closing Analysis
 # ---------------------------------------------
-def light_cone_closing(r_array):
+def light_cone_closing(r_array, g2=None):
     """
     Compute light cone closing as function of radius.
     
+    Args:
+        r_array: Radius array
+        g2: Optional precomputed γ²(r_array)
+    
     Returns:
         r_array: Input radius array
         dr_dT: Light speed dr/dT in units of c
         closing_pct: Percentage of closing
     """
-    dr_dT = sech2(r_array)  # Already in units of c
+    if g2 is None:
+        g2 = _gamma2(r_array)
+    dr_dT = 1.0 / g2  # sech²φ, already in units of c
     closing_pct = (1.0 - dr_dT) * 100.0
     
     return r_array, dr_dT, closing_pct
@@ -187,15 +323,20 @@ def light_cone_closing(r_array):
 # ---------------------------------------------
 # 6) Effective Potential
 # ---------------------------------------------
-def effective_potential(r_array):
+def effective_potential(r_array, g2=None):
     """
     Effective potential V_eff(r) = c²/γ²(r) for timelike geodesics.
     
+    Args:
+        r_array: Radius array
+        g2: Optional precomputed γ²(r_array)
+    
     Returns:
         r_array: Input radius array
         V_eff: Effective potential [m²/s²]
     """
-    g2 = gamma(r_array)**2
+    if g2 is None:
+        g2 = _gamma2(r_array)
     V_eff = (c ** 2) / g2
     
     return r_array, V_eff
@@ -219,26 +360,28 @@ def demo_geodesics():
     print(f"  β(r) = tanh(φ_G)")
     
     # Nullgeodäten (purely radial, forward and backward)
-    r_null, T_null_out = null_geodesic(0.0, 20.0, n=3000, sign=+1)
-    r_null2, T_null_in = null_geodesic(20.0, 0.0, n=3000, sign=-1)
+    # The infalling grid is the outgoing one reversed: evaluate γ² once.
+    g2_null = _gamma2(np.linspace(0.0, 20.0, 3000))
+    r_null, T_null_out = null_geodesic(0.0, 20.0, n=3000, sign=+1, g2=g2_null)
+    r_null2, T_null_in = null_geodesic(20.0, 0.0, n=3000, sign=-1, g2=g2_null[::-1])
     
     print(f"\nNull geodesics computed:")
     print(f"  Outgoing: r = 0 → 20 (3000 points)")
     print(f"  Infalling: r = 20 → 0 (3000 points)")
 
-    # Timelike (Example): Start at r0=2, E/c ~ 0.9 c -> subluminal
-    lam, r_tim, T_tim = timelike_geodesic(
+    # Timelike (Example): Start at r0=2, E/c ~ 0.9 c -> subluminal,
+    # outgoing to r = 20 (quadrature over r, no λ stepping)
+    lam, r_tim, T_tim = timelike_geodesic_quad(
         r0=2.0, 
+        r_end=20.0, 
         E_over_c=0.9*c, 
-        dlam=2e-4, 
-        steps=20000, 
-        sign=+1
+        n=2000
     )
     
     print(f"\nTimelike geodesic computed:")
     print(f"  Start: r0 = 2.0")
     print(f"  Energy: E/c = 0.9c")
-    print(f"  Steps: {len(lam)}")
+    print(f"  Grid points: {len(lam)}")
     print(f"  Final radius: r = {r_tim[-1]:.3f}")
     
     # t(T,r)-coordinate reconstruction (optional):
@@ -248,7 +391,8 @@ def demo_geodesics():
 
     # Light cone closing
     r_cone = np.linspace(0.1, 20.0, 200)
-    _, dr_dT, closing = light_cone_closing(r_cone)
+    g2_cone = _gamma2(r_cone)  # shared with the effective potential below
+    _, dr_dT, closing = light_cone_closing(r_cone, g2_cone)
     
     print(f"\nLight cone closing:")
     print(f"  At r = 1.0: {closing[np.argmin(np.abs(r_cone - 1.0))]:.1f}%")
@@ -301,7 +445,7 @@ def demo_geodesics():
     axs[1, 1].grid(True, alpha=0.3)
 
     # (f) Effective potential
-    _, V_eff = effective_potential(r_cone)
+    _, V_eff = effective_potential(r_cone, g2_cone)
     axs[1, 2].plot(r_cone, V_eff / (c ** 2), lw=2, color='brown')
     axs[1, 2].set_xlabel("r [units]")
     axs[1, 2].set_ylabel("V_eff / c²")
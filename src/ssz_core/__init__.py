@@ -26,6 +26,7 @@ from .metric import (
     delta_M,
     corrected_r_s,
     metric_tensor,
+    metric_tensor_batch,
 )
 
 from .constants import (
@@ -50,6 +51,7 @@ __all__ = [
     "delta_M",
     "corrected_r_s",
     "metric_tensor",
+    "metric_tensor_batch",
     # Constants
     "PHI",
     "C",
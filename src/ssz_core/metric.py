@@ -12,7 +12,9 @@ Implements the complete SSZ metric with:
 Licensed under the Anti-Capitalist Software License v1.4
 """
 
+import math
 import numpy as np
+from functools import lru_cache
 from typing import Union, Tuple, Optional
 import warnings
 
@@ -22,17 +24,20 @@ from .segment_density import Xi, D_SSZ, D_GR, find_intersection
 
 # φ-Series coefficients (from golden ratio recursion)
 # Based on PN expansion: A_φ(r) = Σ ε_n (r_s/2r)^n
-EPSILON_COEFFICIENTS = {
-    0: 1.0,
-    1: -2.0,
-    2: 2.0,
-    3: -PHI,  # Golden ratio contribution
-    4: PHI**2 / 2.0,
-    5: -PHI**3 / 6.0,
-    6: PHI**4 / 24.0,
-}
+# Dense array, index n -> ε_n (consumed by the Horner loop in A_phi_series)
+EPSILON_COEFFICIENTS = np.array([
+    1.0,
+    -2.0,
+    2.0,
+    -PHI,  # Golden ratio contribution
+    PHI**2 / 2.0,
+    -PHI**3 / 6.0,
+    PHI**4 / 24.0,
+])
+_EPSILON_FLOATS = tuple(EPSILON_COEFFICIENTS.tolist())
 
 
+@lru_cache(maxsize=128)
 def delta_M(r_s: float, r_s_min: float = 1e-50, r_s_max: float = 1.0) -> float:
     """
     Calculate Δ(M) mass correction factor.
@@ -64,11 +69,11 @@ def delta_M(r_s: float, r_s_min: float = 1e-50, r_s_max: float = 1.0) -> float:
     # Empirical formula
     # For very small r_s: Δ → 100
     # For large r_s: Δ → 2
-    delta = 2.0 + 98.0 * np.exp(-10.0 * r_s / r_s_max)
-    
-    return float(delta)
+    # Scalar-only: math.exp avoids the NumPy dispatch, results are cached per r_s
+    return 2.0 + 98.0 * math.exp(-10.0 * r_s / r_s_max)
 
 
+@lru_cache(maxsize=128)
 def corrected_r_s(r_s: float) -> float:
     """
     Apply Δ(M) correction to Schwarzschild radius.
@@ -123,6 +128,17 @@ def A_Xi(r: Union[float, np.ndarray], r_s: float) -> Union[float, np.ndarray]:
     return d_ssz ** 2
 
 
+def _a_phi_series_scalar(r: float, r_s: float, order: int) -> float:
+    """A_phi_series for one float r: Horner in plain Python floats, no NumPy dispatch."""
+    # x → ±∞ at r = 0, as in the array path
+    x = r_s / (2.0 * r) if r else math.copysign(math.inf, r)
+    
+    A = _EPSILON_FLOATS[order]
+    for eps_n in _EPSILON_FLOATS[:order][::-1]:
+        A = A * x + eps_n
+    return A
+
+
 def A_phi_series(
     r: Union[float, np.ndarray],
     r_s: float,
@@ -159,19 +175,18 @@ def A_phi_series(
     if order < 0 or order > 6:
         raise ValueError(f"Order must be 0-6, got {order}")
     
-    r = np.asarray(r)
-    
-    # Initialize with first term (ε₀ = 1)
-    A = np.ones_like(r, dtype=float)
+    if np.ndim(r) == 0:
+        return _a_phi_series_scalar(float(r), r_s, order)
     
-    # Add higher-order terms
-    x = r_s / (2.0 * r)  # Expansion parameter
+    x = r_s / (2.0 * np.asarray(r))  # Expansion parameter
     
-    for n in range(1, order + 1):
-        if n in EPSILON_COEFFICIENTS:
-            A += EPSILON_COEFFICIENTS[n] * (x ** n)
+    # Horner: A = ((ε_N x + ε_{N-1}) x + ...) x + ε₀
+    A = np.full_like(x, EPSILON_COEFFICIENTS[order], dtype=float)
+    for eps_n in EPSILON_COEFFICIENTS[:order][::-1]:
+        A *= x
+        A += eps_n
     
-    return float(A) if A.ndim == 0 else A
+    return A
 
 
 def A_blended(
@@ -208,6 +223,8 @@ def A_blended(
         >>> A_blended(1e10, 2950.0)  # Outer region
         0.9997...  # Matches GR
     """
+    r = np.asarray(r)
+    
     if r_star is None:
         r_star = find_intersection(r_s)
     
@@ -228,6 +245,62 @@ def A_blended(
     return A
 
 
+# Above this β·(A_mix - ε), ln(1 + e^z) == z in double precision
+_SOFTPLUS_LINEAR_Z = 37.0
+
+
+def _softplus_floor(A, epsilon, beta):
+    """
+    In place: A ← ε + (1/β)·ln(1 + exp(β·(A - ε))).
+    
+    exp/log1p only run where the softplus is not already linear, which
+    also keeps exp from overflowing for large A. A must be a float
+    ndarray with ndim >= 1.
+    """
+    A -= epsilon
+    A *= beta
+    curved = A <= _SOFTPLUS_LINEAR_Z
+    np.exp(A, out=A, where=curved)
+    np.log1p(A, out=A, where=curved)
+    A *= 1.0 / beta
+    A += epsilon
+    return A
+
+
+def _a_safe_mirror(r, r_s, r_star, Delta, epsilon):
+    """
+    Mirror blend A_mix = h·A_Ξ + (1 - h)·A_GR.
+    
+    Same formula as the unfused version, evaluated in place on three
+    work arrays (no per-step temporaries). r must be a float ndarray
+    with ndim >= 1; it is not modified.
+    """
+    # A_Ξ = (1 + Ξ)^-2 = (2 - exp(-φ r_s / r))^-2
+    A = np.divide(-PHI * r_s, r)
+    np.exp(A, out=A)
+    np.subtract(2.0, A, out=A)
+    np.reciprocal(A, out=A)
+    np.square(A, out=A)
+    
+    # A_GR = 1 - r_s / max(r, r_s + ε)
+    A_gr = np.maximum(r, r_s + epsilon)
+    np.divide(r_s, A_gr, out=A_gr)
+    np.subtract(1.0, A_gr, out=A_gr)
+    
+    # h = ½ (1 - tanh((r - r*) / Δ))
+    h = np.subtract(r, r_star)
+    h /= Delta
+    np.tanh(h, out=h)
+    np.subtract(1.0, h, out=h)
+    h *= 0.5
+    
+    # A_mix = A_GR + h·(A_Ξ - A_GR)
+    A -= A_gr
+    A *= h
+    A += A_gr
+    return A
+
+
 def A_safe(
     r: Union[float, np.ndarray],
     r_s: float,
@@ -270,28 +343,25 @@ def A_safe(
         >>> A_safe(2950.0, 2950.0) > 0  # Always positive!
         True
     """
+    r = np.asarray(r, dtype=float)
+    
     if use_mirror_blend:
         # Mirror blend: mix SSZ and GR with tanh
         if r_star is None:
             r_star = find_intersection(r_s)
         
-        A_ssz = A_Xi(r, r_s)
-        A_gr = 1.0 - r_s / np.maximum(r, r_s + epsilon)  # GR (Schwarzschild)
-        
-        # Blending function
         Delta = blend_width * r_star
-        h = 0.5 * (1.0 - np.tanh((r - r_star) / Delta))
-        
-        # Mix
-        A_mix = h * A_ssz + (1.0 - h) * A_gr
+        A_safe_value = _a_safe_mirror(np.atleast_1d(r), r_s, r_star, Delta, epsilon)
     else:
-        # Use standard blending
-        A_mix = A_blended(r, r_s, r_star, blend_width)
+        # Use standard blending (fresh array, safe to overwrite)
+        A_safe_value = np.atleast_1d(
+            np.asarray(A_blended(r, r_s, r_star, blend_width), dtype=float)
+        )
     
     # Apply softplus for safety: A_safe = ε + (1/β)·ln(1 + exp(β·(A_mix - ε)))
-    A_safe_value = epsilon + (1.0 / beta) * np.log1p(np.exp(beta * (A_mix - epsilon)))
+    _softplus_floor(A_safe_value, epsilon, beta)
     
-    return A_safe_value
+    return float(A_safe_value[0]) if r.ndim == 0 else A_safe_value
 
 
 def B_coefficient(
@@ -365,20 +435,22 @@ def metric_tensor(
     A = A_safe(r, r_s, use_mirror_blend=use_mirror_blend)
     B = B_coefficient(r, r_s, A=A)
     
+    r2 = r * r
+    g_phph = r2 * np.sin(theta)**2
+    
     # Build diagonal metric tensor
-    g = np.diag([
-        -A,  # g_tt
-        B,   # g_rr
-        r**2,  # g_θθ
-        r**2 * np.sin(theta)**2  # g_φφ
-    ])
+    g = np.zeros((4, 4))
+    g[0, 0] = -A      # g_tt
+    g[1, 1] = B       # g_rr
+    g[2, 2] = r2      # g_θθ
+    g[3, 3] = g_phph  # g_φφ
     
     # Components dict
     components = {
         'g_tt': -A,
         'g_rr': B,
-        'g_theta_theta': r**2,
-        'g_phi_phi': r**2 * np.sin(theta)**2,
+        'g_theta_theta': r2,
+        'g_phi_phi': g_phph,
         'A': A,
         'B': B,
         'r': r,
@@ -388,6 +460,49 @@ def metric_tensor(
     return g, components
 
 
+def metric_tensor_batch(
+    r: np.ndarray,
+    theta: float,
+    r_s: float,
+    use_mirror_blend: bool = True
+) -> dict:
+    """
+    Diagonal SSZ metric components on a whole radius grid.
+    
+    Struct-of-arrays counterpart of metric_tensor(): one A_safe call for
+    all radii and one array per component, no per-point 4×4 tensors.
+    If a dense tensor is needed, fill g[:, i, i] from the components.
+    
+    Args:
+        r: Radii (m)
+        theta: Polar angle (radians)
+        r_s: Schwarzschild radius (m)
+        use_mirror_blend: Use mirror blending for A(r)
+        
+    Returns:
+        Dict with 'g_tt', 'g_rr', 'g_theta_theta', 'g_phi_phi', 'A', 'B'
+        (arrays shaped like r)
+        
+    Examples:
+        >>> comps = metric_tensor_batch(np.array([1e9, 1e10]), np.pi/2, 2950.0)
+        >>> comps['g_tt'].shape
+        (2,)
+    """
+    r = np.asarray(r, dtype=float)
+    A = A_safe(r, r_s, use_mirror_blend=use_mirror_blend)
+    B = B_coefficient(r, r_s, A=A)
+    r2 = r * r
+    
+    return {
+        'g_tt': -A,
+        'g_rr': B,
+        'g_theta_theta': r2,
+        'g_phi_phi': r2 * np.sin(theta)**2,
+        'A': A,
+        'B': B,
+    }
+
+
 def schwarzschild_radius(mass: float) -> float:
     """
     Calculate Schwarzschild radius for given mass.
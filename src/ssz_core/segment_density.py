@@ -14,6 +14,7 @@ Licensed under the Anti-Capitalist Software License v1.4
 """
 
 import numpy as np
+from functools import lru_cache
 from typing import Union, Optional
 from scipy.optimize import brentq
 
@@ -149,6 +150,7 @@ def D_GR(r: Union[float, np.ndarray], r_s: float,
     return float(d_value) if d_value.ndim == 0 else d_value
 
 
+@lru_cache(maxsize=32)
 def find_intersection(
     r_s: float,
     r_min: Optional[float] = None,
@@ -163,6 +165,11 @@ def find_intersection(
     This is the natural "matching point" where the SSZ metric
     transitions to match the GR metric.
     
+    Newton's method with analytic derivatives is tried first
+    (starting at r = 1.5 r_s); Brent's method on [r_min, r_max] is
+    the fallback if Newton leaves the search range or stalls.
+    Results are cached per (r_s, r_min, r_max, tol).
+    
     Args:
         r_s: Schwarzschild radius (m)
         r_min: Minimum search radius (default: 1.1 * r_s)
@@ -192,6 +199,24 @@ def find_intersection(
     if r_max is None:
         r_max = 100.0 * r_s  # Far field
     
+    # Newton iteration on f(r) = D_SSZ(r) - D_GR(r), valid for r > r_s:
+    #   D_SSZ'(r) = (φ r_s / r²) e^(-φ r_s / r) D_SSZ² = (φ r_s / r²) D_SSZ (2 D_SSZ - 1)
+    #   D_GR'(r)  = r_s / (2 r² D_GR)
+    # (e^(-φ r_s / r) = 1 - Ξ = 2 - 1/D_SSZ)
+    r = 1.5 * r_s
+    for _ in range(50):
+        if not (r_min <= r <= r_max):
+            break
+        d_ssz = D_SSZ(r, r_s)
+        d_gr = D_GR(r, r_s)
+        df = (PHI * r_s / r**2) * d_ssz * (2.0 * d_ssz - 1.0) - r_s / (2.0 * r**2 * d_gr)
+        step = (d_ssz - d_gr) / df
+        r -= step
+        if abs(step) <= tol:
+            if r_min <= r <= r_max:
+                return float(r)
+            break
+    
     def equation(r: float) -> float:
         """Difference between SSZ and GR time dilations."""
         d_ssz = D_SSZ(r, r_s)
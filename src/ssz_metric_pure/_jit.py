@@ -0,0 +1,26 @@
+"""
+Optional numba support.
+
+Modules import ``njit`` from here. When numba is not installed it
+becomes a no-op, so decorated kernels run as plain Python/NumPy and
+give the same results. ``JitError`` is numba's base
+compilation error (never raised without numba).
+
+© 2025 Carmen Wrede & Lino Casu
+Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
+"""
+try:
+    from numba import njit
+    from numba.core.errors import NumbaError as JitError
+except ImportError:
+    class JitError(Exception):
+        """Placeholder for numba's NumbaError."""
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ["njit", "JitError"]
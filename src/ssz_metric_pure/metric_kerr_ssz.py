@@ -24,11 +24,34 @@ Sources:
 Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
 """
 import numpy as np
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union
 from dataclasses import dataclass
 
 from .params import KerrSSZParams, G_SI, C_SI
 from .segmentation import segment_density_N, XI_MAX
+from ._jit import njit
+
+# Type alias
+ArrayLike = Union[float, np.ndarray]
+
+
+# ============================================================================
+# NUMERIC KERNELS
+# ============================================================================
+# Kerr components as module-level kernels (jitted when numba is present);
+# scalar or array r.
+
+@njit(cache=True)
+def _kerr_g_tt(r, Sig, A, r_s):
+    """g_tt = -(1 - r_s r / Σ) × A."""
+    factor = 1.0 - r_s * r / np.maximum(Sig, 1e-30)
+    return -A * factor
+
+
+@njit(cache=True)
+def _kerr_g_tph(r, Sig, sin_th, r_s, a):
+    """g_tφ = -r_s r a sin²θ / Σ."""
+    return -r_s * r * a * sin_th ** 2 / np.maximum(Sig, 1e-30)
 
 
 @dataclass
@@ -98,7 +121,7 @@ class KerrSSZMetric:
     # AUXILIARY FUNCTIONS (Boyer-Lindquist-like)
     # ========================================================================
     
-    def Sigma(self, r: float, theta: float) -> float:
+    def Sigma(self, r: ArrayLike, theta: ArrayLike) -> ArrayLike:
         """
         Σ(r,θ) = r² + a² cos²θ
         
@@ -106,7 +129,7 @@ class KerrSSZMetric:
         """
         return r * r + self.a_geom ** 2 * np.cos(theta) ** 2
     
-    def Delta(self, r: float) -> float:
+    def Delta(self, r: ArrayLike) -> ArrayLike:
         """
         Δ(r) = r² - r_s r + a²
         
@@ -115,7 +138,7 @@ class KerrSSZMetric:
         """
         return r * r - self.r_s * r + self.a_geom ** 2
     
-    def A_coeff(self, r: float, theta: float) -> float:
+    def A_coeff(self, r: ArrayLike, theta: ArrayLike) -> ArrayLike:
         """
         A(r,θ) for rotating SSZ metric.
         
@@ -129,14 +152,11 @@ class KerrSSZMetric:
         D_ssz = 1.0 / (1.0 + N)
         A_static = D_ssz * D_ssz
         
-        # Kerr rotation factor
-        Sig = self.Sigma(r, theta)
+        # Kerr rotation factor (θ-independent)
         Dlt = self.Delta(r)
         
         # Avoid division by zero
-        denom = r * r + self.a_geom ** 2
-        if denom < 1e-30:
-            denom = 1e-30
+        denom = np.maximum(r * r + self.a_geom ** 2, 1e-30)
         
         rotation_factor = Dlt / denom
         
@@ -146,7 +166,7 @@ class KerrSSZMetric:
     # METRIC COMPONENTS
     # ========================================================================
     
-    def g_tt(self, r: float, theta: float) -> float:
+    def g_tt(self, r: ArrayLike, theta: ArrayLike) -> ArrayLike:
         """
         g_tt = -(1 - r_s r / Σ) × A_SSZ(r)
         
@@ -156,9 +176,7 @@ class KerrSSZMetric:
         Sig = self.Sigma(r, theta)
         A = self.A_coeff(r, theta)
         
-        factor = 1.0 - self.r_s * r / max(Sig, 1e-30)
-        
-        return -A * factor
+        return _kerr_g_tt(r, Sig, A, self.r_s)
     
     def g_rr(self, r: float, theta: float) -> float:
         """
@@ -198,7 +216,7 @@ class KerrSSZMetric:
         
         return (term1 + term2) * sin_th ** 2
     
-    def g_tph(self, r: float, theta: float) -> float:
+    def g_tph(self, r: ArrayLike, theta: ArrayLike) -> ArrayLike:
         """
         g_tφ = -r_s r a sin²θ / Σ
         
@@ -206,12 +224,31 @@ class KerrSSZMetric:
         Non-zero only for rotating (a≠0) case.
         """
         if abs(self.a_geom) < 1e-30:
-            return 0.0
+            return 0.0 * np.asarray(r, dtype=float)
         
         Sig = self.Sigma(r, theta)
         sin_th = np.sin(theta)
         
-        return -self.r_s * r * self.a_geom * sin_th ** 2 / max(Sig, 1e-30)
+        return _kerr_g_tph(r, Sig, sin_th, self.r_s, self.a_geom)
+    
+    def g_tt_equator(self, r: ArrayLike) -> ArrayLike:
+        """
+        g_tt at the equator (θ = π/2).
+        
+        Specialized form of g_tt with Σ = r² (cos θ = 0): no trig calls.
+        """
+        return _kerr_g_tt(r, r * r, self.A_coeff(r, np.pi / 2), self.r_s)
+    
+    def g_tph_equator(self, r: ArrayLike) -> ArrayLike:
+        """
+        g_tφ at the equator (θ = π/2).
+        
+        Specialized form of g_tph with Σ = r², sin θ = 1: no trig calls.
+        """
+        if abs(self.a_geom) < 1e-30:
+            return 0.0 * np.asarray(r, dtype=float)
+        
+        return _kerr_g_tph(r, r * r, 1.0, self.r_s, self.a_geom)
     
     def metric_tensor(self, r: float, theta: float) -> KerrMetricComponents:
         """
@@ -84,8 +84,14 @@ SOURCES
 Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
 """
 import numpy as np
-from typing import Tuple, Optional, Callable
+from typing import Dict, Tuple, Optional, Callable, Union
 from dataclasses import dataclass
+from scipy.optimize import brentq
+
+from ._jit import njit  # no-op without numba (pure NumPy)
+
+# Type alias
+ArrayLike = Union[float, np.ndarray]
 
 # Golden Ratio (emerges naturally in SSZ)
 PHI = (1.0 + np.sqrt(5.0)) / 2.0  # ≈ 1.618033988749895
@@ -95,6 +101,56 @@ C_SI = 299792458.0  # Speed of light [m/s]
 G_SI = 6.67430e-11  # Gravitational constant [m³/(kg·s²)]
 
 
+# ============================================================================
+# NUMERIC KERNELS
+# ============================================================================
+# Free functions so numba can compile them (classes are not jit-friendly).
+# All kernels work on scalars and on float arrays alike.
+
+@njit(cache=True)
+def _phi_G_log(r, k, r0):
+    """Default logarithmic profile φ_G(r) = k·log(1 + r/r₀)."""
+    return k * np.log(1.0 + r / r0)
+
+
+@njit(cache=True)
+def _diag_form(phi):
+    """Diagonal form (g_TT, g_rr) = (-c²/cosh²φ, cosh²φ)."""
+    gamma_sq = np.cosh(phi) ** 2
+    return -(C_SI ** 2) / gamma_sq, gamma_sq
+
+
+@njit(cache=True)
+def _sech(phi):
+    """sech(φ) = 1/cosh(φ)."""
+    return 1.0 / np.cosh(phi)
+
+
+@njit(cache=True)
+def _beta_from_phi(phi):
+    """β = tanh(φ)."""
+    return np.tanh(phi)
+
+
+@njit(cache=True)
+def _g_tt_from_phi(phi):
+    """g_tt = -c² sech²(φ)."""
+    sech_phi = 1.0 / np.cosh(phi)
+    return -(C_SI ** 2) * (sech_phi ** 2)
+
+
+@njit(cache=True)
+def _g_tr_from_phi(phi):
+    """g_tr = c·tanh(φ)."""
+    return C_SI * np.tanh(phi)
+
+
+@njit(cache=True)
+def _subspace_layer_from_phi(phi):
+    """Layer index floor(φ / 2π) (as float)."""
+    return np.floor(phi / (2.0 * np.pi))
+
+
 @dataclass
 class PhiSpiralMetricComponents:
     """Container for φ-Spiral metric components."""
@@ -183,13 +239,14 @@ class PhiSpiralSSZMetric:
         else:
             # Default: logarithmic profile
             # φ_G(r) = k·log(1 + r/r₀)
-            self._phi_G_func = lambda r: self.k * np.log(1.0 + r / self.r0)
+            self._phi_G_func = lambda r: _phi_G_log(r, self.k, self.r0)
+        self._log_profile = phi_G_profile is None
     
     # ========================================================================
     # φ_G GRAVITATIONAL ROTATION ANGLE
     # ========================================================================
     
-    def phi_G(self, r: float) -> float:
+    def phi_G(self, r: ArrayLike) -> ArrayLike:
         """
         Gravitational rotation angle φ_G(r).
         
@@ -202,13 +259,17 @@ class PhiSpiralSSZMetric:
             - Each Δφ_G = 2π creates new subspace sheet
         
         Args:
-            r: Radial coordinate [m]
+            r: Radial coordinate [m] (scalar or array)
         
         Returns:
             φ_G: Rotation angle [rad]
+        
+        Note:
+            All derived fields (β, γ, g_tt, g_tr, diagonal form, ...)
+            go through φ_G and therefore accept arrays as well.
         """
-        if r < 0:
-            raise ValueError(f"Radius must be non-negative, got {r}")
+        if np.any(np.asarray(r) < 0):
+            raise ValueError(f"Radius must be non-negative, got {np.min(r)}")
         
         return self._phi_G_func(r)
     
@@ -234,7 +295,7 @@ class PhiSpiralSSZMetric:
         
         return (phi_plus - phi_minus) / (r_plus - r_minus)
     
-    def subspace_layer(self, r: float) -> int:
+    def subspace_layer(self, r: ArrayLike) -> Union[int, np.ndarray]:
         """
         Subspace sheet number (counts 2π rotations).
         
@@ -248,16 +309,53 @@ class PhiSpiralSSZMetric:
             - etc.
         
         Returns:
-            Subspace layer number (integer)
+            Subspace layer number (int, or int array for array r)
         """
-        phi = self.phi_G(r)
-        return int(np.floor(phi / (2.0 * np.pi)))
+        layer = _subspace_layer_from_phi(self.phi_G(r))
+        if np.ndim(layer) == 0:
+            return int(layer)
+        return layer.astype(int)
+    
+    def subspace_transition_radius(self, n: int) -> float:
+        """
+        Radius where layer n begins, i.e. φ_G(r_n) = n·2π.
+        
+        Default (logarithmic) profile, closed form:
+            r_n = r₀ · (exp(2πn / k) - 1)
+        
+        Custom profiles are assumed monotone in r; the root is then
+        bracketed by doubling and refined with Brent's method.
+        
+        Args:
+            n: Layer number (n ≥ 1)
+        
+        Returns:
+            r_n: Transition radius [m]
+        """
+        if n < 1:
+            raise ValueError(f"Layer number must be >= 1, got {n}")
+        
+        phi_target = 2.0 * np.pi * n
+        
+        if self._log_profile:
+            return self.r0 * np.expm1(phi_target / self.k)
+        
+        def residual(r):
+            return self.phi_G(r) - phi_target
+        
+        r_hi = self.r0
+        while residual(r_hi) < 0:
+            r_hi *= 2.0
+            if not np.isfinite(r_hi):
+                raise ValueError(f"φ_G(r) never reaches {phi_target:.6f} rad")
+        
+        return brentq(residual, 0.0, r_hi)
     
     # ========================================================================
     # LORENTZ-LIKE FIELDS
     # ========================================================================
     
-    def beta(self, r: float) -> float:
+    def beta(self, r: ArrayLike) -> ArrayLike:
         """
         Local velocity field β(r) = tanh(φ_G(r)).
         
@@ -270,9 +368,9 @@ class PhiSpiralSSZMetric:
             β: Dimensionless velocity field
         """
         phi = self.phi_G(r)
-        return np.tanh(phi)
+        return _beta_from_phi(phi)
     
-    def gamma(self, r: float) -> float:
+    def gamma(self, r: ArrayLike) -> ArrayLike:
         """
         Local Lorentz-like factor γ(r) = cosh(φ_G(r)).
         
@@ -290,7 +388,7 @@ class PhiSpiralSSZMetric:
         phi = self.phi_G(r)
         return np.cosh(phi)
     
-    def v_radial(self, r: float) -> float:
+    def v_radial(self, r: ArrayLike) -> ArrayLike:
         """
         Spiral radial velocity field v_r(r) = c·tanh(φ_G(r)).
         
@@ -304,7 +402,7 @@ class PhiSpiralSSZMetric:
         """
         return C_SI * self.beta(r)
     
-    def time_dilation_factor(self, r: float) -> float:
+    def time_dilation_factor(self, r: ArrayLike) -> ArrayLike:
         """
         Time dilation factor dτ/dt = sech(φ_G(r)).
         
@@ -318,13 +416,13 @@ class PhiSpiralSSZMetric:
         """
         phi = self.phi_G(r)
         # sech(φ) = 1/cosh(φ)
-        return 1.0 / np.cosh(phi)
+        return _sech(phi)
     
     # ========================================================================
     # METRIC COMPONENTS
     # ========================================================================
     
-    def g_tt(self, r: float) -> float:
+    def g_tt(self, r: ArrayLike) -> ArrayLike:
         """
         Time-time metric component.
         
@@ -343,10 +441,9 @@ class PhiSpiralSSZMetric:
             g_tt [m²/s²]
         """
         phi = self.phi_G(r)
-        sech_phi = 1.0 / np.cosh(phi)
-        return -(C_SI ** 2) * (sech_phi ** 2)
+        return _g_tt_from_phi(phi)
     
-    def g_tr(self, r: float) -> float:
+    def g_tr(self, r: ArrayLike) -> ArrayLike:
         """
         Time-radial cross term (SPIRAL STRUCTURE!).
         
@@ -362,10 +459,10 @@ class PhiSpiralSSZMetric:
         Returns:
             g_tr [m/s]
         """
-        beta_val = self.beta(r)
-        return C_SI * beta_val
+        phi = self.phi_G(r)
+        return _g_tr_from_phi(phi)
     
-    def g_rr(self, r: float) -> float:
+    def g_rr(self, r: ArrayLike) -> ArrayLike:
         """
         Radial-radial metric component.
         
@@ -377,9 +474,9 @@ class PhiSpiralSSZMetric:
             - All dynamics in g_tt and g_tr
         
         Returns:
-            g_rr (dimensionless)
+            g_rr (dimensionless; float for scalar r, array of ones otherwise)
         """
-        return 1.0
+        return 1.0 if np.ndim(r) == 0 else np.ones_like(r, dtype=float)
     
     def g_thth(self, r: float) -> float:
         """
@@ -447,10 +544,60 @@ class PhiSpiralSSZMetric:
         
         return g
     
-    def metric_components(self, r: float, theta: float = np.pi/2) -> PhiSpiralMetricComponents:
+    def metric_components_batch(self, r: ArrayLike, theta: float = np.pi/2) -> Dict[str, np.ndarray]:
+        """
+        Compute all metric components and auxiliary fields for many radii.
+        
+        Struct-of-arrays variant of metric_components(): one contiguous
+        float64 array per field, all sharing the shape of r (at least 1-D).
+        φ_G(r) is evaluated once and every field is derived from it.
+        
+        Args:
+            r: Radial coordinates [m]
+            theta: Polar angle [rad] (default: equator)
+        
+        Returns:
+            Dict mapping field name (as in PhiSpiralMetricComponents) to array
+        
+        Example:
+            >>> comps = metric.metric_components_batch(np.array([1.0, 3.0]) * metric.r_s)
+            >>> comps['tau_factor'].shape
+            (2,)
+        """
+        r = np.atleast_1d(np.asarray(r, dtype=float))
+        phi = np.asarray(self.phi_G(r), dtype=float)
+        if phi.shape != r.shape:
+            # Custom profiles may return a scalar for array input
+            phi = np.broadcast_to(phi, r.shape).copy()
+        return self._components_from_phi(r, phi, theta)
+    
+    @staticmethod
+    def _components_from_phi(r, phi, theta):
+        """All metric_components() fields derived from r and φ_G(r)."""
+        beta_val = _beta_from_phi(phi)
+        gamma_val = np.cosh(phi)
+        r_sq = np.square(r)
+        
+        return {
+            'g_tt': _g_tt_from_phi(phi),
+            'g_tr': _g_tr_from_phi(phi),
+            'g_rr': np.ones_like(r),
+            'g_thth': r_sq,
+            'g_phph': r_sq * np.sin(theta) ** 2,
+            'phi_G': phi,
+            'beta': beta_val,
+            'gamma': gamma_val,
+            'v_r': C_SI * beta_val,
+            'tau_factor': np.reciprocal(gamma_val),
+        }
+    
+    def metric_components(self, r: ArrayLike, theta: float = np.pi/2) -> PhiSpiralMetricComponents:
         """
         Compute all metric components and auxiliary fields.
         
+        Works for scalar r (fields are floats, φ_G is evaluated on the
+        scalar) and for arrays (via metric_components_batch()).
+        
         Args:
             r: Radial coordinate [m]
             theta: Polar angle [rad] (default: equator)
@@ -458,28 +605,20 @@ class PhiSpiralSSZMetric:
         Returns:
             PhiSpiralMetricComponents dataclass with all fields
         """
-        phi = self.phi_G(r)
-        beta_val = self.beta(r)
-        gamma_val = self.gamma(r)
-        
-        return PhiSpiralMetricComponents(
-            g_tt=self.g_tt(r),
-            g_tr=self.g_tr(r),
-            g_rr=self.g_rr(r),
-            g_thth=self.g_thth(r),
-            g_phph=self.g_phph(r, theta),
-            phi_G=phi,
-            beta=beta_val,
-            gamma=gamma_val,
-            v_r=C_SI * beta_val,
-            tau_factor=1.0 / gamma_val
-        )
+        if np.ndim(r) == 0:
+            r = float(r)
+            comps = self._components_from_phi(r, float(self.phi_G(r)), theta)
+            comps = {name: float(value) for name, value in comps.items()}
+        else:
+            comps = self.metric_components_batch(r, theta)
+        
+        return PhiSpiralMetricComponents(**comps)
     
     # ========================================================================
     # PHYSICAL OBSERVABLES
     # ========================================================================
     
-    def redshift(self, r: float) -> float:
+    def redshift(self, r: ArrayLike) -> ArrayLike:
         """
         Gravitational redshift z.
         
@@ -490,7 +629,7 @@ class PhiSpiralSSZMetric:
             z = cosh(φ_G(r)) - 1
         
         Args:
-            r: Radial coordinate [m]
+            r: Radial coordinate [m] (scalar or array)
         
         Returns:
             z: Redshift (dimensionless)
@@ -544,6 +683,26 @@ class PhiSpiralSSZMetric:
         
         return alpha
     
+    def tilt_and_beta(self, r: ArrayLike) -> Tuple[ArrayLike, ArrayLike]:
+        """
+        Light cone tilt α(r) and velocity field β(r) from one φ_G pass.
+        
+        With g_tt = -c²(1 - β²), g_tr = cβ, g_rr = 1 the outgoing root
+        of the null condition is u₊ = dr/dt = c(1 - β), so
+            α = arctan(c·(1 - β))
+        (same value as light_cone_tilt, whose discriminant 4c² is
+        never negative).
+        
+        Args:
+            r: Radial coordinate [m] (scalar or array)
+        
+        Returns:
+            (α, β): Tilt angle [rad] and dimensionless velocity
+        """
+        beta = _beta_from_phi(self.phi_G(r))
+        alpha = np.arctan(C_SI * (1.0 - beta))
+        return alpha, beta
+    
     # ========================================================================
     # LIMITS & VALIDATION
     # ========================================================================
@@ -631,7 +790,7 @@ class PhiSpiralSSZMetric:
         
         return f
     
-    def diagonal_form_coefficients(self, r: float) -> Tuple[float, float]:
+    def diagonal_form_coefficients(self, r: ArrayLike) -> Tuple[ArrayLike, ArrayLike]:
         """
         Compute CORRECT diagonal form metric coefficients.
         
@@ -653,7 +812,7 @@ class PhiSpiralSSZMetric:
                 g_rr = γ² = cosh²(φ_G)
         
         Args:
-            r: Radial coordinate [m]
+            r: Radial coordinate [m] (scalar or array)
         
         Returns:
             (g_TT, g_rr): Diagonal metric coefficients
@@ -670,15 +829,10 @@ class PhiSpiralSSZMetric:
             → Light cone closes as φ_G increases!
         """
         phi = self.phi_G(r)
-        gamma = self.gamma(r)
         
         # g_TT = -c²/γ² = -c² sech²(φ_G)
-        g_TT = -(C_SI ** 2) / (gamma ** 2)
-        
         # g_rr = γ² = cosh²(φ_G)
-        g_rr = gamma ** 2
-        
-        return (g_TT, g_rr)
+        return _diag_form(phi)
     
     def coordinate_time_to_eigentime(self, r_start: float, r_end: float, 
                                      n_points: int = 1000) -> float:
@@ -854,8 +1008,8 @@ class PhiSpiralSSZMetric:
             raise ImportError("matplotlib required for plotting.")
         
         r_vals = np.linspace(r_min, r_max, 2000)
-        phi_vals = np.array([self.phi_G(r) for r in r_vals])
-        layer_vals = np.array([self.subspace_layer(r) for r in r_vals])
+        phi_vals = self.phi_G(r_vals)
+        layer_vals = _subspace_layer_from_phi(phi_vals).astype(int)
         
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
         
@@ -18,7 +18,7 @@ Sources:
 Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
 """
 import numpy as np
-from typing import Tuple, Dict, Optional
+from typing import Tuple, Dict, Optional, Union
 from dataclasses import dataclass
 
 from .params import (
@@ -27,6 +27,14 @@ from .params import (
 )
 from .segmentation import segment_density_xi, time_dilation_SSZ
 
+# Type alias
+ArrayLike = Union[float, np.ndarray]
+
+# ε_n ordered from highest to lowest power, for Horner evaluation
+_EPSILON_HORNER = tuple(
+    EPSILON_COEFFICIENTS[n] for n in sorted(EPSILON_COEFFICIENTS, reverse=True)
+)
+
 
 @dataclass
 class MetricComponents:
@@ -83,7 +91,7 @@ class StaticSSZMetric:
     # CORE METRIC COEFFICIENTS (Pure SSZ)
     # ========================================================================
     
-    def A_coefficient(self, r: float, method: str = 'saturation') -> float:
+    def A_coefficient(self, r: ArrayLike, method: str = 'saturation') -> ArrayLike:
         """
         Metric coefficient A(r) = -g_tt.
         
@@ -99,19 +107,18 @@ class StaticSSZMetric:
         - 0 < A(r) ≤ 1 always
         
         Args:
-            r: Radius [m]
+            r: Radius [m] (scalar or array)
             method: 'saturation' (N-based, default) or 'phi_series' (PN expansion)
         
         Returns:
-            Metric coefficient A(r)
+            Metric coefficient A(r) (float for scalar r, array otherwise)
         
         Physics:
             A(r) = (proper time / coordinate time)²
             Redshift: z = 1/√A - 1
         """
-        if r <= 0:
-            # At center: N(0) = 0 → A(0) = 1.0 (FLAT!)
-            return 1.0
+        r = np.asarray(r, dtype=float)
+        center = r <= 0
         
         if method == 'saturation':
             # Use N(r) saturation (CORRECT for flat center!)
@@ -121,16 +128,19 @@ class StaticSSZMetric:
             A = D * D
         
         elif method == 'phi_series':
-            # φ-series Post-Newtonian expansion
-            A = self._A_phi_series(r)
+            # φ-series Post-Newtonian expansion (center patched below)
+            A = self._A_phi_series(np.where(center, self.r_s, r))
         
         else:
             raise ValueError(f"Unknown method: {method}")
         
-        # Ensure positive (should be automatic, but safety check)
-        return max(A, 1e-16)
+        # At center: N(0) = 0 → A(0) = 1.0 (FLAT!)
+        # Ensure positive elsewhere (should be automatic, but safety check)
+        A = np.where(center, 1.0, np.maximum(A, 1e-16))
+        
+        return float(A) if A.ndim == 0 else A
     
-    def B_coefficient(self, r: float, method: str = 'saturation') -> float:
+    def B_coefficient(self, r: ArrayLike, method: str = 'saturation') -> ArrayLike:
         """
         Radial metric coefficient B(r) = g_rr.
         
@@ -142,7 +152,7 @@ class StaticSSZMetric:
         - Proper radial distance: ds² = B(r) dr²
         
         Args:
-            r: Radius [m]
+            r: Radius [m] (scalar or array)
             method: Same as A_coefficient
         
         Returns:
@@ -155,10 +165,10 @@ class StaticSSZMetric:
         """
         A = self.A_coefficient(r, method=method)
         # Avoid division by tiny numbers
-        A_safe = max(A, 1e-16)
+        A_safe = np.maximum(A, 1e-16)
         return 1.0 / A_safe
     
-    def _A_phi_series(self, r: float) -> float:
+    def _A_phi_series(self, r: ArrayLike) -> ArrayLike:
         """
         φ-series Post-Newtonian expansion.
         
@@ -172,14 +182,17 @@ class StaticSSZMetric:
         Returns:
             A(r) from PN expansion
         """
-        U = self.r_s / (2.0 * r)  # Weak field parameter
+        U = self.r_s / (2.0 * np.asarray(r, dtype=float))  # Weak field parameter
         
-        A = 0.0
-        for n, eps_n in EPSILON_COEFFICIENTS.items():
-            A += eps_n * (U ** n)
+        # Horner scheme, filled in place into one preallocated buffer
+        A = np.empty_like(U)
+        A.fill(_EPSILON_HORNER[0])
+        for eps_n in _EPSILON_HORNER[1:]:
+            A *= U
+            A += eps_n
         
         # Ensure positive and bounded
-        A = np.clip(A, 1e-16, 1.0)
+        np.clip(A, 1e-16, 1.0, out=A)
         
         return A
     
@@ -226,7 +239,7 @@ class StaticSSZMetric:
     # PHYSICAL OBSERVABLES
     # ========================================================================
     
-    def redshift(self, r: float) -> float:
+    def redshift(self, r: ArrayLike) -> ArrayLike:
         """
         Gravitational redshift z.
         
@@ -240,10 +253,10 @@ class StaticSSZMetric:
             Redshift z (dimensionless)
         """
         A = self.A_coefficient(r)
-        sqrt_A = np.sqrt(max(A, 1e-16))
+        sqrt_A = np.sqrt(np.maximum(A, 1e-16))
         return 1.0 / sqrt_A - 1.0
     
-    def proper_time_factor(self, r: float) -> float:
+    def proper_time_factor(self, r: ArrayLike) -> ArrayLike:
         """
         Proper time / coordinate time = √A(r).
         
@@ -251,7 +264,7 @@ class StaticSSZMetric:
             τ/t factor
         """
         A = self.A_coefficient(r)
-        return np.sqrt(max(A, 1e-16))
+        return np.sqrt(np.maximum(A, 1e-16))
     
     def escape_velocity(self, r: float) -> float:
         """
@@ -328,7 +341,7 @@ class StaticSSZMetric:
             r_max = 100.0 * self.r_s
         
         r_test = np.linspace(r_min, r_max, n_points)
-        A_test = np.array([self.A_coefficient(r) for r in r_test])
+        A_test = self.A_coefficient(r_test)
         
         A_min = np.min(A_test)
         
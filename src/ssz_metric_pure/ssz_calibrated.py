@@ -20,14 +20,19 @@ Based on Lino's weak-field calibration specification
 import numpy as np
 from scipy.integrate import odeint
 from scipy.interpolate import PchipInterpolator
-from typing import Tuple, Optional, Callable
+from typing import Tuple, Optional, Callable, Union
 
 # Handle scipy version compatibility
 try:
     from scipy.integrate import trapezoid as trapz
     from scipy.integrate import simpson as simps
+    from scipy.integrate import cumulative_trapezoid
 except ImportError:
     from scipy.integrate import trapz, simps
+    from scipy.integrate import cumtrapz as cumulative_trapezoid
+
+# Type alias
+ArrayLike = Union[float, np.ndarray]
 
 # Physical constants (SI units)
 C_SI = 299792458.0  # m/s
@@ -92,7 +97,7 @@ class SSZCalibratedMetric:
     # CALIBRATED φ_G(r) - WEAK-FIELD MATCHED
     # ========================================================================
     
-    def phi_calibrated(self, r: float) -> float:
+    def phi_calibrated(self, r: ArrayLike) -> ArrayLike:
         """
         Calibrated spiral angle φ_G^cal(r; M) = sqrt(2GM / (r c²)).
         
@@ -102,30 +107,30 @@ class SSZCalibratedMetric:
         where Φ_N = -GM/r is Newtonian potential.
         
         Args:
-            r: Radial coordinate [m]
+            r: Radial coordinate [m] (scalar or array)
         
         Returns:
             φ_G: Calibrated rotation angle [rad]
         """
         # Guard against too small r
-        r_safe = max(r, self.r_min)
+        r_safe = np.maximum(r, self.r_min)
         
         # φ² = r_g / r
         phi_squared = self.r_g / r_safe
         
         return np.sqrt(phi_squared)
     
-    def beta(self, r: float) -> float:
+    def beta(self, r: ArrayLike) -> ArrayLike:
         """β(r) = tanh(φ_G^cal(r))."""
         phi = self.phi_calibrated(r)
         return np.tanh(phi)
     
-    def gamma(self, r: float) -> float:
+    def gamma(self, r: ArrayLike) -> ArrayLike:
         """γ(r) = cosh(φ_G^cal(r))."""
         phi = self.phi_calibrated(r)
         return np.cosh(phi)
     
-    def sech(self, r: float) -> float:
+    def sech(self, r: ArrayLike) -> ArrayLike:
         """sech(φ_G(r)) = 1/cosh(φ_G(r))."""
         gamma = self.gamma(r)
         return 1.0 / gamma
@@ -134,7 +139,7 @@ class SSZCalibratedMetric:
     # METRIC COMPONENTS (Diagonal T,r form)
     # ========================================================================
     
-    def metric_diag(self, r: float) -> Tuple[float, float]:
+    def metric_diag(self, r: ArrayLike) -> Tuple[ArrayLike, ArrayLike]:
         """
         Diagonal metric components (T,r).
         
@@ -142,14 +147,13 @@ class SSZCalibratedMetric:
         g_rr = γ²(r)
         
         Args:
-            r: Radial coordinate [m]
+            r: Radial coordinate [m] (scalar or array)
         
         Returns:
             (g_TT, g_rr): Metric components [SI units]
         """
-        gamma = self.gamma(r)
-        g_TT = -(C_SI ** 2) / (gamma ** 2)
-        g_rr = gamma ** 2
+        g_rr = self.gamma(r) ** 2
+        g_TT = -(C_SI ** 2) / g_rr
         
         return g_TT, g_rr
     
@@ -157,7 +161,7 @@ class SSZCalibratedMetric:
     # NULL GEODESICS
     # ========================================================================
     
-    def null_slope(self, r: float, outgoing: bool = True) -> float:
+    def null_slope(self, r: ArrayLike, outgoing: bool = True) -> ArrayLike:
         """
         Null geodesic slope dr/dT = ±c/γ²(r).
         
@@ -184,17 +188,15 @@ class SSZCalibratedMetric:
         Returns:
             T_path: Array of eigentime coordinates [s]
         """
+        r_path = np.asarray(r_path, dtype=float)
+        
         # Compute γ² at each point
-        gamma_squared = np.array([self.gamma(r) ** 2 for r in r_path])
+        gamma_squared = self.gamma(r_path) ** 2
         
         # Integrate
         if method == 'trapz':
-            # Cumulative trapezoidal
-            T_cumulative = np.zeros_like(r_path)
-            for i in range(1, len(r_path)):
-                dT = (1.0 / C_SI) * 0.5 * (gamma_squared[i-1] + gamma_squared[i]) * (r_path[i] - r_path[i-1])
-                T_cumulative[i] = T_cumulative[i-1] + dT
-            return T_cumulative
+            # Cumulative trapezoidal (handles non-uniform spacing)
+            return cumulative_trapezoid(gamma_squared, r_path, initial=0.0) / C_SI
         
         elif method == 'simps':
             # For validation: full Simpson's rule
@@ -222,18 +224,18 @@ class SSZCalibratedMetric:
         Returns:
             t_path: Coordinate time array [s]
         """
-        t_path = np.zeros_like(T_path)
+        T_path = np.asarray(T_path, dtype=float)
+        r_path = np.asarray(r_path, dtype=float)
+        
+        # β·γ² evaluated at the end of each step (φ_G computed once)
+        phi = self.phi_calibrated(r_path[1:])
+        beta = np.tanh(phi)
+        gamma = np.cosh(phi)
         
-        for i in range(1, len(T_path)):
-            dT = T_path[i] - T_path[i-1]
-            dr = r_path[i] - r_path[i-1]
-            
-            beta = self.beta(r_path[i])
-            gamma = self.gamma(r_path[i])
-            
-            correction = (beta * gamma ** 2 / C_SI) * dr
-            
-            t_path[i] = t_path[i-1] + dT + correction
+        correction = (beta * gamma ** 2 / C_SI) * np.diff(r_path)
+        
+        t_path = np.zeros_like(T_path)
+        t_path[1:] = np.cumsum(np.diff(T_path) + correction)
         
         return t_path
     
@@ -261,7 +263,7 @@ class SSZCalibratedMetric:
         # Correct formula: deeper potential (larger γ) → redshift
         return gamma_emit / gamma_obs
     
-    def time_dilation(self, r: float) -> float:
+    def time_dilation(self, r: ArrayLike) -> ArrayLike:
         """
         Time dilation factor dτ/dT = 1/γ(r).
         
@@ -277,12 +279,12 @@ class SSZCalibratedMetric:
     # GR COMPARISON (Weak Field)
     # ========================================================================
     
-    def newtonian_potential(self, r: float) -> float:
+    def newtonian_potential(self, r: ArrayLike) -> ArrayLike:
         """Newtonian potential Φ_N = -GM/r."""
-        r_safe = max(r, self.r_min)
+        r_safe = np.maximum(r, self.r_min)
         return -G_SI * self.mass / r_safe
     
-    def gr_time_dilation_weak(self, r: float) -> float:
+    def gr_time_dilation_weak(self, r: ArrayLike) -> ArrayLike:
         """
         GR time dilation in weak field: dτ/dt ≈ sqrt(1 + 2Φ_N/c²).
         
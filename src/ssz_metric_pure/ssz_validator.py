@@ -22,7 +22,7 @@ import json
 
 # UTF-8 encoding
 os.environ['PYTHONIOENCODING'] = 'utf-8'
-if sys.platform.startswith('win'):
+if sys.platform.startswith('win') and (sys.stdout.encoding or '').lower() != 'utf-8':
     try:
         sys.stdout.reconfigure(encoding='utf-8', errors='replace')
     except:
@@ -118,7 +118,7 @@ class SSZConsistencyValidator:
             dict with continuity measures and status
         """
         # Check φ_G continuity
-        phi_vals = np.array([self.metric.phi_calibrated(r) for r in r_test])
+        phi_vals = self.metric.phi_calibrated(r_test)
         
         # Finite differences
         dphi = np.diff(phi_vals)
@@ -197,7 +197,7 @@ class SSZConsistencyValidator:
             dict with energy conservation test results
         """
         # Simple test: check time dilation factor is consistent
-        gamma_vals = np.array([self.metric.gamma(r) for r in r_path])
+        gamma_vals = self.metric.gamma(r_path)
         
         # For a constant-energy trajectory, γ variations define the energy
         E_proxy = C_SI ** 2 / (gamma_vals ** 2)
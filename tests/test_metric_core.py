@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite for the ssz_core Metric Tensor
+
+Validates:
+- metric_tensor_batch() matches metric_tensor() point by point
+
+© 2025 Carmen Wrede & Lino Casu
+"""
+import pytest
+import numpy as np
+
+from ssz_core import metric_tensor, metric_tensor_batch
+
+
+@pytest.mark.parametrize("use_mirror_blend", [True, False])
+def test_metric_tensor_batch_matches_per_radius(use_mirror_blend):
+    """Each batch array equals metric_tensor(r_i, θ, r_s)[1] radius by radius."""
+    r_s = 2950.0
+    theta = np.pi / 3
+    r = np.array([0.1, 0.5, 1.0, 1.5, 3.0, 10.0, 1e3, 1e6]) * r_s
+
+    batch = metric_tensor_batch(r, theta, r_s, use_mirror_blend=use_mirror_blend)
+
+    for i, r_i in enumerate(r):
+        _, single = metric_tensor(r_i, theta, r_s, use_mirror_blend=use_mirror_blend)
+        for name, values in batch.items():
+            assert values.shape == r.shape, name
+            assert values[i] == pytest.approx(single[name], rel=1e-14), name
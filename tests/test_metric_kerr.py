@@ -110,6 +110,27 @@ def test_g_tt_negative_outside_ergosphere(kerr_moderate):
     assert g_tt < 0, "g_tt must be negative outside ergosphere"
 
 
+def test_components_accept_arrays(kerr_moderate):
+    """g_tt and g_tφ broadcast over r and match the scalar calls."""
+    r = np.array([0.5, 1.0, 2.0, 10.0, 100.0]) * kerr_moderate.r_s
+    theta = np.pi / 2
+
+    g_tt = kerr_moderate.g_tt(r, theta)
+    g_tph = kerr_moderate.g_tph(r, theta)
+
+    assert g_tt.shape == r.shape
+    assert np.allclose(g_tt, [kerr_moderate.g_tt(ri, theta) for ri in r])
+    assert np.allclose(g_tph, [kerr_moderate.g_tph(ri, theta) for ri in r])
+
+
+def test_equator_fast_paths_match(kerr_moderate):
+    """g_tt_equator / g_tph_equator agree with the general θ = π/2 forms."""
+    r = np.array([0.5, 1.0, 2.0, 10.0, 100.0]) * kerr_moderate.r_s
+
+    assert np.allclose(kerr_moderate.g_tt_equator(r), kerr_moderate.g_tt(r, np.pi / 2))
+    assert np.allclose(kerr_moderate.g_tph_equator(r), kerr_moderate.g_tph(r, np.pi / 2))
+
+
 def test_redshift_positive(kerr_moderate):
     """Gravitational redshift z > 0."""
     r_test = 5.0 * kerr_moderate.r_s
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite for φ-Spiral SSZ Metric
+
+Validates:
+- Subspace transition radii: φ_G(r_n) = n·2π
+- Batched metric components match the per-radius path
+
+© 2025 Carmen Wrede & Lino Casu
+"""
+import pytest
+import dataclasses
+import math
+
+import numpy as np
+from ssz_metric_pure import PhiSpiralSSZMetric, M_SUN
+
+
+@pytest.fixture
+def log_metric():
+    """1 Solar mass φ-spiral metric, default logarithmic profile."""
+    return PhiSpiralSSZMetric(mass=M_SUN, k=1.5)
+
+
+@pytest.fixture
+def sqrt_metric():
+    """1 Solar mass φ-spiral metric with a custom φ_G = k·√(r/r₀) profile."""
+    k, r0 = 1.5, 1.0e4
+    return PhiSpiralSSZMetric(
+        mass=M_SUN, k=k, r0=r0,
+        phi_G_profile=lambda r: k * np.sqrt(np.asarray(r) / r0)
+    )
+
+
+@pytest.mark.parametrize("n", [1, 2, 5])
+def test_transition_radius_log_profile(log_metric, n):
+    """Closed form: φ_G(r_n) = n·2π for the logarithmic profile."""
+    r_n = log_metric.subspace_transition_radius(n)
+
+    assert log_metric.phi_G(r_n) == pytest.approx(2 * np.pi * n, rel=1e-12)
+
+
+@pytest.mark.parametrize("n", [1, 2, 5])
+def test_transition_radius_custom_profile(sqrt_metric, n):
+    """Root-finding branch: φ_G(r_n) = n·2π for a custom profile."""
+    r_n = sqrt_metric.subspace_transition_radius(n)
+
+    assert sqrt_metric.phi_G(r_n) == pytest.approx(2 * np.pi * n, rel=1e-9)
+    # Analytic inverse of k·√(r/r₀)
+    assert r_n == pytest.approx(sqrt_metric.r0 * (2 * np.pi * n / sqrt_metric.k) ** 2, rel=1e-9)
+
+
+def test_transition_radius_rejects_layer_zero(log_metric):
+    """Layers start at n = 1."""
+    with pytest.raises(ValueError):
+        log_metric.subspace_transition_radius(0)
+
+
+def test_metric_components_batch_matches_per_radius(log_metric):
+    """Each batch array equals metric_components() evaluated radius by radius."""
+    metric = log_metric
+    theta = np.pi / 3
+    r = np.array([0.1, 0.5, 1.0, 3.0, 10.0, 1e3]) * metric.r_s
+
+    batch = metric.metric_components_batch(r, theta)
+
+    for i, r_i in enumerate(r):
+        single = dataclasses.asdict(metric.metric_components(float(r_i), theta))
+        assert set(single) == set(batch)
+        for name, value in single.items():
+            assert batch[name][i] == pytest.approx(value, rel=1e-14), name
+
+    # Independent per-component methods
+    np.testing.assert_allclose(batch['g_tt'], metric.g_tt(r), rtol=1e-14)
+    np.testing.assert_allclose(batch['g_tr'], metric.g_tr(r), rtol=1e-14)
+
+
+def test_metric_components_batch_scalar_input(log_metric):
+    """A scalar radius gives 1-element arrays."""
+    batch = log_metric.metric_components_batch(2.0 * log_metric.r_s)
+
+    for name, values in batch.items():
+        assert isinstance(values, np.ndarray), name
+        assert values.shape == (1,), name
+
+
+def test_metric_components_scalar_only_profile():
+    """A math-based profile (scalar input only) still works for scalar r."""
+    metric = PhiSpiralSSZMetric(
+        mass=M_SUN, phi_G_profile=lambda r: 0.5 * math.log(1 + r / 3000.0)
+    )
+
+    comps = metric.metric_components(5000.0)
+
+    phi = 0.5 * math.log(1 + 5000.0 / 3000.0)
+    assert isinstance(comps.g_tt, float)
+    assert comps.phi_G == pytest.approx(phi, rel=1e-14)
+    assert comps.g_tt == pytest.approx(metric.g_tt(5000.0), rel=1e-14)
+    assert comps.tau_factor == pytest.approx(1 / math.cosh(phi), rel=1e-14)
+
+
+def test_metric_components_batch_constant_profile():
+    """A profile returning a plain float for array input is broadcast to r."""
+    metric = PhiSpiralSSZMetric(mass=M_SUN, phi_G_profile=lambda r: 0.7)
+    r = np.array([1.0, 2.0, 4.0]) * metric.r_s
+
+    batch = metric.metric_components_batch(r)
+
+    np.testing.assert_array_equal(batch['phi_G'], np.full(3, 0.7))
+    assert batch['g_tt'].shape == (3,)
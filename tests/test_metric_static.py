@@ -41,6 +41,20 @@ def test_A_positive_everywhere(solar_mass_metric):
     assert min(A_values) > 0.1, f"A_min = {min(A_values):.3f} too small"
 
 
+def test_A_accepts_arrays(solar_mass_metric):
+    """A(r) on an array matches point-wise evaluation (incl. r = 0)."""
+    metric = solar_mass_metric
+    r_test = np.array([0.0, 0.5, 1.0, 3.0, 10.0, 100.0]) * metric.r_s
+    
+    for method in ('saturation', 'phi_series'):
+        A_array = metric.A_coefficient(r_test, method=method)
+        A_scalar = [metric.A_coefficient(r, method=method) for r in r_test]
+        
+        assert A_array.shape == r_test.shape
+        assert np.allclose(A_array, A_scalar, rtol=1e-14, atol=0.0)
+        assert A_array[0] == 1.0, "A(0) must be exactly flat"
+
+
 def test_flatness_at_center(solar_mass_metric):
     """A(0) ≈ 1.0 - flat spacetime at center."""
     A_center = solar_mass_metric.A_coefficient(1e-10)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite for SSZ Segment Density
+
+Validates:
+- find_intersection(): Newton path agrees with Brent's method on D_SSZ - D_GR
+- Brent fallback when the range excludes the Newton start (1.5 r_s)
+- Cached repeat calls
+
+© 2025 Carmen Wrede & Lino Casu
+"""
+import pytest
+from scipy.optimize import brentq
+
+from ssz_core import D_SSZ, D_GR, find_intersection
+
+
+def _brent_reference(r_s, r_min, r_max):
+    """Root of D_SSZ - D_GR on [r_min, r_max] by Brent's method alone."""
+    return brentq(lambda r: D_SSZ(r, r_s) - D_GR(r, r_s), r_min, r_max, xtol=1e-14 * r_s)
+
+
+@pytest.mark.parametrize("r_s", [1.0, 8.87e-3, 2950.0, 1.2e10])
+def test_find_intersection_matches_brent(r_s):
+    """Newton (default range) finds the same root as Brent's method."""
+    r_star = find_intersection(r_s)
+
+    assert r_star == pytest.approx(_brent_reference(r_s, 1.1 * r_s, 100.0 * r_s), rel=1e-10)
+
+
+@pytest.mark.parametrize("r_s", [1.0, 2950.0, 1.2e10])
+def test_find_intersection_fallback(r_s):
+    """A range excluding the Newton start 1.5 r_s goes through Brent's method."""
+    r_min, r_max = 1.55 * r_s, 1.65 * r_s
+
+    r_star = find_intersection(r_s, r_min, r_max)
+
+    assert r_min <= r_star <= r_max
+    assert r_star == pytest.approx(_brent_reference(r_s, r_min, r_max), rel=1e-10)
+    assert r_star == pytest.approx(find_intersection(r_s), rel=1e-10)
+
+
+def test_find_intersection_cached():
+    """A repeat call with the same arguments is served from the cache."""
+    r_s = 4321.0
+    first = find_intersection(r_s)
+    hits = find_intersection.cache_info().hits
+
+    assert find_intersection(r_s) == first
+    assert find_intersection.cache_info().hits == hits + 1